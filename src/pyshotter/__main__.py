@@ -221,6 +221,12 @@ def setup_argument_parser() -> ArgumentParser:
             default='high',
             help="recording quality"
         )
+        record_group.add_argument(
+            "--record-scale",
+            type=float,
+            default=1.0,
+            help="recording resolution relative to the screen, e.g. 0.5 (0-1]"
+        )
     
     # Output options
     cli_args.add_argument(
@@ -252,12 +258,11 @@ def handle_ocr(screenshot_path: str, options: Namespace) -> dict:
     from pyshotter.features import OCRFeature
     from pyshotter.screenshot import ScreenShot
     
-    logger.info(f"Performing OCR on {screenshot_path}")
+    logger.info("Performing OCR on %s", screenshot_path)
     
     # Load screenshot
-    img = Image.open(screenshot_path)
-    img_bytes = img.tobytes()
-    screenshot = ScreenShot(rgb=img_bytes, size=img.size, pos=(0, 0))
+    with Image.open(screenshot_path) as img:
+        screenshot = ScreenShot.from_rgb(img.convert('RGB').tobytes(), img.size)
     
     # Extract text
     ocr = OCRFeature()
@@ -286,12 +291,11 @@ def handle_redaction(screenshot_path: str, options: Namespace) -> str:
     from pyshotter.ai_features import EnhancedRedactionFeature, FaceBlurFeature
     from pyshotter.screenshot import ScreenShot
     
-    logger.info(f"Redacting {screenshot_path}")
+    logger.info("Redacting %s", screenshot_path)
     
     # Load screenshot
-    img = Image.open(screenshot_path)
-    img_bytes = img.tobytes()
-    screenshot = ScreenShot(rgb=img_bytes, size=img.size, pos=(0, 0))
+    with Image.open(screenshot_path) as img:
+        screenshot = ScreenShot.from_rgb(img.convert('RGB').tobytes(), img.size)
     
     # Apply redaction
     redactor = EnhancedRedactionFeature(mode=options.redact_style)
@@ -334,12 +338,11 @@ def handle_beautify(screenshot_path: str, options: Namespace) -> str:
     from pyshotter.beautifier import CodeBeautifierFeature
     from pyshotter.screenshot import ScreenShot
     
-    logger.info(f"Beautifying {screenshot_path}")
+    logger.info("Beautifying %s", screenshot_path)
     
     # Load screenshot
-    img = Image.open(screenshot_path)
-    img_bytes = img.tobytes()
-    screenshot = ScreenShot(rgb=img_bytes, size=img.size, pos=(0, 0))
+    with Image.open(screenshot_path) as img:
+        screenshot = ScreenShot.from_rgb(img.convert('RGB').tobytes(), img.size)
     
     # Beautify
     beautifier = CodeBeautifierFeature(theme=options.beautify_theme)
@@ -373,12 +376,13 @@ def handle_recording(options: Namespace) -> str:
     """
     from pyshotter.recording import ScreenRecordingFeature
     
-    logger.info(f"Recording for {options.record} seconds")
+    logger.info("Recording for %s seconds", options.record)
     
     recorder = ScreenRecordingFeature(
         fps=options.record_fps,
         quality=options.record_quality,
-        format=options.record_format
+        format=options.record_format,
+        scale=options.record_scale,
     )
     
     # Progress callback
@@ -419,7 +423,7 @@ def main(*args: str) -> int:
     log_level = "DEBUG" if options.verbose else "INFO"
     setup_logging(log_level=log_level, console_output=not options.quiet)
     
-    logger.info(f"PyShotter v{__version__} starting")
+    logger.info("PyShotter v%s starting", __version__)
     
     try:
         # Handle recording mode
@@ -520,7 +524,7 @@ def main(*args: str) -> int:
         
     except ScreenShotError as e:
         if not options.quiet:
-            logger.error(f"Screenshot error: {e}")
+            logger.error("Screenshot error: %s", e)
             if hasattr(e, 'recovery_hint') and e.recovery_hint:
                 print(f"Recovery hint: {e.recovery_hint}")
         return 1
@@ -528,7 +532,7 @@ def main(*args: str) -> int:
         logger.info("Interrupted by user")
         return 130
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=options.verbose)
+        logger.error("Unexpected error: %s", e, exc_info=options.verbose)
         return 1
 
 
@@ -7,7 +7,9 @@ This module provides:
 """
 
 import re
-from typing import List, Dict, Optional, Literal, Tuple
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Literal, Tuple, Callable, Mapping
 
 try:
     import cv2
@@ -17,7 +19,7 @@ except ImportError:
     OPENCV_AVAILABLE = False
 
 try:
-    from PIL import Image, ImageFilter
+    from PIL import Image, ImageFilter  # noqa: F401
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -26,10 +28,13 @@ from .screenshot import ScreenShot
 from .exception import DependencyError
 from .logging_config import get_logger
 
+if TYPE_CHECKING:
+    from .features import OCRFeature
+
 logger = get_logger(__name__)
 
 # Privacy templates with PII patterns
-PRIVACY_TEMPLATES = {
+_PRIVACY_TEMPLATES: Dict[str, Dict[str, Any]] = {
     'medical': {
         'patterns': {
             'mrn': r'\b[A-Z]{2}\d{6,8}\b',
@@ -64,7 +69,7 @@ PRIVACY_TEMPLATES = {
     },
     'gdpr': {
         'patterns': {
-            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
             'phone': r'\b\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b',
             'ip': r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
         },
@@ -72,6 +77,112 @@ PRIVACY_TEMPLATES = {
     },
 }
 
+# Read-only view of the templates, shared by every redactor
+PRIVACY_TEMPLATES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    name: MappingProxyType({
+        'patterns': MappingProxyType(template['patterns']),
+        'description': template['description'],
+    })
+    for name, template in _PRIVACY_TEMPLATES.items()
+})
+del _PRIVACY_TEMPLATES
+
+# Patterns redacted when no template is used
+DEFAULT_PATTERNS = {
+    'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
+    'phone': r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    'credit_card': r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',
+    'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
+}
+
+# Compiled regexes, keyed by pattern string
+_COMPILED: Dict[str, 're.Pattern[str]'] = {}
+
+
+def _compile_pattern(pattern: str) -> 're.Pattern[str]':
+    """Compile a redaction regex once per process.
+    
+    Args:
+        pattern: Regex pattern string
+        
+    Returns:
+        Compiled pattern
+    """
+    compiled = _COMPILED.get(pattern)
+    if compiled is None:
+        compiled = _COMPILED[pattern] = re.compile(pattern)
+    return compiled
+
+
+_BACKREFERENCE = re.compile(r'\\[1-9]')
+
+# Pattern set matchers, keyed by the (name, pattern) pairs they match
+_MATCHERS: Dict[Tuple[Tuple[str, str], ...], Callable[[str], Optional[str]]] = {}
+
+
+def _compile_pattern_set(patterns: Mapping[str, str]) -> Callable[[str], Optional[str]]:
+    """Build a matcher scanning text once for any of several patterns.
+    
+    The patterns are joined into one alternation of named groups. Patterns
+    that can't be combined (backreferences, inline flags) are matched one
+    by one instead.
+    
+    Args:
+        patterns: Dict of pattern_name: regex_pattern
+        
+    Returns:
+        Function returning the name of a matching pattern, or None
+    """
+    key = tuple(patterns.items())
+    matcher = _MATCHERS.get(key)
+    if matcher is not None:
+        return matcher
+    
+    names = list(patterns)
+    try:
+        # Numbered backreferences would point at the wrong group once combined
+        if any(_BACKREFERENCE.search(pattern) for pattern in patterns.values()):
+            raise re.error("backreferences can't be combined")
+        combined = re.compile('|'.join(f'(?P<_p{i}>{pattern})' for i, pattern in enumerate(patterns.values())))
+    except re.error:
+        compiled = [(name, _compile_pattern(pattern)) for name, pattern in patterns.items()]
+        
+        def matcher(text: str) -> Optional[str]:
+            for name, pattern in compiled:
+                if pattern.search(text):
+                    return name
+            return None
+    else:
+        def matcher(text: str) -> Optional[str]:
+            match = combined.search(text)
+            if match is None:
+                return None
+            # Every alternative is a named group, so a match always has one
+            group = match.lastgroup
+            return names[int(group[2:])] if group else None
+    
+    _MATCHERS[key] = matcher
+    return matcher
+
+
+def _gaussian_blur(region: 'np.ndarray', ksize: int) -> 'np.ndarray':
+    """Blur an image region with a Gaussian-like kernel.
+    
+    Stack blur approximates the Gaussian at a cost independent of the kernel
+    size; OpenCV builds older than 4.7 fall back to a true Gaussian blur.
+    
+    Args:
+        region: Image region
+        ksize: Kernel size, made odd
+        
+    Returns:
+        Blurred copy of the region
+    """
+    ksize |= 1
+    if hasattr(cv2, 'stackBlur'):
+        return cv2.stackBlur(region, (ksize, ksize))
+    return cv2.GaussianBlur(region, (ksize, ksize), 0)
+
 
 class EnhancedRedactionFeature:
     """Enhanced redaction with multiple modes and templates."""
@@ -98,8 +209,9 @@ class EnhancedRedactionFeature:
         self.mode = mode
         self.custom_patterns: Dict[str, str] = {}
         self._face_blur = None
+        self._ocr: Optional[OCRFeature] = None
         
-        logger.info(f"Initialized redaction with mode={mode}")
+        logger.info("Initialized redaction with mode=%s", mode)
     
     def _get_face_blur(self) -> 'FaceBlurFeature':
         """Lazy load face blur feature."""
@@ -107,14 +219,27 @@ class EnhancedRedactionFeature:
             self._face_blur = FaceBlurFeature()
         return self._face_blur
 
+    def _get_ocr(self) -> 'OCRFeature':
+        """Lazy load OCR feature so its result cache is shared across calls."""
+        if self._ocr is None:
+            from .features import OCRFeature
+            self._ocr = OCRFeature()
+        return self._ocr
+
     def add_custom_patterns(self, patterns: Dict[str, str]) -> None:
         """Add custom regex patterns for redaction.
         
         Args:
             patterns: Dict of pattern_name: regex_pattern
+            
+        Raises:
+            re.error: If a pattern is not a valid regex
         """
+        # Compiled up front, so invalid patterns fail here rather than mid-redaction
+        for pattern in patterns.values():
+            _compile_pattern(pattern)
         self.custom_patterns.update(patterns)
-        logger.info(f"Added {len(patterns)} custom patterns")
+        logger.info("Added %s custom patterns", len(patterns))
     
     def bulk_redact(
         self,
@@ -134,7 +259,7 @@ class EnhancedRedactionFeature:
         """
         results = []
         for i, sct in enumerate(screenshots):
-            logger.debug(f"Bulk redacting screenshot {i+1}/{len(screenshots)}")
+            logger.debug("Bulk redacting screenshot %s/%s", i+1, len(screenshots))
             if template:
                 results.append(self.redact_with_template(sct, template))
             else:
@@ -189,15 +314,15 @@ class EnhancedRedactionFeature:
             raise ValueError(f"Unknown template: {template}")
         
         patterns = PRIVACY_TEMPLATES[template]['patterns']
-        logger.info(f"Redacting with template: {template}")
+        logger.info("Redacting with template: %s", template)
         
-        return self.redact_sensitive_data(screenshot, list(patterns.keys()), patterns)
+        return self.redact_sensitive_data(screenshot, list(patterns), patterns)
     
     def redact_sensitive_data(
         self,
         screenshot: ScreenShot,
         pattern_types: Optional[List[str]] = None,
-        custom_patterns: Optional[Dict[str, str]] = None,
+        custom_patterns: Optional[Mapping[str, str]] = None,
         blur_strength: float = 15.0,
     ) -> ScreenShot:
         """Redact sensitive data from screenshot.
@@ -213,36 +338,26 @@ class EnhancedRedactionFeature:
         """
         try:
             # Convert to PIL Image for OCR
-            from .features import OCRFeature
-            
-            img = Image.frombytes('RGB', screenshot.size, screenshot.rgb)
+            img = screenshot.as_pil()
             img_array = np.array(img)
             
             # Extract text boxes using OCR
             try:
-                ocr = OCRFeature()
-                text_boxes = ocr.extract_text_boxes(screenshot)
+                text_boxes = self._get_ocr().extract_text_boxes(screenshot)
             except Exception as e:
-                logger.warning(f"OCR failed, skipping text detection: {e}")
+                logger.warning("OCR failed, skipping text detection: %s", e)
                 text_boxes = []
             
             # Build pattern dict
             all_patterns = {}
             
             # Add default patterns
-            default_patterns = {
-                'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-                'phone': r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-                'credit_card': r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',
-                'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
-            }
-            
             if pattern_types:
                 for ptype in pattern_types:
-                    if ptype in default_patterns:
-                        all_patterns[ptype] = default_patterns[ptype]
+                    if ptype in DEFAULT_PATTERNS:
+                        all_patterns[ptype] = DEFAULT_PATTERNS[ptype]
             else:
-                all_patterns = default_patterns
+                all_patterns = dict(DEFAULT_PATTERNS)
             
             # Add custom patterns
             if custom_patterns:
@@ -250,37 +365,27 @@ class EnhancedRedactionFeature:
             if self.custom_patterns:
                 all_patterns.update(self.custom_patterns)
             
-            # Find and redact matches
-            redacted_count = 0
+            # One scan per text box for all patterns
+            match_pattern = _compile_pattern_set(all_patterns)
+            
+            # Find matches, then redact each region once, in order
+            bboxes: Dict[Tuple[int, int, int, int], None] = {}
             for box in text_boxes:
-                text = box['text']
-                bbox = box['bbox']
-                
-                for pattern_name, pattern in all_patterns.items():
-                    if re.search(pattern, text):
-                        logger.debug(f"Found {pattern_name} match, redacting")
-                        img_array = self._apply_redaction(
-                            img_array,
-                            bbox,
-                            blur_strength
-                        )
-                        redacted_count += 1
-                        break
-            
-            logger.info(f"Redacted {redacted_count} sensitive items")
+                pattern_name = match_pattern(box['text'])
+                if pattern_name is not None:
+                    logger.debug("Found %s match, redacting", pattern_name)
+                    bboxes[tuple(box['bbox'])] = None
             
-            # Convert back to screenshot
-            redacted_img = Image.fromarray(img_array)
-            redacted_bytes = redacted_img.tobytes()
+            for bbox in bboxes:
+                img_array = self._apply_redaction(img_array, bbox, blur_strength)
             
-            return ScreenShot(
-                rgb=redacted_bytes,
-                size=screenshot.size,
-                pos=screenshot.pos
-            )
+            logger.info("Redacted %s sensitive items", len(bboxes))
+            
+            # Convert back to screenshot
+            return ScreenShot.from_rgb(img_array, screenshot.size, screenshot.pos)
             
         except Exception as e:
-            logger.error(f"Redaction failed: {e}")
+            logger.error("Redaction failed: %s", e)
             return screenshot  # Return original on error
     
     def _apply_redaction(
@@ -305,37 +410,46 @@ class EnhancedRedactionFeature:
         if x2 <= x1 or y2 <= y1:
             return img_array
         
+        # A view: fills below write straight into the image
         region = img_array[y1:y2, x1:x2]
         
         if self.mode == 'blur':
             # Gaussian blur
-            ksize = int(strength) | 1  # Ensure odd
-            region = cv2.GaussianBlur(region, (ksize, ksize), 0)
+            img_array[y1:y2, x1:x2] = _gaussian_blur(region, int(strength))
         
         elif self.mode == 'pixelate':
             # Pixelation
             h, w = region.shape[:2]
             pixel_size = max(8, int(strength))
             temp = cv2.resize(region, (max(1, w // pixel_size), max(1, h // pixel_size)), interpolation=cv2.INTER_LINEAR)
-            region = cv2.resize(temp, (w, h), interpolation=cv2.INTER_NEAREST)
+            img_array[y1:y2, x1:x2] = cv2.resize(temp, (w, h), interpolation=cv2.INTER_NEAREST)
         
         elif self.mode == 'block':
             # Solid block
             region[:] = (0, 0, 0)
         
         elif self.mode == 'generate':
-            # Simple block pattern (more advanced generation would require AI)
+            # Simple stripe pattern (more advanced generation would require AI):
+            # two light rows out of every four
             region[:] = (50, 50, 50)
-            for i in range(0, region.shape[0], 4):
-                region[i:i+2, :] = (70, 70, 70)
+            region[0::4] = (70, 70, 70)
+            region[1::4] = (70, 70, 70)
         
-        img_array[y1:y2, x1:x2] = region
         return img_array
 
 
 class FaceBlurFeature:
     """Face detection and blurring for privacy."""
     
+    # The DNN model is loaded once per process and shared by all instances;
+    # the lock serializes its setInput()/forward() pairs
+    _dnn_net = None
+    _dnn_lock = threading.Lock()
+    
+    # Likewise for the Haar cascade, whose XML is parsed once
+    _face_cascade = None
+    _haar_lock = threading.Lock()
+    
     def __init__(
         self,
         detection_method: Literal['haar', 'dnn'] = 'haar',
@@ -381,8 +495,11 @@ class FaceBlurFeature:
     
     def _load_haar_detector(self):
         """Load Haar cascade detector."""
-        cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        self.face_cascade = cv2.CascadeClassifier(cascade_path)
+        with FaceBlurFeature._haar_lock:
+            if FaceBlurFeature._face_cascade is None:
+                cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+                FaceBlurFeature._face_cascade = cv2.CascadeClassifier(cascade_path)
+        self.face_cascade = FaceBlurFeature._face_cascade
     
     def _load_dnn_detector(self) -> bool:
         """Load DNN face detector.
@@ -390,6 +507,10 @@ class FaceBlurFeature:
         Returns:
             True if successfully loaded, False otherwise
         """
+        if FaceBlurFeature._dnn_net is not None:
+            self.dnn_net = FaceBlurFeature._dnn_net
+            return True
+        
         try:
             # Try to load pre-trained DNN model
             # Using OpenCV's DNN module with Caffe model
@@ -414,11 +535,11 @@ class FaceBlurFeature:
                 urllib.request.urlretrieve(model_url, model_path)
             
             # Load the model
-            self.dnn_net = cv2.dnn.readNetFromCaffe(str(prototxt_path), str(model_path))
+            self.dnn_net = FaceBlurFeature._dnn_net = cv2.dnn.readNetFromCaffe(str(prototxt_path), str(model_path))
             return True
             
         except Exception as e:
-            logger.warning(f"Failed to load DNN model: {e}")
+            logger.warning("Failed to load DNN model: %s", e)
             return False
     
     def detect_faces(self, screenshot: ScreenShot) -> List[Dict]:
@@ -436,13 +557,15 @@ class FaceBlurFeature:
             img_array = img_array.reshape(screenshot.height, screenshot.width, 3)
             
             if self.detection_method == 'dnn' and self.dnn_net is not None:
-                # DNN detection
+                # DNN detection; the model was trained on BGR images
                 blob = cv2.dnn.blobFromImage(
                     img_array, 1.0, (300, 300),
-                    (104.0, 177.0, 123.0)
+                    (104.0, 177.0, 123.0),
+                    swapRB=True,
                 )
-                self.dnn_net.setInput(blob)
-                detections = self.dnn_net.forward()
+                with self._dnn_lock:
+                    self.dnn_net.setInput(blob)
+                    detections = self.dnn_net.forward()
                 
                 results = []
                 h, w = img_array.shape[:2]
@@ -451,28 +574,30 @@ class FaceBlurFeature:
                     confidence = detections[0, 0, i, 2]
                     
                     if confidence > 0.5:  # Confidence threshold
-                        box = detections[0, 0, i, 3:7] * np.array([w, h, w, h])
+                        # Boxes can extend past the image edges
+                        box = np.clip(detections[0, 0, i, 3:7], 0.0, 1.0) * np.array([w, h, w, h])
                         (x, y, x2, y2) = box.astype("int")
                         
                         # Convert to x, y, w, h format
                         results.append({
-                            'bbox': (x, y, x2 - x, y2 - y),
+                            'bbox': (int(x), int(y), int(x2 - x), int(y2 - y)),
                             'confidence': float(confidence)
                         })
                 
-                logger.info(f"DNN detected {len(results)} faces")
+                logger.info("DNN detected %s faces", len(results))
                 return results
             
             else:
                 # Haar cascade detection
                 gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
                 
-                faces = self.face_cascade.detectMultiScale(
-                    gray,
-                    scaleFactor=1.1,
-                    minNeighbors=5,
-                    minSize=(30, 30)
-                )
+                with self._haar_lock:
+                    faces = self.face_cascade.detectMultiScale(
+                        gray,
+                        scaleFactor=1.1,
+                        minNeighbors=5,
+                        minSize=(30, 30)
+                    )
                 
                 results = []
                 for (x, y, w, h) in faces:
@@ -481,11 +606,11 @@ class FaceBlurFeature:
                         'confidence': 0.9  # Haar doesn't provide confidence
                     })
                 
-                logger.info(f"Haar detected {len(results)} faces")
+                logger.info("Haar detected %s faces", len(results))
                 return results
             
         except Exception as e:
-            logger.error(f"Face detection failed: {e}")
+            logger.error("Face detection failed: %s", e)
             return []
     
     def blur_faces(
@@ -527,33 +652,23 @@ class FaceBlurFeature:
                 x2 = min(img_array.shape[1], x + w + expand_w)
                 y2 = min(img_array.shape[0], y + h + expand_h)
                 
-                # Extract and blur region
-                face_region = img_array[y1:y2, x1:x2]
-                ksize = int(self.blur_strength) | 1  # Ensure odd
-                blurred = cv2.GaussianBlur(face_region, (ksize, ksize), 0)
-                
-                # Put back
-                img_array[y1:y2, x1:x2] = blurred
+                # Blur the region in place
+                img_array[y1:y2, x1:x2] = _gaussian_blur(img_array[y1:y2, x1:x2], int(self.blur_strength))
             
-            logger.info(f"Blurred {len(faces)} faces")
+            logger.info("Blurred %s faces", len(faces))
             
             # Convert back to screenshot
-            blurred_bytes = img_array.tobytes()
-            return ScreenShot(
-                rgb=blurred_bytes,
-                size=screenshot.size,
-                pos=screenshot.pos
-            )
+            return ScreenShot.from_rgb(img_array, screenshot.size, screenshot.pos)
             
         except Exception as e:
-            logger.error(f"Face blurring failed: {e}")
+            logger.error("Face blurring failed: %s", e)
             return screenshot
 
 
-def get_privacy_templates() -> Dict[str, Dict]:
+def get_privacy_templates() -> Dict[str, Mapping[str, Any]]:
     """Get available privacy templates.
     
     Returns:
-        Dict of template_name: template_info
+        Dict of template_name: read-only template_info
     """
-    return PRIVACY_TEMPLATES.copy()
+    return dict(PRIVACY_TEMPLATES)
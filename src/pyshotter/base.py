@@ -10,9 +10,10 @@ from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 from mss.exception import ScreenShotError
-from mss.screenshot import ScreenShot
 from mss.tools import to_png
 
+from pyshotter.screenshot import ScreenShot
+
 if TYPE_CHECKING:  # pragma: nocover
     from collections.abc import Callable, Iterator
 
@@ -10,7 +10,8 @@ This module provides professional code screenshot beautification with:
 """
 
 import platform
-from typing import Optional, Literal
+from functools import lru_cache
+from typing import Optional, Literal, Tuple
 
 try:
     import cv2
@@ -95,6 +96,64 @@ THEMES = {
 }
 
 
+@lru_cache(maxsize=32)
+def _make_gradient(
+    width: int,
+    height: int,
+    start_color: Tuple[int, int, int],
+    end_color: Tuple[int, int, int],
+) -> 'Image.Image':
+    """Render a vertical gradient, cached per size and colors.
+    
+    The cached image is shared: copy it before drawing on it.
+    
+    Args:
+        width: Gradient width
+        height: Gradient height
+        start_color: RGB color of the top row
+        end_color: RGB color the bottom row tends to
+        
+    Returns:
+        PIL Image with gradient
+    """
+    ratio = (np.arange(height, dtype=np.float64) / height)[:, None]
+    rows = (np.array(start_color) * (1 - ratio) + np.array(end_color) * ratio).astype(np.uint8)
+    pixels = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+    return Image.fromarray(pixels, 'RGB')
+
+
+@lru_cache(maxsize=8)
+def _make_shadow_mask(
+    size: Tuple[int, int],
+    rect: Tuple[int, int, int, int],
+    radius: int,
+    alpha: int,
+    blur: int,
+) -> 'Image.Image':
+    """Render a blurred rounded-rectangle shadow mask, cached.
+    
+    Three box blur passes approximate a Gaussian blur of radius `blur`.
+    
+    Args:
+        size: Mask size
+        rect: Shadow rectangle (x1, y1, x2, y2)
+        radius: Corner radius
+        alpha: Shadow opacity (0-255)
+        blur: Blur radius
+        
+    Returns:
+        Grayscale ('L') PIL Image
+    """
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle(rect, radius=radius, fill=alpha)
+    
+    pixels = np.asarray(mask)
+    ksize = (2 * blur + 1, 2 * blur + 1)
+    for _ in range(3):
+        pixels = cv2.blur(pixels, ksize)
+    return Image.fromarray(pixels, 'L')
+
+
 class CodeBeautifierFeature:
     """Professional code screenshot beautification."""
     
@@ -141,7 +200,10 @@ class CodeBeautifierFeature:
         else:
             self.window_style = window_style
         
-        logger.info(f"Initialized beautifier with theme={theme}, window_style={self.window_style}")
+        # Rendered frames, keyed by screenshot size and beautify() options
+        self._cached_frame = lru_cache(maxsize=4)(self._render_frame)
+        
+        logger.info("Initialized beautifier with theme=%s, window_style=%s", theme, self.window_style)
     
     def beautify(
         self,
@@ -171,89 +233,118 @@ class CodeBeautifierFeature:
             BeautifierError: If beautification fails
         """
         try:
-            logger.debug(f"Beautifying screenshot with padding={padding}, shadow={shadow_intensity}")
+            logger.debug("Beautifying screenshot with padding=%s, shadow=%s", padding, shadow_intensity)
             
             # Convert screenshot to PIL Image
-            orig_img = Image.frombytes('RGB', screenshot.size, screenshot.rgb)
+            orig_img = screenshot.as_pil()
             orig_width, orig_height = orig_img.size
             
-            # Calculate window controls height
+            # Everything around the screenshot depends only on its size and the
+            # style, so it is rendered once and reused; image backgrounds are
+            # caller-provided and always rendered afresh
             controls_height = 28 if self.window_style != 'none' else 0
-            
-            # Calculate new dimensions
-            new_width = orig_width + (padding * 2)
-            new_height = orig_height + (padding * 2) + controls_height
-            
-            # Create background
-            if background_type == 'gradient':
-                background = self._create_gradient_background(new_width, new_height)
-            elif background_type == 'solid':
-                background = Image.new('RGB', (new_width, new_height), self.theme_colors['bg_start'])
-            elif background_type == 'image' and background_image:
-                # Resize and crop background image to fit
-                background = background_image.copy()
-                bg_ratio = background.width / background.height
-                target_ratio = new_width / new_height
-                
-                if bg_ratio > target_ratio:
-                    # Image is wider than needed
-                    crop_width = int(background.height * target_ratio)
-                    offset = (background.width - crop_width) // 2
-                    background = background.crop((offset, 0, offset + crop_width, background.height))
-                else:
-                    # Image is taller than needed
-                    crop_height = int(background.width / target_ratio)
-                    offset = (background.height - crop_height) // 2
-                    background = background.crop((0, offset, background.width, offset + crop_height))
-                
-                background = background.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                if background.mode != 'RGB':
-                    background = background.convert('RGB')
-            else:  # transparent or fallback
-                background = Image.new('RGBA', (new_width, new_height), (0, 0, 0, 0))
-            
-            # Create window with shadow
-            window = self._create_window_with_shadow(
-                orig_width,
-                orig_height + controls_height,
-                corner_radius,
-                shadow_intensity
-            )
-            
-            # Paste window onto background
-            window_x = padding
-            window_y = padding
-            if window.mode == 'RGBA':
-                background.paste(window, (window_x, window_y), window)
+            args = (orig_width, orig_height, padding, shadow_intensity, corner_radius, background_type)
+            if background_type == 'image' and background_image:
+                background = self._render_frame(*args, background_image)
             else:
-                background.paste(window, (window_x, window_y))
-            
-            # Add window controls
-            if self.window_style != 'none':
-                self._draw_window_controls(background, window_x, window_y)
+                background = self._cached_frame(*args).copy()
             
             # Paste original screenshot
-            screenshot_y = window_y + controls_height
-            background.paste(orig_img, (window_x, screenshot_y))
+            background.paste(orig_img, (padding, padding + controls_height))
             
-            # Convert back to screenshot format
-            if background.mode == 'RGBA':
-                background = background.convert('RGB')
+            logger.info("Successfully beautified screenshot: %s -> %s", screenshot.size, background.size)
             
-            beautified_bytes = background.tobytes()
-            
-            logger.info(f"Successfully beautified screenshot: {screenshot.size} -> {background.size}")
-            
-            return ScreenShot(
-                rgb=beautified_bytes,
-                size=background.size,
-                pos=(0, 0)
-            )
+            return ScreenShot.from_rgb(background.tobytes(), background.size)
             
         except Exception as e:
-            logger.error(f"Beautification failed: {e}")
+            logger.error("Beautification failed: %s", e)
             raise BeautifierError(f"Failed to beautify screenshot: {e}", theme=self.theme)
     
+    def _render_frame(
+        self,
+        orig_width: int,
+        orig_height: int,
+        padding: int,
+        shadow_intensity: float,
+        corner_radius: int,
+        background_type: str,
+        background_image: Optional[Image.Image] = None,
+    ) -> Image.Image:
+        """Render the background, window and its controls, without the screenshot.
+        
+        Args:
+            orig_width: Screenshot width
+            orig_height: Screenshot height
+            padding: Padding around screenshot (pixels)
+            shadow_intensity: Drop shadow intensity (0.0-1.0)
+            corner_radius: Corner radius for rounded corners
+            background_type: Background style
+            background_image: Optional image to use as background if background_type is 'image'
+            
+        Returns:
+            RGB image the screenshot is pasted onto
+        """
+        # Calculate window controls height
+        controls_height = 28 if self.window_style != 'none' else 0
+        
+        # Calculate new dimensions
+        new_width = orig_width + (padding * 2)
+        new_height = orig_height + (padding * 2) + controls_height
+        
+        # Create background
+        if background_type == 'gradient':
+            background = self._create_gradient_background(new_width, new_height)
+        elif background_type == 'solid':
+            background = Image.new('RGB', (new_width, new_height), self.theme_colors['bg_start'])
+        elif background_type == 'image' and background_image:
+            # Resize and crop background image to fit
+            background = background_image.copy()
+            bg_ratio = background.width / background.height
+            target_ratio = new_width / new_height
+        
+            if bg_ratio > target_ratio:
+                # Image is wider than needed
+                crop_width = int(background.height * target_ratio)
+                offset = (background.width - crop_width) // 2
+                background = background.crop((offset, 0, offset + crop_width, background.height))
+            else:
+                # Image is taller than needed
+                crop_height = int(background.width / target_ratio)
+                offset = (background.height - crop_height) // 2
+                background = background.crop((0, offset, background.width, offset + crop_height))
+        
+            background = background.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            if background.mode != 'RGB':
+                background = background.convert('RGB')
+        else:  # transparent or fallback
+            background = Image.new('RGBA', (new_width, new_height), (0, 0, 0, 0))
+        
+        # Create window with shadow
+        window = self._create_window_with_shadow(
+            orig_width,
+            orig_height + controls_height,
+            corner_radius,
+            shadow_intensity
+        )
+        
+        # Paste window onto background
+        window_x = padding
+        window_y = padding
+        if window.mode == 'RGBA':
+            background.paste(window, (window_x, window_y), window)
+        else:
+            background.paste(window, (window_x, window_y))
+        
+        # Add window controls
+        if self.window_style != 'none':
+            self._draw_window_controls(background, window_x, window_y)
+        
+        # Convert back to RGB, flattening a transparent background
+        if background.mode == 'RGBA':
+            background = background.convert('RGB')
+        
+        return background
+    
     def _create_gradient_background(self, width: int, height: int) -> Image.Image:
         """Create gradient background.
         
@@ -264,21 +355,8 @@ class CodeBeautifierFeature:
         Returns:
             PIL Image with gradient
         """
-        bg = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(bg)
-        
-        start_color = self.theme_colors['bg_start']
-        end_color = self.theme_colors['bg_end']
-        
-        # Vertical gradient
-        for y in range(height):
-            ratio = y / height
-            r = int(start_color[0] * (1 - ratio) + end_color[0] * ratio)
-            g = int(start_color[1] * (1 - ratio) + end_color[1] * ratio)
-            b = int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
-        
-        return bg
+        # Vertical gradient, copied since the caller draws on it
+        return _make_gradient(width, height, self.theme_colors['bg_start'], self.theme_colors['bg_end']).copy()
     
     def _create_window_with_shadow(
         self,
@@ -306,27 +384,27 @@ class CodeBeautifierFeature:
         canvas_width = width + shadow_offset * 2 + shadow_blur * 2
         canvas_height = height + shadow_offset * 2 + shadow_blur * 2
         
-        # Create shadow layer
-        shadow = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
-        shadow_draw = ImageDraw.Draw(shadow)
+        # Create shadow layer: a solid color, shaped by its alpha channel
+        shadow_color = self.theme_colors['shadow']
+        shadow = Image.new('RGBA', (canvas_width, canvas_height), (*shadow_color, 0))
         
-        # Draw shadow rectangle
+        # Shadow rectangle
         shadow_x1 = shadow_blur + shadow_offset
         shadow_y1 = shadow_blur + shadow_offset
         shadow_x2 = shadow_x1 + width
         shadow_y2 = shadow_y1 + height
         
-        shadow_color = self.theme_colors['shadow']
         shadow_alpha = int(255 * shadow_intensity * 0.3)
         
-        shadow_draw.rounded_rectangle(
-            [shadow_x1, shadow_y1, shadow_x2, shadow_y2],
-            radius=radius,
-            fill=(*shadow_color, shadow_alpha)
-        )
-        
-        # Apply Gaussian blur to shadow
-        shadow = shadow.filter(Image.GaussianBlur(shadow_blur))
+        # Only the alpha channel needs blurring; no shadow at all skips it
+        if shadow_alpha:
+            shadow.putalpha(_make_shadow_mask(
+                (canvas_width, canvas_height),
+                (shadow_x1, shadow_y1, shadow_x2, shadow_y2),
+                radius,
+                shadow_alpha,
+                shadow_blur,
+            ))
         
         # Create window
         window = Image.new('RGB', (width, height), self.theme_colors['window_bg'])
@@ -7,6 +7,7 @@ from typing import Any
 
 from pyshotter.base import MSSBase
 from pyshotter.exception import ScreenShotError
+from pyshotter.screenshot import ScreenShot
 
 
 def pyshotter(**kwargs: Any) -> MSSBase:
@@ -17,24 +18,27 @@ def pyshotter(**kwargs: Any) -> MSSBase:
     screenshots.
 
     It then proxies its arguments to the class for
-    instantiation.
+    instantiation. Grabs return PyShotter's ScreenShot.
     """
     os_ = platform.system().lower()
+    sct: MSSBase
 
     if os_ == "darwin":
         from pyshotter import darwin
 
-        return darwin.MSS(**kwargs)
-
-    if os_ == "linux":
+        sct = darwin.MSS(**kwargs)
+    elif os_ == "linux":
         from pyshotter import linux
 
-        return linux.MSS(**kwargs)
-
-    if os_ == "windows":
+        sct = linux.MSS(**kwargs)
+    elif os_ == "windows":
         from pyshotter import windows
 
-        return windows.MSS(**kwargs)
+        sct = windows.MSS(**kwargs)
+    else:
+        msg = f"System {os_!r} not (yet?) implemented."
+        raise ScreenShotError(msg)
 
-    msg = f"System {os_!r} not (yet?) implemented."
-    raise ScreenShotError(msg)
+    # The backends derive from mss's MSSBase, which defaults to mss's ScreenShot
+    sct.cls_image = ScreenShot
+    return sct
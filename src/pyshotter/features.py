@@ -11,12 +11,21 @@ This module provides advanced screenshot features including:
 - Sharing capabilities
 """
 
+import io
+import os
 import re
-import time
 import json
+import hashlib
+import tempfile
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 try:
     import cv2
@@ -32,6 +41,69 @@ except ImportError:
     TESSERACT_AVAILABLE = False
 
 from .screenshot import ScreenShot
+from .tools import to_png
+
+# Patterns for sensitive data
+SENSITIVE_DATA_PATTERNS = {
+    'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
+    'phone': r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    'credit_card': r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',
+    'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
+}
+
+# All patterns unioned into named groups, so OCR tokens are scanned in a single pass
+_SENSITIVE_DATA_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SENSITIVE_DATA_PATTERNS.items())
+)
+
+# Worker threads for PNG encoding, created on first use
+_ENCODE_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _get_encode_pool() -> ThreadPoolExecutor:
+    """Get the shared PNG encoding thread pool.
+    
+    zlib releases the GIL while compressing, so encodes overlap with
+    capture work on the calling thread.
+    """
+    global _ENCODE_POOL
+    if _ENCODE_POOL is None:
+        _ENCODE_POOL = ThreadPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 2) // 2),
+            thread_name_prefix='pyshotter-encode',
+        )
+    return _ENCODE_POOL
+
+
+def _encode_png(screenshot: ScreenShot, level: int = 6) -> bytes:
+    """Encode a screenshot to PNG bytes.
+    
+    Level 1 is for interactive copies: the built-in zlib encoder builds no
+    Pillow image and skips adaptive row filtering, which dominates Pillow's
+    encode time. Higher levels favor size, and go through Pillow when it is
+    installed: filtered rows compress far better.
+    
+    Args:
+        screenshot: Screenshot to encode
+        level: zlib compression level (1 is fastest)
+        
+    Returns:
+        PNG data
+    """
+    if level > 1:
+        try:
+            image = screenshot.as_pil()
+        except ImportError:
+            pass
+        else:
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG', compress_level=level)
+            return buffer.getvalue()
+    
+    data = to_png(screenshot.rgb, screenshot.size, level=level)
+    if data is None:  # to_png() only returns None when writing to a file
+        raise ValueError("PNG encoder returned no data")
+    return data
 
 
 class AnnotationFeature:
@@ -55,18 +127,13 @@ class AnnotationFeature:
         Returns:
             Annotated screenshot
         """
-        img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
+        img_array = np.array(screenshot.rgb_array)
         
         # Add text using OpenCV
         cv2.putText(img_array, text, position, cv2.FONT_HERSHEY_SIMPLEX, 
                    font_size/30, color, 2)
         
-        annotated_rgb = img_array.tobytes()
-        return ScreenShot(
-            rgb=annotated_rgb,
-            size=screenshot.size,
-            pos=screenshot.pos
-        )
+        return ScreenShot.from_rgb(img_array, screenshot.size, screenshot.pos)
     
     def add_rectangle(self, screenshot: ScreenShot, top_left: Tuple[int, int], 
                      bottom_right: Tuple[int, int], color: Tuple[int, int, int] = (255, 0, 0),
@@ -83,16 +150,11 @@ class AnnotationFeature:
         Returns:
             Annotated screenshot
         """
-        img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
+        img_array = np.array(screenshot.rgb_array)
         
         cv2.rectangle(img_array, top_left, bottom_right, color, thickness)
         
-        annotated_rgb = img_array.tobytes()
-        return ScreenShot(
-            rgb=annotated_rgb,
-            size=screenshot.size,
-            pos=screenshot.pos
-        )
+        return ScreenShot.from_rgb(img_array, screenshot.size, screenshot.pos)
     
     def add_arrow(self, screenshot: ScreenShot, start: Tuple[int, int], end: Tuple[int, int],
                   color: Tuple[int, int, int] = (255, 0, 0), thickness: int = 2) -> ScreenShot:
@@ -108,16 +170,11 @@ class AnnotationFeature:
         Returns:
             Annotated screenshot
         """
-        img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
+        img_array = np.array(screenshot.rgb_array)
         
         cv2.arrowedLine(img_array, start, end, color, thickness)
         
-        annotated_rgb = img_array.tobytes()
-        return ScreenShot(
-            rgb=annotated_rgb,
-            size=screenshot.size,
-            pos=screenshot.pos
-        )
+        return ScreenShot.from_rgb(img_array, screenshot.size, screenshot.pos)
     
     def add_circle(self, screenshot: ScreenShot, center: Tuple[int, int], radius: int,
                    color: Tuple[int, int, int] = (255, 0, 0), thickness: int = 2) -> ScreenShot:
@@ -133,16 +190,11 @@ class AnnotationFeature:
         Returns:
             Annotated screenshot
         """
-        img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
+        img_array = np.array(screenshot.rgb_array)
         
         cv2.circle(img_array, center, radius, color, thickness)
         
-        annotated_rgb = img_array.tobytes()
-        return ScreenShot(
-            rgb=annotated_rgb,
-            size=screenshot.size,
-            pos=screenshot.pos
-        )
+        return ScreenShot.from_rgb(img_array, screenshot.size, screenshot.pos)
     
     def add_highlight(self, screenshot: ScreenShot, region: Tuple[int, int, int, int],
                       color: Tuple[int, int, int] = (255, 255, 0), alpha: float = 0.3) -> ScreenShot:
@@ -157,29 +209,26 @@ class AnnotationFeature:
         Returns:
             Annotated screenshot
         """
-        img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
+        img_array = np.frombuffer(screenshot.rgb, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 3).copy()
         x, y, w, h = region
         
-        # Create overlay
-        overlay = img_array.copy()
-        cv2.rectangle(overlay, (x, y), (x + w, y + h), color, -1)
+        # Blend only the region in place (the filled rectangle is inclusive of its corners)
+        roi = img_array[max(y, 0):max(y + h + 1, 0), max(x, 0):max(x + w + 1, 0)]
+        if roi.size:
+            overlay = np.empty_like(roi)
+            overlay[:] = color
+            cv2.addWeighted(overlay, alpha, roi, 1 - alpha, 0, dst=roi)
         
-        # Blend with original
-        cv2.addWeighted(overlay, alpha, img_array, 1 - alpha, 0, img_array)
-        
-        annotated_rgb = img_array.tobytes()
-        return ScreenShot(
-            rgb=annotated_rgb,
-            size=screenshot.size,
-            pos=screenshot.pos
-        )
+        return ScreenShot.from_rgb(img_array, screenshot.size, screenshot.pos)
 
 
 class SharingFeature:
     """Smart sharing capabilities for screenshots."""
     
-    def __init__(self):
+    def __init__(self, cache_dir: str = "~/.pyshotter/share"):
         self.clipboard_available = self._check_clipboard()
+        # Content-addressed store for local links, created on first use
+        self.cache_dir = Path(cache_dir).expanduser()
     
     def _check_clipboard(self) -> bool:
         """Check if clipboard functionality is available."""
@@ -189,62 +238,65 @@ class SharingFeature:
         except ImportError:
             return False
     
-    def copy_to_clipboard(self, screenshot: ScreenShot) -> bool:
+    def copy_to_clipboard(self, screenshot: ScreenShot, async_: bool = False) -> Union[bool, 'Future[bool]']:
         """Copy screenshot to clipboard.
         
         Args:
             screenshot: Screenshot to copy
+            async_: Encode and copy on a background thread, returning a Future
             
         Returns:
             True if successful, False otherwise
         """
+        if async_:
+            return _get_encode_pool().submit(self._copy_to_clipboard, screenshot)
+        return self._copy_to_clipboard(screenshot)
+    
+    def _copy_to_clipboard(self, screenshot: ScreenShot) -> bool:
+        """Copy screenshot to clipboard on the calling thread."""
         if not self.clipboard_available:
             return False
         
         try:
             import pyperclip
-            from PIL import Image
-            import io
-            
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
             
-            # Save to bytes
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
+            # Interactive copy: favor encode speed over size
+            png_data = _encode_png(screenshot, level=1)
             
             # Copy to clipboard
-            pyperclip.copy(img_bytes.getvalue())
+            pyperclip.copy(png_data)
             return True
         except Exception:
             return False
     
-    def generate_shareable_link(self, screenshot: ScreenShot, service: str = "imgur") -> Optional[str]:
+    def generate_shareable_link(self, screenshot: ScreenShot, service: str = "imgur",
+                                async_: bool = False) -> Union[Optional[str], 'Future[Optional[str]]']:
         """Generate a shareable link for the screenshot.
         
         Args:
             screenshot: Screenshot to share
-            service: Sharing service ('imgur', 'pastebin', etc.)
+            service: Sharing service ('imgur', 'pastebin', etc.), or 'local'/'file'
+                for a file:// URL to a PNG in the local cache
+            async_: Encode on a background thread, returning a Future
             
         Returns:
             Shareable URL or None if failed
         """
+        if async_:
+            return _get_encode_pool().submit(self._generate_shareable_link, screenshot, service)
+        return self._generate_shareable_link(screenshot, service)
+    
+    def _generate_shareable_link(self, screenshot: ScreenShot, service: str) -> Optional[str]:
+        """Generate a shareable link on the calling thread."""
         try:
-            from PIL import Image
-            import io
-            import base64
-            
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+            if service in ('local', 'file'):
+                # Local previews: no base64 data URL, just point at the file
+                return self._store_local(screenshot).as_uri()
             
-            # Save to bytes
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
+            import base64
             
             # Encode to base64
-            img_base64 = base64.b64encode(img_bytes.getvalue()).decode()
+            img_base64 = base64.b64encode(_encode_png(screenshot)).decode()
             
             if service == "imgur":
                 # For demo purposes, return a data URL
@@ -255,23 +307,53 @@ class SharingFeature:
         except Exception:
             return None
     
+    def _store_local(self, screenshot: ScreenShot) -> Path:
+        """Write a screenshot to the local content-addressed store.
+        
+        Identical screenshots map to the same file, which is only encoded once.
+        
+        Args:
+            screenshot: Screenshot to store
+            
+        Returns:
+            Absolute path of the PNG file
+        """
+        digest = hashlib.blake2b(screenshot.rgb, digest_size=16).hexdigest()
+        path = self.cache_dir / f"{digest}.png"
+        if not path.exists():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent callers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            to_png(screenshot.rgb, screenshot.size, level=1, output=tmp_path)
+            os.replace(tmp_path, path)
+        return path.resolve()
+    
     def save_with_metadata(self, screenshot: ScreenShot, filename: str, 
-                          metadata: Dict[str, Any] = None) -> bool:
+                          metadata: Optional[Dict[str, Any]] = None,
+                          async_: bool = False) -> Union[bool, 'Future[bool]']:
         """Save screenshot with embedded metadata.
         
         Args:
             screenshot: Screenshot to save
             filename: Output filename
             metadata: Metadata to embed
+            async_: Encode and write on a background thread, returning a Future
             
         Returns:
             True if successful, False otherwise
         """
+        if async_:
+            return _get_encode_pool().submit(self._save_with_metadata, screenshot, filename, metadata)
+        return self._save_with_metadata(screenshot, filename, metadata)
+    
+    def _save_with_metadata(self, screenshot: ScreenShot, filename: str,
+                            metadata: Optional[Dict[str, Any]]) -> bool:
+        """Save screenshot with embedded metadata on the calling thread."""
         try:
-            from PIL import Image, PngInfo
+            from PIL.PngImagePlugin import PngInfo
             
             # Convert to PIL Image
-            img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+            img = screenshot.as_pil()
             
             # Add metadata
             if metadata:
@@ -294,6 +376,19 @@ class SmartDetectionFeature:
         if not OPENCV_AVAILABLE:
             raise ImportError("opencv-python is required for smart detection. Install with: pip install opencv-python")
     
+    @staticmethod
+    def _to_gray(screenshot: ScreenShot) -> 'np.ndarray':
+        """Convert a screenshot to grayscale straight from its RGB bytes.
+        
+        Args:
+            screenshot: Screenshot to convert
+            
+        Returns:
+            Grayscale image array
+        """
+        img_view = np.frombuffer(screenshot.rgb, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 3)
+        return cv2.cvtColor(img_view, cv2.COLOR_RGB2GRAY)
+    
     def detect_code_regions(self, screenshot: ScreenShot) -> List[Dict[str, Any]]:
         """Detect code-like regions in screenshots.
         
@@ -303,16 +398,15 @@ class SmartDetectionFeature:
         Returns:
             List of detected code regions with bounding boxes
         """
-        img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
-        
         # Convert to grayscale
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        gray = self._to_gray(screenshot)
         
         # Detect text-like regions (simple approach)
         # In a real implementation, you'd use more sophisticated OCR/text detection
         _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
-        # Find contours
+        # Find outer contours only: regions nested inside another region,
+        # like the text inside a frame, belong to it
         contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         code_regions = []
@@ -327,22 +421,33 @@ class SmartDetectionFeature:
         
         return code_regions
     
-    def detect_windows(self, screenshot: ScreenShot) -> List[Dict[str, Any]]:
+    def detect_windows(self, screenshot: ScreenShot, pyramid_levels: int = 2) -> List[Dict[str, Any]]:
         """Detect application windows in screenshots.
         
+        Edges are detected on a downscaled image (each pyramid level halves
+        both dimensions); window bounds don't need full-resolution accuracy.
+        
         Args:
             screenshot: Screenshot to analyze
+            pyramid_levels: Number of times to halve the image before edge detection
             
         Returns:
             List of detected windows with bounding boxes
         """
-        img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
-        
         # Convert to grayscale
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        gray = self._to_gray(screenshot)
+        
+        # Downscale
+        small = gray
+        for _ in range(pyramid_levels):
+            if min(small.shape) < 2:
+                break
+            small = cv2.pyrDown(small)
+        scale_x = gray.shape[1] / small.shape[1]
+        scale_y = gray.shape[0] / small.shape[0]
         
         # Detect edges
-        edges = cv2.Canny(gray, 50, 150)
+        edges = cv2.Canny(small, 50, 150)
         
         # Find contours
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -350,6 +455,12 @@ class SmartDetectionFeature:
         windows = []
         for contour in contours:
             x, y, w, h = cv2.boundingRect(contour)
+            
+            # Back to full-resolution coordinates
+            x, y = int(x * scale_x), int(y * scale_y)
+            w = min(round(w * scale_x), gray.shape[1] - x)
+            h = min(round(h * scale_y), gray.shape[0] - y)
+            
             if w > 100 and h > 50:  # Filter small regions
                 windows.append({
                     'bbox': (x, y, w, h),
@@ -360,11 +471,48 @@ class SmartDetectionFeature:
 
 
 class OCRFeature:
-    """OCR (Optical Character Recognition) feature for extracting text from screenshots."""
+    """OCR (Optical Character Recognition) feature for extracting text from screenshots.
+
+    Results are cached by a hash of the screenshot content so that identical
+    regions (taskbars, window titles, unchanged frames) are only OCR'ed once.
+    """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 128):
+        """Initialize OCR feature.
+        
+        Args:
+            cache_size: Maximum number of cached OCR results (0 disables caching)
+        """
         if not TESSERACT_AVAILABLE:
             raise ImportError("pytesseract is required for OCR features. Install with: pip install pytesseract")
+        
+        self.cache_size = cache_size
+        self._ocr_cache: OrderedDict[Tuple[str, str, Tuple[int, int], bytes], Any] = OrderedDict()
+    
+    def _cache_key(self, kind: str, screenshot: ScreenShot, lang: str) -> Tuple[str, str, Tuple[int, int], bytes]:
+        """Build the cache key for an OCR call on a screenshot."""
+        digest = hashlib.blake2b(screenshot.rgb, digest_size=16).digest()
+        return (kind, lang, (screenshot.width, screenshot.height), digest)
+    
+    def _cache_get(self, key: Tuple[str, str, Tuple[int, int], bytes]) -> Optional[Any]:
+        """Return a cached OCR result and mark it as recently used."""
+        if key not in self._ocr_cache:
+            return None
+        self._ocr_cache.move_to_end(key)
+        return self._ocr_cache[key]
+    
+    def _cache_put(self, key: Tuple[str, str, Tuple[int, int], bytes], value: Any) -> None:
+        """Store an OCR result, evicting the least recently used entries."""
+        if self.cache_size <= 0:
+            return
+        self._ocr_cache[key] = value
+        self._ocr_cache.move_to_end(key)
+        while len(self._ocr_cache) > self.cache_size:
+            self._ocr_cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached OCR results."""
+        self._ocr_cache.clear()
     
     def extract_text(self, screenshot: ScreenShot, lang: str = 'eng') -> str:
         """Extract text from a screenshot using OCR.
@@ -376,13 +524,68 @@ class OCRFeature:
         Returns:
             Extracted text as string
         """
+        key = self._cache_key('text', screenshot, lang)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         # Convert screenshot to PIL Image for OCR
-        from PIL import Image
-        img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+        img = screenshot.as_pil()
         
         # Extract text using Tesseract
-        text = pytesseract.image_to_string(img, lang=lang)
-        return text.strip()
+        text = pytesseract.image_to_string(img, lang=lang).strip()
+        self._cache_put(key, text)
+        return text
+    
+    def extract_text_batch(self, screenshots: List[ScreenShot], lang: str = 'eng',
+                           image_paths: Optional[List[Union[str, Path]]] = None) -> List[str]:
+        """Extract text from several screenshots with a single Tesseract run.
+        
+        Screenshots missing from the cache are handed to Tesseract through an
+        image list file, so its startup cost is paid once for the batch.
+        
+        Args:
+            screenshots: The screenshots to extract text from
+            lang: Language code for OCR (default: 'eng')
+            image_paths: Optional PNG files already holding the screenshots
+            
+        Returns:
+            Extracted text for each screenshot, in order
+        """
+        keys = [self._cache_key('text', screenshot, lang) for screenshot in screenshots]
+        texts: List[Optional[str]] = [self._cache_get(key) for key in keys]
+        missing = [i for i, text in enumerate(texts) if text is None]
+        
+        if len(missing) == 1:
+            texts[missing[0]] = self.extract_text(screenshots[missing[0]], lang=lang)
+        elif missing:
+            with tempfile.TemporaryDirectory(prefix='pyshotter-ocr-') as tmp_dir:
+                paths = []
+                for i in missing:
+                    if image_paths is not None:
+                        path = Path(image_paths[i])
+                    else:
+                        path = Path(tmp_dir) / f"{i}.png"
+                        to_png(screenshots[i].rgb, screenshots[i].size, level=1, output=path)
+                    paths.append(str(path))
+                
+                list_file = Path(tmp_dir) / "images.txt"
+                list_file.write_text("\n".join(paths) + "\n")
+                
+                # Tesseract separates the text of each image with a form feed
+                pages = pytesseract.image_to_string(str(list_file), lang=lang).split("\f")
+            
+            if len(pages) < len(missing):
+                # Unexpected output layout: fall back to one run per image
+                pages = [self.extract_text(screenshots[i], lang=lang) for i in missing]
+            
+            for i, page in zip(missing, pages):
+                text = page.strip()
+                texts[i] = text
+                self._cache_put(keys[i], text)
+        
+        # Every slot is filled by now
+        return [text or '' for text in texts]
     
     def extract_text_boxes(self, screenshot: ScreenShot, lang: str = 'eng') -> List[Dict[str, Any]]:
         """Extract text with bounding boxes from a screenshot.
@@ -394,8 +597,12 @@ class OCRFeature:
         Returns:
             List of dictionaries with text and bounding box information
         """
-        from PIL import Image
-        img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+        key = self._cache_key('boxes', screenshot, lang)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return [dict(box) for box in cached]
+        
+        img = screenshot.as_pil()
         
         # Get detailed OCR data
         data = pytesseract.image_to_data(img, lang=lang, output_type=pytesseract.Output.DICT)
@@ -411,6 +618,7 @@ class OCRFeature:
                             data['top'][i] + data['height'][i])
                 })
         
+        self._cache_put(key, [dict(box) for box in results])
         return results
 
 
@@ -420,6 +628,36 @@ class RedactionFeature:
     def __init__(self):
         if not OPENCV_AVAILABLE:
             raise ImportError("opencv-python is required for redaction features. Install with: pip install opencv-python")
+        self._ocr: Optional[OCRFeature] = None
+    
+    def _get_ocr(self) -> OCRFeature:
+        """Lazy load the OCR feature so its result cache is shared across calls."""
+        if self._ocr is None:
+            self._ocr = OCRFeature()
+        return self._ocr
+    
+    @staticmethod
+    def _find_sensitive_boxes(text_boxes: List[Dict[str, Any]]) -> List[int]:
+        """Find the text boxes containing sensitive data.
+        
+        All tokens are joined into one newline-separated buffer and scanned
+        once; match offsets are mapped back to their boxes. No pattern can
+        match a newline, so matches never span two tokens.
+        
+        Args:
+            text_boxes: OCR text boxes as returned by OCRFeature.extract_text_boxes
+            
+        Returns:
+            Sorted indices of the boxes to redact
+        """
+        starts = []
+        offset = 0
+        for box in text_boxes:
+            starts.append(offset)
+            offset += len(box['text']) + 1
+        
+        buffer = '\n'.join(box['text'] for box in text_boxes)
+        return sorted({bisect_right(starts, match.start()) - 1 for match in _SENSITIVE_DATA_RE.finditer(buffer)})
     
     def redact_sensitive_data(self, screenshot: ScreenShot) -> ScreenShot:
         """Redact sensitive data from a screenshot.
@@ -431,75 +669,149 @@ class RedactionFeature:
             New screenshot with sensitive data redacted
         """
         # Convert to numpy array
-        img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
+        img_array = np.array(screenshot.rgb_array)
         
         # Extract text to find sensitive data
-        ocr = OCRFeature()
-        text_boxes = ocr.extract_text_boxes(screenshot)
-        
-        # Patterns for sensitive data
-        patterns = {
-            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'phone': r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            'credit_card': r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',
-            'ssn': r'\b\d{3}-\d{2}-\d{4}\b'
-        }
+        text_boxes = self._get_ocr().extract_text_boxes(screenshot)
         
         # Redact sensitive data
-        for box in text_boxes:
-            text = box['text']
-            for pattern_name, pattern in patterns.items():
-                if re.search(pattern, text):
-                    # Blur the bounding box area
-                    x1, y1, x2, y2 = box['bbox']
-                    img_array[y1:y2, x1:x2] = cv2.GaussianBlur(
-                        img_array[y1:y2, x1:x2], (15, 15), 0
-                    )
+        for index in self._find_sensitive_boxes(text_boxes):
+            # Blur the bounding box area
+            x1, y1, x2, y2 = text_boxes[index]['bbox']
+            img_array[y1:y2, x1:x2] = cv2.GaussianBlur(
+                img_array[y1:y2, x1:x2], (15, 15), 0
+            )
         
         # Convert back to screenshot format
-        redacted_rgb = img_array.tobytes()
-        return ScreenShot(
-            rgb=redacted_rgb,
-            size=screenshot.size,
-            pos=screenshot.pos
-        )
+        return ScreenShot.from_rgb(img_array, screenshot.size, screenshot.pos)
 
 
 class PanoramaFeature:
     """Multi-monitor panorama feature for stitching screenshots."""
     
-    def create_panorama(self, screenshots: List[ScreenShot]) -> ScreenShot:
-        """Create a panoramic image from multiple monitor screenshots.
+    #: Maximum number of canvases kept for reuse
+    POOL_SIZE = 2
+    
+    def __init__(self):
+        # Canvases reused across calls, keyed by (width, height), least recently used first
+        self._pool: OrderedDict[Tuple[int, int], np.ndarray] = OrderedDict()
+        # Shared memory panoramas handed out by name
+        self._shms: Dict[str, SharedMemory] = {}
+    
+    def _get_canvas(self, width: int, height: int) -> 'np.ndarray':
+        """Get an uninitialized canvas of the given size from the pool.
         
         Args:
-            screenshots: List of screenshots from different monitors
+            width: Canvas width
+            height: Canvas height
             
         Returns:
-            Panoramic screenshot
+            RGB image array, contents undefined
         """
+        key = (width, height)
+        canvas = self._pool.pop(key, None)
+        if canvas is None:
+            canvas = np.empty((height, width, 3), dtype=np.uint8)
+        self._pool[key] = canvas
+        while len(self._pool) > self.POOL_SIZE:
+            self._pool.popitem(last=False)
+        return canvas
+    
+    @staticmethod
+    def _canvas_size(screenshots: List[ScreenShot]) -> Tuple[int, int]:
+        """Compute the (width, height) of the panorama of the given screenshots."""
         if not screenshots:
             raise ValueError("At least one screenshot is required")
         
         # Calculate total width and max height
         total_width = sum(s.width for s in screenshots)
         max_height = max(s.height for s in screenshots)
+        return total_width, max_height
+    
+    @staticmethod
+    def _blit(panorama_array: 'np.ndarray', screenshots: List[ScreenShot]) -> None:
+        """Copy screenshots side by side into a canvas, clearing uncovered pixels.
         
-        # Create panoramic image
-        panorama_array = np.zeros((max_height, total_width, 3), dtype=np.uint8)
-        
+        Args:
+            panorama_array: Canvas of the size given by _canvas_size
+            screenshots: List of screenshots from different monitors
+        """
         x_offset = 0
         for screenshot in screenshots:
-            img_array = np.array(screenshot.rgb).reshape(screenshot.height, screenshot.width, 3)
+            # Zero-copy view: each source pixel is copied exactly once, into the canvas
+            img_array = np.frombuffer(screenshot.rgb, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 3)
             panorama_array[:screenshot.height, x_offset:x_offset + screenshot.width] = img_array
+            # Only the strip below a shorter screenshot is not covered by a source
+            panorama_array[screenshot.height:, x_offset:x_offset + screenshot.width] = 0
             x_offset += screenshot.width
+    
+    def create_panorama(self, screenshots: List[ScreenShot]) -> ScreenShot:
+        """Create a panoramic image from multiple monitor screenshots.
+        
+        Args:
+            screenshots: List of screenshots from different monitors
+            
+        Returns:
+            Panoramic screenshot
+        """
+        total_width, max_height = self._canvas_size(screenshots)
+        
+        # Create panoramic image
+        panorama_array = self._get_canvas(total_width, max_height)
+        self._blit(panorama_array, screenshots)
         
         # Convert back to screenshot format
-        panorama_rgb = panorama_array.tobytes()
-        return ScreenShot(
-            rgb=panorama_rgb,
-            size=(total_width, max_height),
-            pos=(0, 0)
-        )
+        return ScreenShot.from_rgb(panorama_array, (total_width, max_height), (0, 0))
+    
+    def create_panorama_shm(self, screenshots: List[ScreenShot]) -> Tuple[str, Tuple[int, int, int], str]:
+        """Create a panoramic image directly in shared memory.
+        
+        Other processes can map the panorama without it being copied or
+        serialized::
+        
+            shm = SharedMemory(name)
+            panorama = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        
+        The block stays alive until release_panorama_shm() or close() is called.
+        
+        Args:
+            screenshots: List of screenshots from different monitors
+            
+        Returns:
+            Shared memory block name, array shape and dtype
+        """
+        total_width, max_height = self._canvas_size(screenshots)
+        shape = (max_height, total_width, 3)
+        
+        shm = SharedMemory(create=True, size=max_height * total_width * 3)
+        try:
+            panorama_array = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+            self._blit(panorama_array, screenshots)
+            del panorama_array  # Release the export on shm.buf so it can be closed
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        
+        self._shms[shm.name] = shm
+        return shm.name, shape, 'uint8'
+    
+    def release_panorama_shm(self, name: str) -> None:
+        """Free a shared memory panorama created by create_panorama_shm().
+        
+        Args:
+            name: Shared memory block name
+        """
+        shm = self._shms.pop(name, None)
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    
+    def close(self) -> None:
+        """Free all shared memory panoramas and pooled canvases."""
+        for name in list(self._shms):
+            self.release_panorama_shm(name)
+        self._pool.clear()
 
 
 class ChangeDetectionFeature:
@@ -508,6 +820,30 @@ class ChangeDetectionFeature:
     def __init__(self):
         if not OPENCV_AVAILABLE:
             raise ImportError("opencv-python is required for change detection. Install with: pip install opencv-python")
+        
+        # Grayscale of the last two screenshots seen, so that the "current"
+        # screenshot of one call is not converted again as the "previous" of
+        # the next. Screenshots are held strongly so identity checks stay valid.
+        self._gray_cache: List[Tuple[ScreenShot, np.ndarray]] = []
+        self._diff_buf: Optional[np.ndarray] = None
+    
+    def _to_gray(self, screenshot: ScreenShot) -> 'np.ndarray':
+        """Convert a screenshot to grayscale, reusing recent conversions.
+        
+        Args:
+            screenshot: Screenshot to convert
+            
+        Returns:
+            Grayscale image array
+        """
+        for cached, gray in self._gray_cache:
+            if cached is screenshot:
+                return gray
+        
+        img_array = np.frombuffer(screenshot.rgb, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 3)
+        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        self._gray_cache = [*self._gray_cache[-1:], (screenshot, gray)]
+        return gray
     
     def detect_changes(self, current: ScreenShot, previous: ScreenShot, 
                       threshold: float = 0.1) -> ScreenShot:
@@ -521,37 +857,31 @@ class ChangeDetectionFeature:
         Returns:
             Screenshot highlighting changes
         """
-        # Convert to numpy arrays
-        current_array = np.array(current.rgb).reshape(current.height, current.width, 3)
-        previous_array = np.array(previous.rgb).reshape(previous.height, previous.width, 3)
-        
-        # Convert to grayscale for comparison
-        current_gray = cv2.cvtColor(current_array, cv2.COLOR_RGB2GRAY)
-        previous_gray = cv2.cvtColor(previous_array, cv2.COLOR_RGB2GRAY)
-        
-        # Calculate difference
-        diff = cv2.absdiff(current_gray, previous_gray)
-        
-        # Apply threshold
-        _, thresh = cv2.threshold(diff, int(255 * threshold), 255, cv2.THRESH_BINARY)
+        # Convert to grayscale for comparison; "previous" first, as it is
+        # usually the "current" of the last call and must be found before
+        # converting "current" evicts it
+        previous_gray = self._to_gray(previous)
+        current_gray = self._to_gray(current)
+        
+        # Calculate difference and apply threshold in place, in a reused buffer
+        if self._diff_buf is None or self._diff_buf.shape != current_gray.shape:
+            self._diff_buf = np.empty_like(current_gray)
+        thresh = self._diff_buf
+        cv2.absdiff(current_gray, previous_gray, dst=thresh)
+        cv2.threshold(thresh, int(255 * threshold), 255, cv2.THRESH_BINARY, dst=thresh)
         
         # Find contours of changes
         contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         # Draw red rectangles around changes
-        result_array = current_array.copy()
+        result_array = np.frombuffer(current.rgb, dtype=np.uint8).reshape(current.height, current.width, 3).copy()
         for contour in contours:
             if cv2.contourArea(contour) > 100:  # Filter small changes
                 x, y, w, h = cv2.boundingRect(contour)
                 cv2.rectangle(result_array, (x, y), (x + w, y + h), (255, 0, 0), 2)
         
         # Convert back to screenshot format
-        result_rgb = result_array.tobytes()
-        return ScreenShot(
-            rgb=result_rgb,
-            size=current.size,
-            pos=current.pos
-        )
+        return ScreenShot.from_rgb(result_array, current.size, current.pos)
 
 
 class HotkeyManager:
@@ -596,53 +926,96 @@ class ScreenshotHistory:
     def __init__(self, history_dir: str = "~/.pyshotter/history"):
         self.history_dir = Path(history_dir).expanduser()
         self.history_dir.mkdir(parents=True, exist_ok=True)
-        self.history_file = self.history_dir / "history.json"
+        # One JSON entry per line, so adding a screenshot appends instead of rewriting
+        self.history_file = self.history_dir / "history.jsonl"
+        self.legacy_history_file = self.history_dir / "history.json"
+        self._ocr: Optional[OCRFeature] = None
+        self._last_id_ns = 0
         self._load_history()
     
     def _load_history(self) -> None:
         """Load screenshot history from file."""
-        import json
         if self.history_file.exists():
+            self.history = []
             with open(self.history_file, 'r') as f:
+                for line in f:
+                    try:
+                        self.history.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # Blank or partially written line (e.g. interrupted append)
+                        continue
+        elif self.legacy_history_file.exists():
+            # One-time migration from the former single JSON document
+            with open(self.legacy_history_file, 'r') as f:
                 self.history = json.load(f)
+            self._save_history()
         else:
             self.history = []
+        
+        # Searchable text kept parallel to self.history, built once per entry
+        self._search_index = [self._search_text(entry) for entry in self.history]
     
-    def _save_history(self) -> None:
-        """Save screenshot history to file."""
-        import json
-        with open(self.history_file, 'w') as f:
-            json.dump(self.history, f, indent=2)
-    
-    def add_screenshot(self, screenshot: ScreenShot, metadata: Dict[str, Any] = None) -> str:
-        """Add a screenshot to history.
+    @staticmethod
+    def _search_text(entry: Dict[str, Any]) -> str:
+        """Build the lowercase text matched by search_history for an entry.
         
         Args:
-            screenshot: The screenshot to add
-            metadata: Additional metadata (window title, tags, etc.)
+            entry: History entry
             
         Returns:
-            Screenshot ID
+            OCR text, serialized metadata and tags, NUL-separated so a query
+            cannot match across fields
         """
-        import hashlib
+        metadata = entry.get('metadata', {})
+        parts = [entry.get('ocr_text', ''), json.dumps(metadata), *metadata.get('tags', [])]
+        return '\x00'.join(parts).lower()
+    
+    def _save_history(self) -> None:
+        """Rewrite the whole screenshot history file."""
+        self._write_entries(self.history, mode='w')
+    
+    def _write_entries(self, entries: List[Dict[str, Any]], mode: str = 'a') -> None:
+        """Write history entries to file, one JSON document per line.
         
-        # Generate unique ID
-        screenshot_id = hashlib.md5(f"{time.time()}".encode()).hexdigest()[:8]
+        Args:
+            entries: Entries to write
+            mode: File mode ('a' to append, 'w' to rewrite)
+        """
+        with open(self.history_file, mode) as f:
+            f.writelines(json.dumps(entry, separators=(',', ':')) + '\n' for entry in entries)
+    
+    def _store_screenshot(self, screenshot: ScreenShot) -> Tuple[str, Path]:
+        """Write a screenshot to the history directory.
         
-        # Save screenshot
-        screenshot_path = self.history_dir / f"{screenshot_id}.png"
-        screenshot.save(str(screenshot_path))
+        Identical screenshots share one content-addressed file, but each
+        capture gets its own ID: the content digest followed by a strictly
+        increasing timestamp.
         
-        # Extract text if OCR is available
-        ocr_text = ""
-        if TESSERACT_AVAILABLE:
-            try:
-                ocr = OCRFeature()
-                ocr_text = ocr.extract_text(screenshot)
-            except:
-                pass
+        Args:
+            screenshot: The screenshot to store
+            
+        Returns:
+            Screenshot ID and path of the PNG file
+        """
+        digest = hashlib.blake2b(screenshot.rgb, digest_size=8).hexdigest()
         
-        # Create history entry
+        # Save screenshot, unless the same content is already stored
+        screenshot_path = self.history_dir / f"{digest}.png"
+        if not screenshot_path.exists():
+            to_png(screenshot.rgb, screenshot.size, output=screenshot_path)
+        
+        self._last_id_ns = max(time.time_ns(), self._last_id_ns + 1)
+        return f"{digest}-{self._last_id_ns:x}", screenshot_path
+    
+    def _get_ocr(self) -> Optional[OCRFeature]:
+        """Lazy load the OCR feature, or None if Tesseract isn't available."""
+        if self._ocr is None and TESSERACT_AVAILABLE:
+            self._ocr = OCRFeature()
+        return self._ocr
+    
+    def _append_entry(self, screenshot_id: str, screenshot_path: Path, screenshot: ScreenShot,
+                      ocr_text: str, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create a history entry and append it to the in-memory history."""
         entry = {
             'id': screenshot_id,
             'timestamp': datetime.now().isoformat(),
@@ -653,10 +1026,83 @@ class ScreenshotHistory:
         }
         
         self.history.append(entry)
-        self._save_history()
+        self._search_index.append(self._search_text(entry))
+        return entry
+    
+    def add_screenshot(self, screenshot: ScreenShot, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Add a screenshot to history.
+        
+        Args:
+            screenshot: The screenshot to add
+            metadata: Additional metadata (window title, tags, etc.)
+            
+        Returns:
+            Screenshot ID
+        """
+        screenshot_id, screenshot_path = self._store_screenshot(screenshot)
+        
+        # Extract text if OCR is available
+        ocr_text = ""
+        try:
+            ocr = self._get_ocr()
+            if ocr is not None:
+                ocr_text = ocr.extract_text(screenshot)
+        except (OSError, RuntimeError):
+            # OCR is best effort: Tesseract missing or failing
+            ocr_text = ""
+        
+        entry = self._append_entry(screenshot_id, screenshot_path, screenshot, ocr_text, metadata)
+        self._write_entries([entry])
         
         return screenshot_id
     
+    def add_screenshots(self, screenshots: List[ScreenShot],
+                        metadata_list: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """Add several screenshots to history at once.
+        
+        OCR runs through a single Tesseract process for the whole batch and
+        all entries are appended to the history file in one write.
+        
+        Args:
+            screenshots: The screenshots to add
+            metadata_list: Optional metadata for each screenshot
+            
+        Returns:
+            Screenshot IDs, in order
+        """
+        metadatas: List[Optional[Dict[str, Any]]]
+        if metadata_list is None:
+            metadatas = [None] * len(screenshots)
+        elif len(metadata_list) != len(screenshots):
+            raise ValueError("metadata_list must have one entry per screenshot")
+        else:
+            metadatas = list(metadata_list)
+        
+        if len(screenshots) == 1:
+            return [self.add_screenshot(screenshots[0], metadatas[0])]
+        
+        stored = [self._store_screenshot(screenshot) for screenshot in screenshots]
+        
+        # Extract text if OCR is available
+        ocr_texts = [""] * len(screenshots)
+        try:
+            ocr = self._get_ocr()
+            if ocr is not None:
+                ocr_texts = ocr.extract_text_batch(screenshots, image_paths=[path for _, path in stored])
+        except (OSError, RuntimeError):
+            # OCR is best effort: Tesseract missing or failing
+            ocr_texts = [""] * len(screenshots)
+        
+        entries = [
+            self._append_entry(screenshot_id, screenshot_path, screenshot, ocr_text, metadata)
+            for (screenshot_id, screenshot_path), screenshot, ocr_text, metadata in zip(
+                stored, screenshots, ocr_texts, metadatas
+            )
+        ]
+        self._write_entries(entries)
+        
+        return [screenshot_id for screenshot_id, _ in stored]
+    
     def search_history(self, query: str) -> List[Dict[str, Any]]:
         """Search screenshot history.
         
@@ -666,27 +1112,12 @@ class ScreenshotHistory:
         Returns:
             List of matching screenshot entries
         """
-        results = []
         query_lower = query.lower()
-        
-        for entry in self.history:
-            # Search in OCR text
-            if query_lower in entry.get('ocr_text', '').lower():
-                results.append(entry)
-                continue
-            
-            # Search in metadata
-            metadata_str = json.dumps(entry.get('metadata', {})).lower()
-            if query_lower in metadata_str:
-                results.append(entry)
-                continue
-            
-            # Search in tags
-            tags = entry.get('metadata', {}).get('tags', [])
-            if any(query_lower in tag.lower() for tag in tags):
-                results.append(entry)
-        
-        return results
+        return [
+            entry
+            for entry, text in zip(self.history, self._search_index)
+            if query_lower in text
+        ]
     
     def get_screenshot(self, screenshot_id: str) -> Optional[ScreenShot]:
         """Get a screenshot from history by ID.
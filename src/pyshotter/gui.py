@@ -8,31 +8,62 @@ This module provides a system tray application with:
 """
 
 import sys
-from typing import Optional, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import time_ns
+from typing import TYPE_CHECKING, ClassVar, Optional, Callable
 
-try:
+from .exception import GUIError, DependencyError
+from .logging_config import get_logger
+from .tools import bgra_to_png
+
+if TYPE_CHECKING:
     import pystray
     from PIL import Image, ImageDraw
-    PYSTRAY_AVAILABLE = True
-except ImportError:
-    PYSTRAY_AVAILABLE = False
 
-from .exception import GUIError, DependencyError
-from .logging_config import get_logger
+    from .screenshot import ScreenShot
+else:
+    # pystray and Pillow are imported on first GUI use, not with the package
+    pystray = None
+    Image = None
+    ImageDraw = None
 
 logger = get_logger(__name__)
 
+PYSTRAY_AVAILABLE: Optional[bool] = None
+
+
+def _load_pystray() -> bool:
+    """Import pystray and Pillow on first use.
+    
+    Returns:
+        True if both are available
+    """
+    global pystray, Image, ImageDraw, PYSTRAY_AVAILABLE
+    
+    if PYSTRAY_AVAILABLE is None:
+        try:
+            import pystray
+            from PIL import Image, ImageDraw
+            PYSTRAY_AVAILABLE = True
+        except ImportError:
+            PYSTRAY_AVAILABLE = False
+    
+    return PYSTRAY_AVAILABLE
+
 
 class PyShotterGUI:
     """System tray GUI for PyShotter."""
     
+    #: Rendered tray icon, shared by all instances
+    _ICON_CACHE: ClassVar[Optional['Image.Image']] = None
+    
     def __init__(self):
         """Initialize GUI.
         
         Raises:
             DependencyError: If pystray isn't installed
         """
-        if not PYSTRAY_AVAILABLE:
+        if not _load_pystray():
             raise DependencyError(
                 'GUI',
                 'pystray and pillow',
@@ -41,15 +72,19 @@ class PyShotterGUI:
         
         self.icon: Optional[pystray.Icon] = None
         self.hotkey_manager: Optional['HotkeyManager'] = None
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pysh-io')
         
         logger.info("GUI initialized")
     
-    def create_icon_image(self) -> Image.Image:
+    def create_icon_image(self) -> 'Image.Image':
         """Create system tray icon.
         
         Returns:
-            PIL Image for tray icon
+            PIL Image for tray icon (rendered once, then shared)
         """
+        if PyShotterGUI._ICON_CACHE is not None:
+            return PyShotterGUI._ICON_CACHE
+        
         # Create simple camera icon
         width = 64
         height = 64
@@ -66,9 +101,10 @@ class PyShotterGUI:
         # Draw flash
         draw.rectangle([42, 20, 48, 26], fill=(255, 255, 0))
         
+        PyShotterGUI._ICON_CACHE = image
         return image
     
-    def create_menu(self) -> pystray.Menu:
+    def create_menu(self) -> 'pystray.Menu':
         """Create system tray menu.
         
         Returns:
@@ -94,14 +130,44 @@ class PyShotterGUI:
             with pyshotter() as sct:
                 # Simple full screen for now - region selection would require overlay
                 screenshot = sct.grab(sct.monitors[1])
-                output = f"screenshot_{int(__import__('time').time())}.png"
-                screenshot.save(output)
-                logger.info(f"Saved: {output}")
-                self.show_notification("Screenshot saved", output)
+            output = f"screenshot_{time_ns() // 1_000_000_000}.png"
+            self._save_async(screenshot, output)
         except Exception as e:
-            logger.error(f"Capture failed: {e}")
+            logger.error("Capture failed: %s", e)
             self.show_notification("Capture failed", str(e))
     
+    def _save_async(self, screenshot: 'ScreenShot', output: str) -> Future:
+        """Encode and write a screenshot on the I/O pool.
+        
+        The menu callback returns right after the grab; the notification is
+        shown once the file is written.
+        
+        Args:
+            screenshot: Screenshot to save
+            output: Output PNG path
+            
+        Returns:
+            Future completing when the file is written
+        """
+        future = self._io_pool.submit(bgra_to_png, screenshot.raw, screenshot.size, output=output)
+        future.add_done_callback(lambda f: self._on_saved(f, output))
+        return future
+    
+    def _on_saved(self, future: Future, output: str):
+        """Report the outcome of a background save.
+        
+        Args:
+            future: Completed save future
+            output: Output PNG path
+        """
+        error = future.exception()
+        if error is None:
+            logger.info("Saved: %s", output)
+            self.show_notification("Screenshot saved", output)
+        else:
+            logger.error("Capture failed: %s", error)
+            self.show_notification("Capture failed", str(error))
+    
     def capture_window(self, icon=None, item=None):
         """Capture active window."""
         logger.info("Capture window triggered (not fully implemented)")
@@ -114,12 +180,10 @@ class PyShotterGUI:
             from .factory import pyshotter
             with pyshotter() as sct:
                 screenshot = sct.grab(sct.monitors[0])  # All monitors
-                output = f"screenshot_{int(__import__('time').time())}.png"
-                screenshot.save(output)
-                logger.info(f"Saved: {output}")
-                self.show_notification("Screenshot saved", output)
+            output = f"screenshot_{time_ns() // 1_000_000_000}.png"
+            self._save_async(screenshot, output)
         except Exception as e:
-            logger.error(f"Capture failed: {e}")
+            logger.error("Capture failed: %s", e)
     
     def start_recording(self, icon=None, item=None):
         """Start screen recording."""
@@ -139,6 +203,8 @@ class PyShotterGUI:
     def exit_app(self, icon=None, item=None):
         """Exit application."""
         logger.info("Exiting GUI")
+        # Pending saves still complete, without blocking the menu callback
+        self._io_pool.shutdown(wait=False)
         if self.icon:
             self.icon.stop()
     
@@ -181,7 +247,7 @@ class PyShotterGUI:
             logger.info("GUI stopped")
             
         except Exception as e:
-            logger.error(f"GUI error: {e}")
+            logger.error("GUI error: %s", e)
             raise GUIError(f"Failed to start GUI: {e}", component="system_tray")
 
 
@@ -200,7 +266,7 @@ class HotkeyManager:
             hotkey: Hotkey combination (e.g., 'ctrl+shift+s')
             callback: Function to call when hotkey pressed
         """
-        logger.info(f"Registered hotkey: {hotkey} (not active - requires platform-specific implementation)")
+        logger.info("Registered hotkey: %s (not active - requires platform-specific implementation)", hotkey)
         self.hotkeys[hotkey] = callback
     
     def unregister(self, hotkey: str):
@@ -211,7 +277,7 @@ class HotkeyManager:
         """
         if hotkey in self.hotkeys:
             del self.hotkeys[hotkey]
-            logger.info(f"Unregistered hotkey: {hotkey}")
+            logger.info("Unregistered hotkey: %s", hotkey)
 
 
 def main_gui():
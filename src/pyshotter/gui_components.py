@@ -1,26 +1,199 @@
 """Region selection and GUI components for PyShotter."""
 
-from typing import Optional, Tuple, Callable
-
-try:
-    from PIL import Image, ImageDraw, ImageTk
-    import tkinter as tk
-    TKINTER_AVAILABLE = True
-except ImportError:
-    TKINTER_AVAILABLE = False
+import json
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
 from .exception import GUIError
 from .logging_config import get_logger
 
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import ttk
+else:
+    # tkinter is imported on first GUI use, not with the package
+    tk = None
+    ttk = None
+
 logger = get_logger(__name__)
 
+TKINTER_AVAILABLE: Optional[bool] = None
+
+
+def _load_tkinter() -> bool:
+    """Import tkinter on first use.
+    
+    Returns:
+        True if tkinter is available
+    """
+    global tk, ttk, TKINTER_AVAILABLE
+    
+    if TKINTER_AVAILABLE is None:
+        try:
+            import tkinter as tk
+            from tkinter import ttk
+            TKINTER_AVAILABLE = True
+        except ImportError:
+            TKINTER_AVAILABLE = False
+    
+    return TKINTER_AVAILABLE
+
+
+def _tail_lines(path: Path, count: int, block_size: int = 8192) -> List[bytes]:
+    """Read the last lines of a file without reading the whole file.
+    
+    Blocks are read backwards from the end until enough newlines are found.
+    
+    Args:
+        path: File to read
+        count: Number of lines to return
+        block_size: Size of each block read from the end
+        
+    Returns:
+        Up to ``count`` last lines, oldest first
+    """
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        data = b''
+        # One newline more than needed, so the first kept line is complete
+        while pos > 0 and data.count(b'\n') <= count:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+    
+    lines = data.splitlines()
+    if pos > 0:
+        lines = lines[1:]
+    return lines[-count:] if count > 0 else []
+
+
+def _load_history_tail(path: Path, count: int) -> List[dict]:
+    """Parse the last entries of a JSON Lines history file.
+    
+    Args:
+        path: History file
+        count: Number of lines to read
+        
+    Returns:
+        Entries parsed from those lines, oldest first
+    """
+    entries = []
+    for line in _tail_lines(path, count):
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            # Blank or partially written line (e.g. interrupted append)
+            continue
+    return entries
+
+
+THUMB_SIZE = (128, 128)
+
+
+def _ensure_thumb(png_path: Path, thumb_dir: Path) -> Path:
+    """Get the cached thumbnail of a screenshot, creating it if needed.
+    
+    Thumbnails carry the source file's mtime and are regenerated when it
+    changes. They are stored as PNG, which Tk can load without Pillow.
+    
+    Args:
+        png_path: Screenshot file
+        thumb_dir: Thumbnail cache directory
+        
+    Returns:
+        Path of the thumbnail
+    """
+    thumb_path = thumb_dir / f"{png_path.stem}.png"
+    source_mtime = png_path.stat().st_mtime_ns
+    
+    try:
+        if thumb_path.stat().st_mtime_ns == source_mtime:
+            return thumb_path
+    except FileNotFoundError:
+        pass
+    
+    from PIL import Image
+    
+    thumb_dir.mkdir(parents=True, exist_ok=True)
+    with Image.open(png_path) as img:
+        img.thumbnail(THUMB_SIZE, Image.Resampling.BILINEAR)
+        img.save(thumb_path, optimize=False)
+    os.utime(thumb_path, ns=(source_mtime, source_mtime))
+    
+    return thumb_path
+
+
+# Overlay kept between selections, and the thread that owns it
+_OVERLAY: Optional[Tuple['tk.Tk', 'tk.Canvas']] = None
+_OVERLAY_THREAD: Optional[int] = None
+_OVERLAY_LOCK = threading.Lock()
+
+
+def _create_overlay() -> Tuple['tk.Tk', 'tk.Canvas']:
+    """Create a withdrawn fullscreen selection overlay.
+    
+    Returns:
+        Tuple of (root window, canvas)
+    """
+    root = tk.Tk()
+    root.withdraw()
+    root.attributes('-fullscreen', True)
+    root.attributes('-alpha', 0.3)  # Semi-transparent
+    root.configure(background='black')
+    
+    def hide() -> None:
+        # Closing the window hides it so it can be shown again
+        root.withdraw()
+        root.quit()
+    
+    root.protocol('WM_DELETE_WINDOW', hide)
+    
+    canvas = tk.Canvas(
+        root,
+        width=root.winfo_screenwidth(),
+        height=root.winfo_screenheight(),
+        highlightthickness=0,
+        bg='black'
+    )
+    canvas.pack()
+    
+    return root, canvas
+
+
+def _get_overlay() -> Tuple['tk.Tk', 'tk.Canvas', bool]:
+    """Get a fullscreen selection overlay for the calling thread.
+    
+    Tk objects may only be used from the thread that created them. The first
+    thread to make a selection keeps its overlay, withdrawn between
+    selections rather than destroyed, so its later selections skip the
+    window-manager setup. Other threads get a new overlay, which they must
+    destroy once the selection is done.
+    
+    Returns:
+        Tuple of (root window, canvas, whether the overlay is kept for reuse)
+    """
+    global _OVERLAY, _OVERLAY_THREAD
+    
+    thread = threading.get_ident()
+    with _OVERLAY_LOCK:
+        if _OVERLAY is None:
+            _OVERLAY, _OVERLAY_THREAD = _create_overlay(), thread
+        if _OVERLAY_THREAD == thread:
+            return (*_OVERLAY, True)
+    
+    return (*_create_overlay(), False)
+
 
 class RegionSelector:
     """Interactive region selection overlay."""
     
     def __init__(self):
         """Initialize region selector."""
-        if not TKINTER_AVAILABLE:
+        if not _load_tkinter():
             raise GUIError("Tkinter not available", component="region_selector")
         
         self.root = None
@@ -29,6 +202,8 @@ class RegionSelector:
         self.start_x = None
         self.start_y = None
         self.rect = None
+        self.dim_text = None
+        self._dim_size: Optional[Tuple[int, int]] = None
         
     def select_region(self, callback: Optional[Callable] = None) -> Optional[Tuple[int, int, int, int]]:
         """Show overlay and let user select region.
@@ -39,25 +214,14 @@ class RegionSelector:
         Returns:
             Tuple of (x, y, width, height) or None if cancelled
         """
+        kept = True
         try:
-            # Create fullscreen window
-            self.root = tk.Tk()
-            self.root.attributes('-fullscreen', True)
-            self.root.attributes('-alpha', 0.3)  # Semi-transparent
-            self.root.configure(background='black')
-            
-            # Create canvas
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            
-            self.canvas = tk.Canvas(
-                self.root,
-                width=screen_width,
-                height=screen_height,
-                highlightthickness=0,
-                bg='black'
-            )
-            self.canvas.pack()
+            # Reuse the overlay window and canvas from earlier selections
+            self.root, self.canvas, kept = _get_overlay()
+            self.canvas.delete('all')
+            self.rect = None
+            self.dim_text = None
+            self.selected_region = None
             
             # Bind mouse events
             self.canvas.bind('<Button-1>', self._on_mouse_down)
@@ -65,17 +229,18 @@ class RegionSelector:
             self.canvas.bind('<ButtonRelease-1>', self._on_mouse_up)
             
             # Bind escape key
-            self.root.bind('<Escape>', lambda e: self.root.destroy())
+            self.root.bind('<Escape>', lambda e: self._close())
             
             # Add instructions
             self.canvas.create_text(
-                screen_width // 2,
+                self.root.winfo_screenwidth() // 2,
                 50,
                 text="Drag to select region. Press ESC to cancel.",
                 fill='white',
                 font=('Arial', 16)
             )
             
+            self.root.deiconify()
             self.root.mainloop()
             
             if callback and self.selected_region:
@@ -84,47 +249,55 @@ class RegionSelector:
             return self.selected_region
             
         except Exception as e:
-            logger.error(f"Region selection failed: {e}")
+            logger.error("Region selection failed: %s", e)
             raise GUIError(f"Region selection failed: {e}", component="region_selector")
+        finally:
+            if not kept:
+                self.root.destroy()
+                self.root = self.canvas = None
     
     def _on_mouse_down(self, event):
         """Handle mouse down event."""
         self.start_x = event.x
         self.start_y = event.y
         
-        # Create rectangle
+        # Create rectangle and dimension text once; mouse moves only update them
         if self.rect:
-            self.canvas.delete(self.rect)
-        self.rect = self.canvas.create_rectangle(
-            self.start_x, self.start_y, self.start_x, self.start_y,
-            outline='red',
-            width=2
-        )
+            self.canvas.coords(self.rect, self.start_x, self.start_y, self.start_x, self.start_y)
+        else:
+            self.rect = self.canvas.create_rectangle(
+                self.start_x, self.start_y, self.start_x, self.start_y,
+                outline='red',
+                width=2
+            )
+        
+        if self.dim_text:
+            self.canvas.coords(self.dim_text, self.start_x + 10, self.start_y + 10)
+            self.canvas.itemconfigure(self.dim_text, text="")
+        else:
+            self.dim_text = self.canvas.create_text(
+                self.start_x + 10, self.start_y + 10,
+                text="",
+                fill='white',
+                font=('Arial', 12)
+            )
+        self._dim_size = None
     
     def _on_mouse_move(self, event):
         """Handle mouse move event."""
         if self.rect:
-            # Update rectangle
-            self.canvas.coords(
-                self.rect,
-                self.start_x, self.start_y,
-                event.x, event.y
-            )
+            ex = event.x
+            ey = event.y
             
-            # Show dimensions
-            width = abs(event.x - self.start_x)
-            height = abs(event.y - self.start_y)
-            
-            # Update or create dimension text
-            if hasattr(self, 'dim_text'):
-                self.canvas.delete(self.dim_text)
+            # Update rectangle
+            self.canvas.coords(self.rect, self.start_x, self.start_y, ex, ey)
+            self.canvas.coords(self.dim_text, ex + 10, ey + 10)
             
-            self.dim_text = self.canvas.create_text(
-                event.x + 10, event.y + 10,
-                text=f"{width} x {height}",
-                fill='white',
-                font=('Arial', 12)
-            )
+            # Only re-render the dimension text when the size changes
+            size = (abs(ex - self.start_x), abs(ey - self.start_y))
+            if size != self._dim_size:
+                self._dim_size = size
+                self.canvas.itemconfigure(self.dim_text, text=f"{size[0]} x {size[1]}")
     
     def _on_mouse_up(self, event):
         """Handle mouse up event."""
@@ -139,11 +312,15 @@ class RegionSelector:
         
         if width > 10 and height > 10:  # Minimum size
             self.selected_region = (x1, y1, width, height)
-            logger.info(f"Selected region: {self.selected_region}")
+            logger.info("Selected region: %s", self.selected_region)
         
-        # Close window
+        self._close()
+    
+    def _close(self):
+        """Hide the overlay and leave its event loop."""
         if self.root:
-            self.root.destroy()
+            self.root.withdraw()
+            self.root.quit()
 
 
 class ScreenshotHistoryViewer:
@@ -155,12 +332,14 @@ class ScreenshotHistoryViewer:
         Args:
             history_dir: Directory containing screenshot history
         """
-        if not TKINTER_AVAILABLE:
+        if not _load_tkinter():
             raise GUIError("Tkinter not available", component="history_viewer")
         
-        from pathlib import Path
         self.history_dir = Path(history_dir).expanduser()
+        self.thumb_dir = self.history_dir / "thumbs"
         self.root = None
+        # Tk images are freed once unreferenced, so keep them with the viewer
+        self._thumbs: List[tk.PhotoImage] = []
         
     def show(self):
         """Show history viewer window."""
@@ -169,29 +348,13 @@ class ScreenshotHistoryViewer:
             self.root.title("PyShotter History")
             self.root.geometry("800x600")
             
-            # Create scrollable frame
-            canvas = tk.Canvas(self.root)
-            scrollbar = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas)
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
             # Load screenshots
-            self._load_screenshots(scrollable_frame)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+            self._load_screenshots(self.root)
             
             self.root.mainloop()
             
         except Exception as e:
-            logger.error(f"History viewer failed: {e}")
+            logger.error("History viewer failed: %s", e)
             raise GUIError(f"History viewer failed: {e}", component="history_viewer")
     
     def _load_screenshots(self, parent):
@@ -200,48 +363,83 @@ class ScreenshotHistoryViewer:
         Args:
             parent: Parent widget
         """
-        import json
+        history_file = self.history_dir / "history.jsonl"
+        legacy_history_file = self.history_dir / "history.json"
         
-        history_file = self.history_dir / "history.json"
-        
-        if not history_file.exists():
+        if not history_file.exists() and not legacy_history_file.exists():
             label = tk.Label(parent, text="No history found", font=('Arial', 14))
             label.pack(pady=20)
             return
         
         try:
-            with open(history_file, 'r') as f:
-                history = json.load(f)
+            if history_file.exists():
+                # One entry per line: only the tail of the file is read and parsed
+                history = _load_history_tail(history_file, 20)
+            else:
+                with open(legacy_history_file, 'r') as f:
+                    history = json.load(f)
+            
+            # A single Treeview renders and scrolls all rows itself
+            ttk.Style(parent).configure('History.Treeview', rowheight=THUMB_SIZE[1] + 8)
+            tree = ttk.Treeview(
+                parent, columns=('ts', 'path', 'size'), show='tree headings', style='History.Treeview'
+            )
+            tree.column('#0', width=THUMB_SIZE[0] + 16, stretch=False)
+            tree.heading('ts', text="Timestamp")
+            tree.heading('path', text="Path")
+            tree.heading('size', text="Size")
+            scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+            tree.configure(yscrollcommand=scrollbar.set)
             
             for entry in history[-20:]:  # Show last 20
-                self._create_history_entry(parent, entry)
+                thumb = self._load_thumb(entry)
+                if thumb is None:
+                    tree.insert('', 'end', values=self._entry_values(entry))
+                else:
+                    tree.insert('', 'end', image=thumb, values=self._entry_values(entry))
+            
+            tree.pack(side="left", fill="both", expand=True)
+            scrollbar.pack(side="right", fill="y")
                 
         except Exception as e:
-            logger.error(f"Failed to load history: {e}")
+            logger.error("Failed to load history: %s", e)
             label = tk.Label(parent, text=f"Error loading history: {e}")
             label.pack(pady=20)
     
-    def _create_history_entry(self, parent, entry):
-        """Create widget for history entry.
+    def _load_thumb(self, entry: dict) -> Optional['tk.PhotoImage']:
+        """Load the cached thumbnail of a history entry.
         
         Args:
-            parent: Parent widget
             entry: History entry dict
+            
+        Returns:
+            Tk image, or None if the screenshot can't be read
         """
-        frame = tk.Frame(parent, relief=tk.RAISED, borderwidth=1)
-        frame.pack(fill=tk.X, padx=10, pady=5)
+        path = entry.get('path')
+        if not path:
+            return None
         
-        # Timestamp
-        timestamp = entry.get('timestamp', 'Unknown')
-        tk.Label(frame, text=timestamp, font=('Arial', 10, 'bold')).pack(anchor=tk.W, padx=5)
+        try:
+            thumb = tk.PhotoImage(file=str(_ensure_thumb(Path(path), self.thumb_dir)))
+        except (ImportError, OSError, tk.TclError) as e:
+            logger.debug("No thumbnail for %s: %s", path, e)
+            return None
         
-        # Path
-        path = entry.get('path', '')
-        tk.Label(frame, text=path, font=('Arial', 9)).pack(anchor=tk.W, padx=5)
+        self._thumbs.append(thumb)
+        return thumb
+    
+    @staticmethod
+    def _entry_values(entry: dict) -> Tuple[str, str, str]:
+        """Get the Treeview row values for a history entry.
         
-        # Size
-        size = entry.get('size', (0, 0))
-        tk.Label(frame, text=f"Size: {size[0]}x{size[1]}", font=('Arial', 9)).pack(anchor=tk.W, padx=5)
+        Args:
+            entry: History entry dict
+            
+        Returns:
+            Tuple of (timestamp, path, size)
+        """
+        size = entry.get('size') or (0, 0)
+        return (entry.get('timestamp', 'Unknown'), entry.get('path', ''), f"{size[0]}x{size[1]}")
 
 
 def select_region_interactive() -> Optional[Tuple[int, int, int, int]]:
@@ -3,27 +3,39 @@
 This module provides centralized logging with:
 - JSON structured logging support
 - File rotation (daily/size-based)
-- Console and file handlers
+- Console and file handlers, written from a background thread
 - Per-module log levels
 - Performance metrics logging
 - Privacy-aware logging (no PII)
 """
 
+import atexit
+import io
 import logging
 import logging.handlers
+import queue
+import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cache
+from time import perf_counter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class PrivacyFilter(logging.Filter):
     """Filter sensitive information from log messages."""
     
-    SENSITIVE_PATTERNS = [
+    SENSITIVE_PATTERNS = (
         # Email patterns
-        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
         # Phone patterns
         r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
         # Credit card patterns
@@ -32,7 +44,13 @@ class PrivacyFilter(logging.Filter):
         r'\b\d{3}-\d{2}-\d{4}\b',
         # API keys
         r'sk-[A-Za-z0-9]{48}',
-    ]
+    )
+    
+    # All patterns in one alternation, compiled once
+    _SENSITIVE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in SENSITIVE_PATTERNS))
+    
+    # Every pattern needs a digit, an "@" or "sk-": messages without any skip the full scan
+    _HINT_RE = re.compile(r'[\d@]|sk-')
     
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter and redact sensitive information.
@@ -43,11 +61,25 @@ class PrivacyFilter(logging.Filter):
         Returns:
             Always True (record is kept but may be modified)
         """
-        import re
+        # Records pass through one filter per handler; redact them only once
+        if getattr(record, '_pyshotter_redacted', False):
+            return True
+        record._pyshotter_redacted = True
+        
+        # Merge lazy %-style arguments so they are redacted too
+        if record.args:
+            try:
+                msg = record.getMessage()
+            except (TypeError, ValueError):
+                return True
+            record.args = None
+        else:
+            msg = record.msg if isinstance(record.msg, str) else str(record.msg)
         
         # Redact message
-        for pattern in self.SENSITIVE_PATTERNS:
-            record.msg = re.sub(pattern, '[REDACTED]', str(record.msg))
+        if self._HINT_RE.search(msg):
+            msg = self._SENSITIVE_RE.sub('[REDACTED]', msg)
+        record.msg = msg
         
         return True
 
@@ -65,7 +97,7 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -78,14 +110,17 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
         
-        # Add custom fields
-        if hasattr(record, 'performance_ms'):
-            log_data['performance_ms'] = record.performance_ms
+        # Add custom fields, set on the record through `extra`
+        fields = record.__dict__
+        if 'performance_ms' in fields:
+            log_data['performance_ms'] = fields['performance_ms']
         
-        if hasattr(record, 'user_id'):
-            log_data['user_id'] = record.user_id
+        if 'user_id' in fields:
+            log_data['user_id'] = fields['user_id']
         
-        return json.dumps(log_data)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_data, default=str).decode()
+        return json.dumps(log_data, separators=(',', ':'), default=str)
 
 
 class ColoredConsoleFormatter(logging.Formatter):
@@ -100,18 +135,94 @@ class ColoredConsoleFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    _COLOR_BY_LEVELNO = {
+        logging.DEBUG: COLORS['DEBUG'],
+        logging.INFO: COLORS['INFO'],
+        logging.WARNING: COLORS['WARNING'],
+        logging.ERROR: COLORS['ERROR'],
+        logging.CRITICAL: COLORS['CRITICAL'],
+    }
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors.
         
+        The record itself is left untouched, so other handlers sharing it
+        don't get escape codes.
+        
         Args:
             record: Log record to format
             
         Returns:
             Colored log string
         """
-        color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        formatted = super().format(record)
+        color = self._COLOR_BY_LEVELNO.get(record.levelno)
+        return f"{color}{formatted}{self.RESET}" if color else formatted
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler writing through a large write buffer.
+    
+    Records are not flushed one by one; the buffer reaches the disk when it
+    fills, on rollover, or when the handler is flushed or closed.
+    """
+    
+    BUFFER_SIZE = 1 << 16
+    stream: Optional[io.BufferedWriter]  # type: ignore[assignment]
+    
+    def _open(self) -> io.BufferedWriter:  # type: ignore[override]
+        """Open the log file as an unbuffered raw file behind a BufferedWriter."""
+        return io.BufferedWriter(open(self.baseFilename, 'ab', buffering=0), buffer_size=self.BUFFER_SIZE)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the buffer, rolling the file over when full.
+        
+        Args:
+            record: Log record to write
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding or 'utf-8')
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(data)
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001 - reported by handleError(), as logging handlers do
+            self.handleError(record)
+
+
+class FlushingMemoryHandler(logging.handlers.MemoryHandler):
+    """Memory handler that also flushes its target after passing on a batch."""
+    
+    def flush(self) -> None:
+        """Hand buffered records to the target and flush it."""
+        super().flush()
+        self.acquire()
+        try:
+            if self.target:
+                self.target.flush()
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        """Flush buffered records, then close the target along with this handler."""
+        target = self.target
+        try:
+            super().close()
+        finally:
+            if target is not None:
+                target.close()
+
+
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Stop a queue listener once, processing records still queued, and close its handlers."""
+    atexit.unregister(listener.stop)
+    if getattr(listener, '_thread', None) is not None:
+        listener.stop()
+    for handler in listener.handlers:
+        handler.close()
 
 
 class LoggingConfig:
@@ -145,6 +256,7 @@ class LoggingConfig:
         self.json_format = json_format
         self.max_bytes = max_bytes
         self.backup_count = backup_count
+        self.listener: Optional[logging.handlers.QueueListener] = None
         
         # Create log directory
         if self.file_output:
@@ -158,9 +270,16 @@ class LoggingConfig:
         root_logger = logging.getLogger('pyshotter')
         root_logger.setLevel(self.log_level)
         
-        # Remove existing handlers
+        # Remove existing handlers, stopping the listener of a previous configuration
+        for handler in root_logger.handlers:
+            listener = getattr(handler, 'listener', None)
+            if isinstance(listener, logging.handlers.QueueListener):
+                _stop_listener(listener)
+            handler.close()
         root_logger.handlers.clear()
         
+        handlers: List[logging.Handler] = []
+        
         # Console handler
         if self.console_output:
             console_handler = logging.StreamHandler(sys.stdout)
@@ -171,13 +290,13 @@ class LoggingConfig:
             )
             console_handler.setFormatter(console_formatter)
             console_handler.addFilter(PrivacyFilter())
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # File handler with rotation
         if self.file_output:
             log_file = self.log_dir / "pyshotter.log"
             
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = BufferedRotatingFileHandler(
                 log_file,
                 maxBytes=self.max_bytes,
                 backupCount=self.backup_count,
@@ -194,7 +313,26 @@ class LoggingConfig:
             
             file_handler.setFormatter(file_formatter)
             file_handler.addFilter(PrivacyFilter())
-            root_logger.addHandler(file_handler)
+            
+            # Batch records in memory; warnings and errors are written at once
+            memory_handler = FlushingMemoryHandler(
+                capacity=512,
+                flushLevel=logging.WARNING,
+                target=file_handler,
+            )
+            memory_handler.setLevel(self.log_level)
+            handlers.append(memory_handler)
+        
+        # Logging calls only enqueue records: formatting, filtering and I/O
+        # happen on the listener's background thread
+        if handlers:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            self.listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.listener = self.listener  # type: ignore[attr-defined]
+            root_logger.addHandler(queue_handler)
+            self.listener.start()
+            atexit.register(self.listener.stop)
         
         # Set up module-specific loggers
         self._configure_module_loggers()
@@ -206,7 +344,14 @@ class LoggingConfig:
         logging.getLogger('matplotlib').setLevel(logging.WARNING)
         logging.getLogger('urllib3').setLevel(logging.WARNING)
     
+    def shutdown(self) -> None:
+        """Flush pending records and stop the background logging thread."""
+        if self.listener is not None:
+            _stop_listener(self.listener)
+            self.listener = None
+    
     @staticmethod
+    @cache
     def get_logger(name: str) -> logging.Logger:
         """Get logger for specific module.
         
@@ -236,24 +381,23 @@ class PerformanceLogger:
     
     def __enter__(self):
         """Start performance measurement."""
-        import time
-        self.start_time = time.perf_counter()
-        self.logger.debug(f"Starting: {self.operation}")
+        self.start_time = perf_counter()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Starting: %s", self.operation)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Log performance metrics."""
-        import time
-        duration_ms = (time.perf_counter() - self.start_time) * 1000
+        duration_ms = (perf_counter() - self.start_time) * 1000
         
         if exc_type is None:
             self.logger.info(
-                f"Completed: {self.operation}",
+                "Completed: %s", self.operation,
                 extra={'performance_ms': duration_ms}
             )
         else:
             self.logger.error(
-                f"Failed: {self.operation} after {duration_ms:.2f}ms",
+                "Failed: %s after %.2fms", self.operation, duration_ms,
                 extra={'performance_ms': duration_ms}
             )
 
@@ -285,6 +429,7 @@ def setup_logging(
     )
 
 
+@cache
 def get_logger(name: str) -> logging.Logger:
     """Get logger instance with automatic configuration.
     
@@ -2,9 +2,16 @@
 Source: https://github.com/utachicodes/pyshotter.
 """
 
-from typing import Any, NamedTuple
+from typing import Any, NamedTuple, TypedDict
+
+
+class Monitor(TypedDict):
+    left: int
+    top: int
+    width: int
+    height: int
+
 
-Monitor = dict[str, int]
 Monitors = list[Monitor]
 
 Pixel = tuple[int, int, int]
@@ -8,12 +8,16 @@ This module provides enterprise-grade screen recording with:
 - Region-specific recording
 """
 
+import os
+import subprocess
 import time
+import tempfile
 import threading
 import queue
 from pathlib import Path
-from typing import Optional, Callable, Tuple, Literal, Dict
+from typing import TYPE_CHECKING, IO, Optional, Callable, Tuple, Literal, Dict, List, Generator
 from datetime import datetime
+from functools import cache
 import shutil
 
 try:
@@ -22,26 +26,247 @@ try:
 except ImportError:
     IMAGEIO_AVAILABLE = False
 
+try:
+    import imageio_ffmpeg  # type: ignore[import-untyped]
+    IMAGEIO_FFMPEG_AVAILABLE = True
+except ImportError:
+    IMAGEIO_FFMPEG_AVAILABLE = False
+
 try:
     import numpy as np
     NUMPY_AVAILABLE = True
 except ImportError:
     NUMPY_AVAILABLE = False
 
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
 from .exception import RecordingError, DependencyError
 from .logging_config import get_logger, PerformanceLogger
 
+if TYPE_CHECKING:
+    from PIL import Image as PILImage
+
 logger = get_logger(__name__)
 
+# Hardware H.264 encoders, in order of preference
+HARDWARE_H264_ENCODERS = ('h264_nvenc', 'h264_videotoolbox')
+
+
+@cache
+def _hardware_h264_encoder() -> Optional[str]:
+    """Find a hardware H.264 encoder usable on this machine.
+    
+    Each candidate encodes a single test frame, since ffmpeg builds list
+    encoders whose hardware or driver is missing.
+    
+    Returns:
+        ffmpeg encoder name, or None to use libx264
+    """
+    ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    for codec in HARDWARE_H264_ENCODERS:
+        try:
+            result = subprocess.run(
+                [
+                    ffmpeg, '-hide_banner', '-loglevel', 'error',
+                    '-f', 'lavfi', '-i', 'color=size=256x256',
+                    '-frames:v', '1', '-c:v', codec, '-f', 'null', '-',
+                ],
+                capture_output=True,
+                check=False,
+                timeout=10,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0:
+            logger.info("Using hardware encoder: %s", codec)
+            return codec
+    return None
+
+
+def _encoder_params(codec: str, quality: int) -> List[str]:
+    """Build ffmpeg rate control options for a hardware encoder.
+    
+    Args:
+        codec: Hardware encoder name
+        quality: imageio quality (0-10)
+        
+    Returns:
+        ffmpeg output parameters
+    """
+    if codec == 'h264_nvenc':
+        # Same constant quality scale as libx264's CRF
+        return ['-preset', 'p1', '-rc', 'vbr', '-cq', str(int((1 - quality / 10) * 51))]
+    return ['-q:v', str(quality * 10)]
+
+
+class _BgraVideoWriter:
+    """Stream raw BGRA frames to ffmpeg, which converts them to YUV itself.
+    
+    The ffmpeg process is started on the first frame, once its size is known.
+    Encoding runs on a hardware encoder when one is available.
+    """
+    
+    def __init__(self, path: str, fps: int, quality: int, codec: Optional[str] = None):
+        self.path = path
+        self.fps = fps
+        self.quality = quality
+        # Without an explicit codec, probe for a hardware H.264 encoder
+        self.codec = codec or _hardware_h264_encoder() or 'libx264'
+        self._gen: Optional[Generator[None, Optional[np.ndarray], None]] = None
+    
+    def _start(self, width: int, height: int):
+        """Start ffmpeg for frames of the given size."""
+        if self.codec == 'libx264':
+            quality, output_params = self.quality, None
+        else:
+            quality, output_params = None, _encoder_params(self.codec, self.quality)
+        return imageio_ffmpeg.write_frames(
+            self.path,
+            (width, height),
+            pix_fmt_in='bgra',
+            pix_fmt_out='yuv420p',
+            fps=self.fps,
+            codec=self.codec,
+            quality=quality,
+            output_params=output_params,
+        )
+    
+    def append_data(self, frame: 'np.ndarray') -> None:
+        """Write a (height, width, 4) BGRA frame."""
+        if self._gen is None:
+            height, width = frame.shape[:2]
+            self._gen = self._start(width, height)
+            self._gen.send(None)  # Start ffmpeg
+        self._gen.send(frame)
+    
+    def close(self) -> None:
+        """Flush the encoder and wait for ffmpeg to exit."""
+        if self._gen is not None:
+            gen, self._gen = self._gen, None
+            gen.close()
+
+
+class _BgraGifWriter(_BgraVideoWriter):
+    """Stream raw BGRA frames to ffmpeg's GIF encoder.
+    
+    ffmpeg computes a new palette from one frame in every PALETTE_INTERVAL
+    seconds, then writes each frame as the rectangle that changed over the
+    previous one.
+    """
+    
+    # A palette built over all frames is only emitted at the end of the
+    # stream, so ffmpeg would keep the whole recording in memory; one frame
+    # per interval keeps memory bounded, and is cheap enough for real time
+    PALETTE_INTERVAL = 1.0
+    
+    def __init__(self, path: str, fps: int):
+        super().__init__(path, fps, quality=0, codec='gif')
+    
+    def _start(self, width: int, height: int):
+        """Start ffmpeg for frames of the given size."""
+        every = max(1, round(self.fps * self.PALETTE_INTERVAL))
+        # Screencasts change little between frames: only remap the rectangle
+        # that differs from the previous frame
+        graph = (
+            f"split[a][b];[a]select='not(mod(n\\,{every}))',palettegen=stats_mode=single[p];"
+            '[b][p]paletteuse=new=1:diff_mode=rectangle'
+        )
+        return imageio_ffmpeg.write_frames(
+            self.path,
+            (width, height),
+            # The alpha byte of captured frames is not meaningful
+            pix_fmt_in='bgr0',
+            pix_fmt_out='pal8',
+            fps=self.fps,
+            codec='gif',
+            quality=None,
+            macro_block_size=1,
+            output_params=['-vf', graph],
+        )
+
+
+class _PaletteGifWriter:
+    """Stream RGB frames to an animated GIF sharing one palette.
+    
+    The file is opened and the palette computed on the first frame; later
+    frames are mapped onto that palette and only the rectangle that changed
+    since the previous frame is written, drawn over the kept previous frame.
+    """
+    
+    def __init__(self, path: str, fps: int):
+        from PIL import GifImagePlugin, Image
+        
+        self._Image = Image
+        self._gif = GifImagePlugin
+        self.path = path
+        self._fp: Optional[IO[bytes]] = None
+        self._duration = round(1000 / fps)
+        self._palette: Optional[PILImage.Image] = None
+        self._previous: Optional[np.ndarray] = None
+    
+    def append_data(self, frame: 'np.ndarray') -> None:
+        """Write a (height, width, 3) RGB frame."""
+        Image = self._Image
+        
+        if self._previous is None:
+            image = Image.fromarray(frame).quantize(256, method=Image.Quantize.MEDIANCUT)
+            # Spare entries get a color cube, so content that appears later
+            # still finds a close color
+            used = max(index for _, index in image.getcolors(256)) + 1
+            palette = image.getpalette()[:used * 3]
+            spare = 256 - used
+            if spare:
+                levels = range(0, 256, 51)
+                cube = [(r, g, b) for r in levels for g in levels for b in levels]
+                for color in cube[::max(1, len(cube) // spare)][:spare]:
+                    palette.extend(color)
+                image.putpalette(palette)
+            header, _ = self._gif.getheader(image, info={'loop': 0, 'duration': self._duration})
+            self._fp = open(self.path, 'wb')  # noqa: SIM115 - kept open until close()
+            self._fp.write(b''.join(header))
+            self._palette = image
+            self._previous = frame.copy()
+            offset = (0, 0)
+        else:
+            changed = np.any(frame != self._previous, axis=-1)
+            rows = np.flatnonzero(changed.any(axis=1))
+            cols = np.flatnonzero(changed.any(axis=0))
+            if rows.size:
+                top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+                np.copyto(self._previous[top:bottom, left:right], frame[top:bottom, left:right])
+            else:
+                # Nothing changed: a single pixel keeps the frame's timing
+                top, bottom, left, right = 0, 1, 0, 1
+            patch = Image.fromarray(frame[top:bottom, left:right])
+            image = patch.quantize(palette=self._palette, dither=Image.Dither.NONE)
+            offset = (int(left), int(top))
+        
+        for data in self._gif.getdata(image, offset, duration=self._duration, disposal=1):
+            self._fp.write(data)  # type: ignore[union-attr]  # Opened on the first frame
+    
+    def close(self) -> None:
+        """Write the GIF trailer and close the file."""
+        if self._fp is not None and not self._fp.closed:
+            self._fp.write(b';')
+            self._fp.close()
+
 
 class ScreenRecordingFeature:
     """Enterprise-grade screen recording with optimization."""
     
+    # Frames buffered between capture and encoding, nearly 2 seconds at 30fps
+    FRAME_POOL_SIZE = 54
+    
     def __init__(
         self,
         fps: int = 30,
         quality: Literal['low', 'medium', 'high', 'lossless'] = 'high',
         format: Literal['gif', 'mp4'] = 'gif',
+        scale: float = 1.0,
     ):
         """Initialize screen recorder.
         
@@ -49,6 +274,7 @@ class ScreenRecordingFeature:
             fps: Frames per second (1-60)
             quality: Recording quality
             format: Output format
+            scale: Recording resolution relative to the screen (0-1]
             
         Raises:
             DependencyError: If required libraries aren't installed
@@ -64,16 +290,20 @@ class ScreenRecordingFeature:
         if not 1 <= fps <= 60:
             raise RecordingError(f"FPS must be between 1 and 60, got {fps}")
         
+        if not 0 < scale <= 1:
+            raise RecordingError(f"Scale must be between 0 and 1, got {scale}")
+        
         self.fps = fps
         self.quality = quality
         self.format = format
+        self.scale = scale
         self.frame_delay = 1.0 / fps
         
         # Recording state
         self._recordings: Dict[str, Dict] = {}
         self._next_id = 0
         
-        logger.info(f"Initialized recorder: fps={fps}, quality={quality}, format={format}")
+        logger.info("Initialized recorder: fps=%s, quality=%s, format=%s, scale=%s", fps, quality, format, scale)
     
     def record(
         self,
@@ -98,7 +328,7 @@ class ScreenRecordingFeature:
         """
         recording_id = None
         try:
-            logger.info(f"Starting recording: duration={duration}s, output={output}")
+            logger.info("Starting recording: duration=%ss, output=%s", duration, output)
             
             # Start recording
             recording_id = self.start_recording(
@@ -113,13 +343,13 @@ class ScreenRecordingFeature:
             # Stop and save
             output_path = self.stop_recording(recording_id, output)
             
-            logger.info(f"Recording completed: {output_path}")
+            logger.info("Recording completed: %s", output_path)
             return output_path
             
         except Exception as e:
             if recording_id:
                 self._cleanup_recording(recording_id)
-            logger.error(f"Recording failed: {e}")
+            logger.error("Recording failed: %s", e)
             raise RecordingError(f"Recording failed: {e}", recording_id=recording_id)
     
     def start_recording(
@@ -149,22 +379,54 @@ class ScreenRecordingFeature:
             recording_id = f"rec_{self._next_id}"
             self._next_id += 1
             
+            # Frames are encoded as they are captured, into a temporary file
+            # moved to the final output when the recording stops
+            fd, tmp_path = tempfile.mkstemp(prefix='pyshotter_', suffix=f'.{self.format}')
+            os.close(fd)
+            try:
+                writer = self._open_writer(tmp_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            
             # Create recording state
             recording = {
                 'id': recording_id,
                 'region': region,
-                'frames': [],
-                'start_time': time.time(),
+                'writer': writer,
+                'tmp_path': tmp_path,
+                'frame_count': 0,
+                'start_ns': time.monotonic_ns(),
                 'max_duration': max_duration,
                 'progress_callback': progress_callback,
                 'stop_event': threading.Event(),
                 'pause_event': threading.Event(),
-                'frame_queue': queue.Queue(maxsize=60),  # Buffer up to 2 seconds at 30fps
+                # Set once the first frame is queued
+                'frame_captured': threading.Event(),
+                # Single producer, single consumer: SimpleQueue puts never take
+                # a condition lock, and the frame pool bounds its length
+                'frame_queue': queue.SimpleQueue(),
+                'frame_pool': None,
+                'free_slots': queue.SimpleQueue(),
+                'encode_error': None,
+                'dropped_frames': 0,
                 'overlay_text': None,
+                'overlay': None,
+                # MP4 frames stay BGRA, converted by ffmpeg's swscale
+                'bgra_frames': isinstance(writer, _BgraVideoWriter),
             }
             
             self._recordings[recording_id] = recording
             
+            # Start encoder thread, consuming the frames queued by the capture thread
+            encode_thread = threading.Thread(
+                target=self._encode_loop,
+                args=(recording,),
+                daemon=True
+            )
+            encode_thread.start()
+            recording['encode_thread'] = encode_thread
+            
             # Start capture thread
             capture_thread = threading.Thread(
                 target=self._capture_loop,
@@ -174,11 +436,11 @@ class ScreenRecordingFeature:
             capture_thread.start()
             recording['capture_thread'] = capture_thread
             
-            logger.info(f"Started recording: {recording_id}")
+            logger.info("Started recording: %s", recording_id)
             return recording_id
             
         except Exception as e:
-            logger.error(f"Failed to start recording: {e}")
+            logger.error("Failed to start recording: %s", e)
             raise RecordingError(f"Failed to start recording: {e}")
     
     def stop_recording(self, recording_id: str, output: Optional[str] = None) -> str:
@@ -199,14 +461,30 @@ class ScreenRecordingFeature:
         
         try:
             recording = self._recordings[recording_id]
-            logger.info(f"Stopping recording: {recording_id}")
+            logger.info("Stopping recording: %s", recording_id)
             
             # Signal stop
             recording['stop_event'].set()
             
-            # Wait for capture thread
+            # Wait for capture thread, then for the encoder to drain the queue
             if 'capture_thread' in recording:
                 recording['capture_thread'].join(timeout=5.0)
+                if recording['capture_thread'].is_alive():
+                    # Capture is stuck in a grab: end the encoder's queue in its place
+                    recording['frame_queue'].put(None)
+            if 'encode_thread' in recording:
+                recording['encode_thread'].join(timeout=5.0)
+            
+            stuck = [
+                name for name in ('capture_thread', 'encode_thread')
+                if name in recording and recording[name].is_alive()
+            ]
+            if stuck:
+                self._cleanup_recording(recording_id)
+                raise RecordingError(
+                    f"Recording did not stop: {', '.join(stuck)} still running",
+                    recording_id=recording_id,
+                )
             
             # Generate output path if not provided
             if output is None:
@@ -219,11 +497,13 @@ class ScreenRecordingFeature:
             # Cleanup
             self._cleanup_recording(recording_id)
             
-            logger.info(f"Recording saved: {output_path}")
+            logger.info("Recording saved: %s", output_path)
             return output_path
             
+        except RecordingError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to stop recording: {e}")
+            logger.error("Failed to stop recording: %s", e)
             raise RecordingError(f"Failed to stop recording: {e}", recording_id=recording_id)
     
     def pause_recording(self, recording_id: str) -> None:
@@ -234,7 +514,7 @@ class ScreenRecordingFeature:
         """
         if recording_id in self._recordings:
             self._recordings[recording_id]['pause_event'].set()
-            logger.info(f"Paused recording: {recording_id}")
+            logger.info("Paused recording: %s", recording_id)
 
     def resume_recording(self, recording_id: str) -> None:
         """Resume recording.
@@ -244,7 +524,7 @@ class ScreenRecordingFeature:
         """
         if recording_id in self._recordings:
             self._recordings[recording_id]['pause_event'].clear()
-            logger.info(f"Resumed recording: {recording_id}")
+            logger.info("Resumed recording: %s", recording_id)
 
     def set_overlay(self, recording_id: str, text: Optional[str]) -> None:
         """Set watermark overlay for recording.
@@ -254,8 +534,11 @@ class ScreenRecordingFeature:
             text: Watermark text (None to disable)
         """
         if recording_id in self._recordings:
-            self._recordings[recording_id]['overlay_text'] = text
-            logger.info(f"Set overlay for {recording_id}: {text}")
+            recording = self._recordings[recording_id]
+            recording['overlay_text'] = text
+            # Rasterized once here; frames only get the sprite blended in
+            recording['overlay'] = self._render_overlay(text) if text else None
+            logger.info("Set overlay for %s: %s", recording_id, text)
     
     def _capture_loop(self, recording_id: str) -> None:
         """Background loop to capture frames.
@@ -264,32 +547,78 @@ class ScreenRecordingFeature:
             recording_id: Recording ID
         """
         recording = self._recordings[recording_id]
+        frame_queue = recording['frame_queue']
         stop_event = recording['stop_event']
-        start_time = recording['start_time']
+        pause_event = recording['pause_event']
+        frame_captured = recording['frame_captured']
+        start_ns = recording['start_ns']
         max_duration = recording['max_duration']
+        max_ns = max_duration * 1_000_000_000
+        frame_delay_ns = 1_000_000_000 // self.fps
         callback = recording['progress_callback']
+        bgra_frames = recording['bgra_frames']
+        
+        # The user callback runs on its own thread so it can't stall capture
+        progress_queue: Optional[queue.SimpleQueue] = None
+        if callback:
+            progress_queue = queue.SimpleQueue()
+            threading.Thread(
+                target=self._progress_loop,
+                args=(progress_queue, callback, max_duration),
+                daemon=True
+            ).start()
         
         frame_count = 0
+        dropped_frames = 0
+        
+        # Frames are converted into a pool of reusable buffers; the queue only
+        # carries slot indexes. With every slot in use, captures are dropped
+        # rather than queued.
+        free_slots = recording['free_slots']
+        pool_size = self.FRAME_POOL_SIZE
+        for slot in range(pool_size):
+            free_slots.put(slot)
+        pool = None
         
         try:
             from .factory import pyshotter
             
             with pyshotter() as sct:
+                next_deadline = time.monotonic_ns()
                 while not stop_event.is_set():
-                    loop_start = time.time()
-                    
                     # Check max duration
-                    elapsed = time.time() - start_time
-                    if elapsed >= max_duration:
-                        logger.warning(f"Max duration reached: {max_duration}s")
+                    now = time.monotonic_ns()
+                    elapsed_ns = now - start_ns
+                    if elapsed_ns >= max_ns:
+                        logger.warning("Max duration reached: %ss", max_duration)
                         break
                     
                     # Capture frame
                     try:
                         if pause_event.is_set():
-                            time.sleep(0.1)
+                            # Restart the schedule on resume rather than
+                            # counting the pause as missed frames
+                            stop_event.wait(0.1)
+                            next_deadline = time.monotonic_ns()
                             continue
 
+                        # More than two frames late: skip the missed slots instead
+                        # of capturing them back to back
+                        behind = now - next_deadline
+                        if behind > 2 * frame_delay_ns:
+                            missed = behind // frame_delay_ns
+                            dropped_frames += missed
+                            next_deadline += missed * frame_delay_ns
+                        
+                        try:
+                            slot = free_slots.get_nowait()
+                        except queue.Empty:
+                            dropped_frames += 1
+                            recording['dropped_frames'] = dropped_frames
+                            next_deadline += frame_delay_ns
+                            stop_event.wait(max(0, next_deadline - time.monotonic_ns()) / 1e9)
+                            continue
+                        
                         if recording['region']:
                             x, y, w, h = recording['region']
                             monitor = {'left': x, 'top': y, 'width': w, 'height': h}
@@ -298,36 +627,150 @@ class ScreenRecordingFeature:
                         
                         screenshot = sct.grab(monitor)
                         
-                        # Convert to numpy array for imageio
-                        img_array = np.frombuffer(screenshot.rgb, dtype=np.uint8)
-                        img_array = img_array.reshape(screenshot.height, screenshot.width, 3).copy()
+                        if pool is None:
+                            shape = (
+                                max(1, round(screenshot.height * self.scale)),
+                                max(1, round(screenshot.width * self.scale)),
+                                4 if bgra_frames else 3,
+                            )
+                            pool = [np.empty(shape, dtype=np.uint8) for _ in range(pool_size)]
+                            recording['frame_pool'] = pool
                         
-                        # Apply overlay if set
-                        if recording['overlay_text']:
-                            img_array = self._apply_overlay(img_array, recording['overlay_text'])
-
-                        recording['frames'].append(img_array)
+                        if self.scale < 1:
+                            self._downscale_into(screenshot, pool[slot])
+                        else:
+                            # Copy into the pooled frame: raw BGRA for ffmpeg, or
+                            # converted to RGB in the same pass for imageio
+                            np.copyto(pool[slot], screenshot.bgra_array if bgra_frames else screenshot.rgb_array)
+                        
+                        frame_queue.put(slot)
                         frame_count += 1
+                        if frame_count == 1:
+                            frame_captured.set()
+                        recording['dropped_frames'] = dropped_frames
                         
                         # Progress callback
-                        if callback and frame_count % 10 == 0:  # Every 10 frames
-                            eta = (max_duration - elapsed) if max_duration < float('inf') else 0
-                            callback(frame_count, elapsed, eta)
+                        if progress_queue is not None and frame_count % 10 == 0:  # Every 10 frames
+                            progress_queue.put((frame_count, elapsed_ns))
                         
                     except Exception as e:
-                        logger.error(f"Frame capture failed: {e}")
+                        logger.error("Frame capture failed: %s", e)
                         break
                     
-                    # Maintain FPS
-                    loop_time = time.time() - loop_start
-                    sleep_time = max(0, self.frame_delay - loop_time)
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
+                    # Maintain FPS on a fixed schedule; a stop request wakes the wait
+                    next_deadline += frame_delay_ns
+                    stop_event.wait(max(0, next_deadline - time.monotonic_ns()) / 1e9)
             
-            logger.info(f"Capture loop finished: {frame_count} frames")
+            logger.info("Capture loop finished: %s frames, %s dropped", frame_count, dropped_frames)
             
         except Exception as e:
-            logger.error(f"Capture loop error: {e}")
+            logger.error("Capture loop error: %s", e)
+        finally:
+            # Tell the encoder no more frames are coming
+            frame_queue.put(None)
+            if progress_queue is not None:
+                progress_queue.put(None)
+    
+    @staticmethod
+    def _downscale_into(screenshot, out: 'np.ndarray') -> None:
+        """Downscale a capture into a frame, converting it to the frame's channels.
+        
+        Args:
+            screenshot: Captured ScreenShot
+            out: BGRA or RGB frame of the target size
+        """
+        height, width, channels = out.shape
+        if OPENCV_AVAILABLE:
+            small = cv2.resize(screenshot.bgra_array, (width, height), interpolation=cv2.INTER_AREA)
+            if channels == 4:
+                np.copyto(out, small)
+            else:
+                cv2.cvtColor(small, cv2.COLOR_BGRA2RGB, dst=out)
+            return
+        
+        from PIL import Image
+        
+        # Pillow only reorders channels on load: keep BGRA as is, or read it as
+        # RGB. Alpha is ignored, so it must not weight the resampling.
+        mode, rawmode = ('RGBX', 'RGBX') if channels == 4 else ('RGB', 'BGRX')
+        img = Image.frombuffer(mode, screenshot.size, screenshot.raw, 'raw', rawmode, 0, 1)
+        np.copyto(out, np.asarray(img.resize((width, height), Image.Resampling.BOX)))
+    
+    @staticmethod
+    def _progress_loop(
+        progress_queue: queue.SimpleQueue,
+        callback: Callable[[int, float, float], None],
+        max_duration: float,
+    ) -> None:
+        """Background loop reporting capture progress to the user callback.
+        
+        Args:
+            progress_queue: Queue of (frame_count, elapsed_ns) tuples, ended by None
+            callback: Progress callback(frame_count, elapsed, eta)
+            max_duration: Maximum recording duration
+        """
+        while True:
+            item = progress_queue.get()
+            if item is None:
+                break
+            
+            frame_count, elapsed_ns = item
+            elapsed = elapsed_ns / 1e9
+            eta = (max_duration - elapsed) if max_duration < float('inf') else 0
+            try:
+                callback(frame_count, elapsed, eta)
+            except Exception:
+                logger.exception("Progress callback failed")
+    
+    def _encode_loop(self, recording: Dict) -> None:
+        """Background loop writing queued frames to the encoder.
+        
+        Args:
+            recording: Recording state dict
+        """
+        frame_queue = recording['frame_queue']
+        writer = recording['writer']
+        
+        free_slots = recording['free_slots']
+        
+        while True:
+            slot = frame_queue.get()
+            if slot is None:
+                break
+            
+            try:
+                # Keep draining after a failure so the capture thread never blocks
+                if recording['encode_error'] is not None:
+                    continue
+                
+                self._encode_frame(writer, recording['frame_pool'][slot], recording['overlay'])
+                recording['frame_count'] += 1
+            except Exception as e:
+                logger.exception("Frame encoding failed")
+                recording['encode_error'] = e
+            finally:
+                # The writer has consumed the frame: hand the buffer back
+                free_slots.put(slot)
+    
+    def _encode_frame(
+        self,
+        writer,
+        img_array: 'np.ndarray',
+        overlay: Optional[Tuple[int, int, 'np.ndarray', 'np.ndarray']] = None,
+    ) -> None:
+        """Blend the overlay into a frame and hand it to the encoder.
+        
+        Args:
+            writer: Frame writer returned by _open_writer()
+            img_array: RGB or BGRA frame, modified in place by the overlay
+            overlay: Pre-rendered overlay, if any
+        """
+        if overlay is not None:
+            # The sprite is RGB: blend BGRA frames through a reversed view
+            rgb_view = img_array[:, :, 2::-1] if img_array.shape[2] == 4 else img_array
+            self._blend_overlay(rgb_view, overlay)
+        
+        writer.append_data(img_array)
     
     def _save_recording(self, recording: Dict, output: str) -> str:
         """Save recording to file.
@@ -339,39 +782,56 @@ class ScreenRecordingFeature:
         Returns:
             Path to saved file
         """
-        frames = recording['frames']
+        frame_count = recording['frame_count']
+        
+        if recording.get('encode_error') is not None:
+            raise RecordingError(f"Failed to save recording: {recording['encode_error']}")
         
-        if not frames:
+        if not frame_count:
             raise RecordingError("No frames captured")
         
-        logger.info(f"Saving {len(frames)} frames to {output}")
+        logger.info("Saving %s frames to %s", frame_count, output)
         
-        with PerformanceLogger(logger, f"save recording ({len(frames)} frames)"):
+        with PerformanceLogger(logger, f"finish recording ({frame_count} frames)"):
             try:
-                if self.format == 'gif':
-                    # Save as GIF with optimization
-                    imageio.mimsave(
-                        output,
-                        frames,
-                        format='GIF',
-                        fps=self.fps,
-                        loop=0,  # Infinite loop
-                    )
-                else:  # mp4
-                    # Save as MP4
-                    imageio.mimsave(
-                        output,
-                        frames,
-                        format='MP4',
-                        fps=self.fps,
-                        codec='libx264',
-                        quality=8 if self.quality == 'high' else 5,
-                    )
-                
-                return str(Path(output).absolute())
-                
+                # Flushes the frames still buffered by the encoder
+                recording['writer'].close()
             except Exception as e:
                 raise RecordingError(f"Failed to save recording: {e}")
+        
+        try:
+            shutil.move(recording['tmp_path'], output)
+        except OSError as e:
+            raise RecordingError(f"Failed to save recording: {e}")
+        
+        return str(Path(output).absolute())
+    
+    def _open_writer(self, path: str):
+        """Open a streaming imageio writer for the recording format.
+        
+        Args:
+            path: Output path
+            
+        Returns:
+            Writer accepting frames through append_data(): BGRA frames when
+            imageio-ffmpeg is available, RGB frames otherwise
+        """
+        if self.format == 'gif':
+            if IMAGEIO_FFMPEG_AVAILABLE:
+                return _BgraGifWriter(path, self.fps)
+            return _PaletteGifWriter(path, self.fps)
+        
+        # Save as MP4
+        quality = 8 if self.quality == 'high' else 5
+        if IMAGEIO_FFMPEG_AVAILABLE:
+            return _BgraVideoWriter(path, self.fps, quality)
+        return imageio.get_writer(
+            path,
+            format='MP4',
+            fps=self.fps,
+            codec='libx264',
+            quality=quality,
+        )
     
     def _check_disk_space(self, required_gb: float = 1.0) -> bool:
         """Check if sufficient disk space is available.
@@ -397,28 +857,68 @@ class ScreenRecordingFeature:
         """
         if recording_id in self._recordings:
             recording = self._recordings[recording_id]
-            # Clear frames to free memory
-            if 'frames' in recording:
-                recording['frames'].clear()
+            # Close the encoder and drop its temporary file if it wasn't saved
+            try:
+                recording['writer'].close()
+            except Exception:
+                logger.exception("Failed to close the encoder of recording %s", recording_id)
+            if os.path.exists(recording['tmp_path']):
+                os.unlink(recording['tmp_path'])
             del self._recordings[recording_id]
-            logger.debug(f"Cleaned up recording: {recording_id}")
+            logger.debug("Cleaned up recording: %s", recording_id)
 
-    def _apply_overlay(self, img_array: np.ndarray, text: str) -> np.ndarray:
-        """Apply simple text watermark to frame."""
+    def _render_overlay(self, text: str) -> Optional[Tuple[int, int, 'np.ndarray', 'np.ndarray']]:
+        """Rasterize a text watermark into a blendable sprite.
+        
+        Args:
+            text: Watermark text
+            
+        Returns:
+            Tuple of (x, y) offsets from the bottom-right corner of the frame,
+            inverse alpha and premultiplied RGB, or None if rendering fails
+        """
         try:
             from PIL import Image, ImageDraw, ImageFont
-            img = Image.fromarray(img_array)
-            draw = ImageDraw.Draw(img)
             
-            # Simple watermark bottom-right
-            h, w = img_array.shape[:2]
             try:
                 font = ImageFont.truetype("arial.ttf", 20)
             except:
                 font = ImageFont.load_default()
-                
-            draw.text((w - 150, h - 30), text, fill=(255, 255, 255), font=font)
-            return np.array(img)
+            
+            bbox = ImageDraw.Draw(Image.new('RGBA', (1, 1))).textbbox((0, 0), text, font=font)
+            left, top, right, bottom = (int(v) for v in bbox)
+            sprite = Image.new('RGBA', (max(right - left, 1), max(bottom - top, 1)), (0, 0, 0, 0))
+            ImageDraw.Draw(sprite).text((-left, -top), text, fill=(255, 255, 255, 255), font=font)
+            
+            rgba = np.asarray(sprite, dtype=np.float32)
+            alpha = rgba[:, :, 3:] / 255.0
+            
+            # Simple watermark bottom-right
+            return 150 - left, 30 - top, 1.0 - alpha, rgba[:, :, :3] * alpha
         except Exception as e:
-            logger.warning(f"Failed to apply overlay: {e}")
-            return img_array
+            logger.warning("Failed to apply overlay: %s", e)
+            return None
+    
+    @staticmethod
+    def _blend_overlay(img_array: 'np.ndarray', overlay: Tuple[int, int, 'np.ndarray', 'np.ndarray']) -> None:
+        """Alpha-blend a rendered watermark into a frame, in place.
+        
+        Args:
+            img_array: RGB frame
+            overlay: Sprite from _render_overlay()
+        """
+        offset_x, offset_y, inv_alpha, premul = overlay
+        h, w = img_array.shape[:2]
+        sprite_h, sprite_w = inv_alpha.shape[:2]
+        
+        # Clip the sprite to the frame
+        x0, y0 = w - offset_x, h - offset_y
+        x1, y1 = min(x0 + sprite_w, w), min(y0 + sprite_h, h)
+        sx0, sy0 = max(-x0, 0), max(-y0, 0)
+        x0, y0 = max(x0, 0), max(y0, 0)
+        if x1 <= x0 or y1 <= y0:
+            return
+        
+        sy1, sx1 = sy0 + (y1 - y0), sx0 + (x1 - x0)
+        region = img_array[y0:y1, x0:x1]
+        region[:] = region * inv_alpha[sy0:sy1, sx0:sx1] + premul[sy0:sy1, sx0:sx1]
@@ -12,6 +12,54 @@ from mss.models import Monitor, Pixel, Pixels, Pos, Size
 if TYPE_CHECKING:  # pragma: nocover
     from collections.abc import Iterator
 
+def _bgra_to_rgb_opencv(data: bytearray, size: Size, /) -> bytes:
+    """Convert BGRA pixels to RGB with OpenCV's SIMD color conversion."""
+    import cv2
+    import numpy as np
+
+    width, height = size
+    return cv2.cvtColor(np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4), cv2.COLOR_BGRA2RGB).tobytes()
+
+
+def _bgra_to_rgb_pil(data: bytearray, size: Size, /) -> bytes:
+    """Convert BGRA pixels to RGB with Pillow's C unpacker, in a single pass."""
+    from PIL import Image
+
+    return Image.frombuffer("RGB", size, data, "raw", "BGRX", 0, 1).tobytes()  # type: ignore[arg-type]
+
+
+#: Native BGRA to RGB converter, chosen on first use; False when none is installed.
+_CONVERTER: Any = None
+
+
+def _bgra_to_rgb_native(data: bytearray, size: Size, /) -> bytes | None:
+    """Convert BGRA pixels to RGB with the fastest available native library.
+
+    OpenCV is preferred over Pillow: its conversion is vectorized.
+
+    :return bytes: RGB pixels, or None if neither library is available.
+    """
+    global _CONVERTER
+
+    if _CONVERTER is None:
+        try:
+            import cv2  # noqa: F401
+            import numpy  # noqa: F401
+        except ImportError:
+            try:
+                from PIL import Image  # noqa: F401
+            except ImportError:
+                _CONVERTER = False
+            else:
+                _CONVERTER = _bgra_to_rgb_pil
+        else:
+            _CONVERTER = _bgra_to_rgb_opencv
+
+    # Malformed buffers are left to the pure Python path and its error
+    if not _CONVERTER or len(data) != size[0] * size[1] * 4:
+        return None
+    return _CONVERTER(data, size)
+
 
 class ScreenShot:
     """Screenshot object.
@@ -22,9 +70,10 @@ class ScreenShot:
         with PIL.Image, it has been decided to use *ScreenShot*.
     """
 
-    __slots__ = {"__pixels", "__rgb", "pos", "raw", "size"}
+    __slots__ = {"__bgra_array", "__pixels", "__rgb", "pos", "raw", "size"}
 
     def __init__(self, data: bytearray, monitor: Monitor, /, *, size: Size | None = None) -> None:
+        self.__bgra_array: Any = None
         self.__pixels: Pixels | None = None
         self.__rgb: bytes | None = None
 
@@ -61,11 +110,87 @@ class ScreenShot:
         monitor = {"left": 0, "top": 0, "width": width, "height": height}
         return cls(data, monitor)
 
+    @classmethod
+    def from_rgb(cls: type[ScreenShot], rgb: Any, size: tuple[int, int], pos: tuple[int, int] = (0, 0), /) -> ScreenShot:
+        """Instantiate a new class given RGB pixels, e.g. an edited screenshot.
+
+        The RGB pixels may be any bytes-like object or a numpy array; they are
+        read in place while being converted to BGRA, so no intermediate copy
+        is made. Immutable bytes are also kept as the `rgb` value.
+
+        :param rgb: RGB pixels, row by row.
+        :param tuple size: The (width, height) of the image.
+        :param tuple pos: The (left, top) position of the image.
+        """
+        width, height = size
+        data = bytearray(width * height * 4)
+
+        try:
+            import numpy as np
+        except ImportError:
+            view = memoryview(rgb).cast("B")
+            if len(view) != width * height * 3:
+                msg = f"RGB data does not match the {width}x{height} size."
+                raise ScreenShotError(msg) from None
+            data[2::4] = view[::3]
+            data[1::4] = view[1::3]
+            data[::4] = view[2::3]
+            data[3::4] = b"\xff" * (width * height)
+        else:
+            src = rgb if isinstance(rgb, np.ndarray) else np.frombuffer(rgb, dtype=np.uint8)
+            if src.size != width * height * 3:
+                msg = f"RGB data does not match the {width}x{height} size."
+                raise ScreenShotError(msg)
+            bgra = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)
+            bgra[:, :, 2::-1] = src.reshape(height, width, 3)
+            bgra[:, :, 3] = 255
+
+        monitor = {"left": pos[0], "top": pos[1], "width": width, "height": height}
+        screenshot = cls(data, monitor)
+        if isinstance(rgb, bytes):
+            screenshot.__rgb = rgb
+        return screenshot
+
     @property
     def bgra(self) -> bytes:
         """BGRA values from the BGRA raw pixels."""
         return bytes(self.raw)
 
+    @property
+    def bgra_array(self) -> Any:
+        """Read-only numpy view of the raw BGRA pixels, without copying them.
+
+        The view is created once and shared by the other array accessors.
+
+        :return numpy.ndarray: Array of shape (height, width, 4).
+        """
+        if self.__bgra_array is None:
+            import numpy as np
+
+            view = np.frombuffer(self.raw, dtype=np.uint8).reshape(self.height, self.width, 4)
+            view.flags.writeable = False
+            self.__bgra_array = view
+
+        return self.__bgra_array
+
+    def as_pil(self, mode: str = "RGB") -> Any:
+        """Create a PIL image from the BGRA raw pixels.
+
+        The channels are reordered by Pillow's C unpacker while copying, so
+        no intermediate RGB buffer is built.
+
+        :param str mode: "RGB" or "RGBA".
+        :return PIL.Image.Image: Image in the requested mode.
+        """
+        from PIL import Image
+
+        rawmodes = {"RGB": "BGRX", "RGBA": "BGRA"}
+        if mode not in rawmodes:
+            msg = f"Unsupported PIL mode {mode!r}."
+            raise ScreenShotError(msg)
+
+        return Image.frombuffer(mode, self.size, self.raw, "raw", rawmodes[mode], 0, 1)  # type: ignore[arg-type]
+
     @property
     def height(self) -> int:
         """Convenient accessor to the height size."""
@@ -92,15 +217,28 @@ class ScreenShot:
         :return bytes: RGB pixels.
         """
         if not self.__rgb:
-            rgb = bytearray(self.height * self.width * 3)
-            raw = self.raw
-            rgb[::3] = raw[2::4]
-            rgb[1::3] = raw[1::4]
-            rgb[2::3] = raw[::4]
-            self.__rgb = bytes(rgb)
+            self.__rgb = _bgra_to_rgb_native(self.raw, self.size)
+            if self.__rgb is None:
+                rgb = bytearray(self.height * self.width * 3)
+                raw = self.raw
+                rgb[::3] = raw[2::4]
+                rgb[1::3] = raw[1::4]
+                rgb[2::3] = raw[::4]
+                self.__rgb = bytes(rgb)
 
         return self.__rgb
 
+    @property
+    def rgb_array(self) -> Any:
+        """Read-only numpy view of the RGB pixels, without copying them.
+
+        The view reads the BGRA buffer backwards from each pixel's red byte;
+        use `numpy.ascontiguousarray()` when contiguous memory is needed.
+
+        :return numpy.ndarray: Array of shape (height, width, 3).
+        """
+        return self.bgra_array[:, :, 2::-1]
+
     @property
     def top(self) -> int:
         """Convenient accessor to the top position."""
@@ -118,8 +256,13 @@ class ScreenShot:
         :param int coord_y: The y coordinate.
         :return tuple: The pixel value as (R, G, B).
         """
-        try:
-            return self.pixels[coord_y][coord_x]
-        except IndexError as exc:
+        width, height = self.size
+        # Same index semantics as the `pixels` lists, negative indexes included
+        if not (-width <= coord_x < width and -height <= coord_y < height):
             msg = f"Pixel location ({coord_x}, {coord_y}) is out of range."
-            raise ScreenShotError(msg) from exc
+            raise ScreenShotError(msg)
+
+        # Read the BGRA bytes directly rather than building every pixel tuple
+        offset = ((coord_y % height) * width + coord_x % width) * 4
+        raw = self.raw
+        return raw[offset + 2], raw[offset + 1], raw[offset]
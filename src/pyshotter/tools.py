@@ -22,13 +22,49 @@ def to_png(data: bytes, size: tuple[int, int], /, *, level: int = 6, output: Pat
     :param int level: PNG compression level.
     :param str output: Output file name.
     """
+    width, height = size
+    line = width * 3
+    png_filter = struct.pack(">B", 0)
+    scanlines = b"".join([png_filter + data[y * line : y * line + line] for y in range(height)])
+    return _write_png(scanlines, size, level, output)
+
+
+def bgra_to_png(
+    data: bytes | bytearray, size: tuple[int, int], /, *, level: int = 6, output: Path | str | None = None
+) -> bytes | None:
+    """Dump raw BGRA data to a PNG file, like `to_png()` does for RGB data.
+
+    The filtered scanlines are built straight from the BGRA buffer, skipping
+    the intermediate RGB copy.
+
+    :param bytes data: BGRABGRA...BGRA data, as `ScreenShot.raw`.
+    :param tuple size: The (width, height) pair.
+    :param int level: PNG compression level.
+    :param str output: Output file name.
+    """
+    width, height = size
+    stride = width * 4
+    line = width * 3 + 1
+
+    # Filter bytes stay 0
+    scanlines = bytearray(height * line)
+    for y in range(height):
+        row = data[y * stride : y * stride + stride]
+        start = y * line
+        end = start + line
+        scanlines[start + 1 : end : 3] = row[2::4]
+        scanlines[start + 2 : end : 3] = row[1::4]
+        scanlines[start + 3 : end : 3] = row[::4]
+
+    return _write_png(scanlines, size, level, output)
+
+
+def _write_png(scanlines: bytes | bytearray, size: tuple[int, int], level: int, output: Path | str | None) -> bytes | None:
+    """Compress filtered RGB scanlines into PNG chunks, written to `output` or returned."""
     pack = struct.pack
     crc32 = zlib.crc32
 
     width, height = size
-    line = width * 3
-    png_filter = pack(">B", 0)
-    scanlines = b"".join([png_filter + data[y * line : y * line + line] for y in range(height)])
 
     magic = pack(">8B", 137, 80, 78, 71, 13, 10, 26, 10)
 
@@ -8,6 +8,7 @@ from pyshotter.ai_features import (
     EnhancedRedactionFeature,
     FaceBlurFeature,
     get_privacy_templates,
+    DEFAULT_PATTERNS,
     PRIVACY_TEMPLATES
 )
 
@@ -15,11 +16,11 @@ from pyshotter.ai_features import (
 class TestEnhancedRedaction:
     """Test enhanced redaction feature."""
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def sample_screenshot(self):
         """Create sample screenshot."""
         img_array = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
-        return ScreenShot(rgb=img_array.tobytes(), size=(100, 100), pos=(0, 0))
+        return ScreenShot.from_rgb(img_array, (100, 100))
     
     def test_redaction_init(self):
         """Test redaction feature initialization."""
@@ -40,6 +41,46 @@ class TestEnhancedRedaction:
         assert 'api_key' in redactor.custom_patterns
         assert 'jwt' in redactor.custom_patterns
     
+    def test_custom_patterns_compiled_once(self):
+        """Custom patterns are compiled when added and reused afterwards."""
+        from pyshotter.ai_features import _compile_pattern
+        
+        redactor = EnhancedRedactionFeature()
+        redactor.add_custom_patterns({'ticket': r'\bTKT-\d{5}\b'})
+        
+        compiled = _compile_pattern(r'\bTKT-\d{5}\b')
+        assert compiled.search("see TKT-12345")
+        assert _compile_pattern(r'\bTKT-\d{5}\b') is compiled
+    
+    def test_invalid_custom_pattern(self):
+        """Invalid regexes are rejected when added."""
+        import re
+        
+        redactor = EnhancedRedactionFeature()
+        with pytest.raises(re.error):
+            redactor.add_custom_patterns({'broken': r'(unclosed'})
+        assert 'broken' not in redactor.custom_patterns
+    
+    def test_pattern_set_matches_any(self):
+        """A combined pattern set reports which pattern matched."""
+        from pyshotter.ai_features import _compile_pattern_set
+        
+        match = _compile_pattern_set(PRIVACY_TEMPLATES['medical']['patterns'])
+        assert match("MRN AB1234567") == 'mrn'
+        assert match("born 01/02/1990") == 'dob'
+        assert match("ssn 123-45-6789") == 'ssn'
+        assert match("nothing here") is None
+        assert _compile_pattern_set(PRIVACY_TEMPLATES['medical']['patterns']) is match
+    
+    def test_pattern_set_backreference_fallback(self):
+        """Patterns with numbered backreferences still match on their own."""
+        from pyshotter.ai_features import _compile_pattern_set
+        
+        match = _compile_pattern_set({'digit': r'\d{3}', 'repeat': r'(ab)\1'})
+        assert match("xabab") == 'repeat'
+        assert match("x123") == 'digit'
+        assert match("xab") is None
+    
     def test_redaction_modes(self, sample_screenshot):
         """Test different redaction modes."""
         for mode in ['blur', 'pixelate', 'block', 'generate']:
@@ -48,6 +89,42 @@ class TestEnhancedRedaction:
             result = redactor.redact_sensitive_data(sample_screenshot)
             assert result is not None
     
+    @pytest.mark.parametrize('mode', ['blur', 'pixelate', 'block', 'generate'])
+    def test_apply_redaction_in_place(self, mode):
+        """Only the clipped bounding box is changed."""
+        img = np.random.default_rng(0).integers(0, 255, (40, 60, 3), dtype=np.uint8)
+        original = img.copy()
+        
+        result = EnhancedRedactionFeature(mode=mode)._apply_redaction(img, (50, 10, 80, 30), 15.0)
+        assert result is img
+        assert not np.array_equal(img[10:30, 50:], original[10:30, 50:])
+        img[10:30, 50:] = original[10:30, 50:]
+        assert np.array_equal(img, original)
+    
+    def test_generate_stripes(self):
+        """Generated redactions alternate two light and two dark rows."""
+        img = np.zeros((10, 10, 3), dtype=np.uint8)
+        EnhancedRedactionFeature(mode='generate')._apply_redaction(img, (2, 1, 8, 9), 15.0)
+        assert [int(value) for value in img[1:9, 5, 0]] == [70, 70, 50, 50, 70, 70, 50, 50]
+    
+    def test_duplicate_boxes_redacted_once(self, monkeypatch, sample_screenshot):
+        """Several matches in one box redact it a single time."""
+        redactor = EnhancedRedactionFeature(mode='block')
+        boxes = [
+            {'text': 'a@example.com', 'bbox': (0, 0, 10, 10)},
+            {'text': 'a@example.com', 'bbox': (0, 0, 10, 10)},
+            {'text': 'plain', 'bbox': (20, 20, 30, 30)},
+        ]
+        monkeypatch.setattr(redactor, '_get_ocr', lambda: type('OCR', (), {'extract_text_boxes': lambda self, s: boxes})())
+        calls = []
+        apply_redaction = redactor._apply_redaction
+        monkeypatch.setattr(redactor, '_apply_redaction', lambda *args: calls.append(args[1]) or apply_redaction(*args))
+        
+        result = redactor.redact_sensitive_data(sample_screenshot)
+        assert calls == [(0, 0, 10, 10)]
+        assert not result.rgb_array[:10, :10].any()
+        assert np.array_equal(result.rgb_array[20:30, 20:30], sample_screenshot.rgb_array[20:30, 20:30])
+    
     def test_privacy_templates(self):
         """Test privacy template availability."""
         templates = get_privacy_templates()
@@ -77,11 +154,11 @@ class TestEnhancedRedaction:
 class TestFaceBlurring:
     """Test face blurring feature."""
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def sample_screenshot(self):
         """Create sample screenshot."""
         img_array = np.random.randint(0, 255, (200, 200, 3), dtype=np.uint8)
-        return ScreenShot(rgb=img_array.tobytes(), size=(200, 200), pos=(0, 0))
+        return ScreenShot.from_rgb(img_array, (200, 200))
     
     def test_face_blur_init(self):
         """Test face blur initialization."""
@@ -111,12 +188,84 @@ class TestFaceBlurring:
         assert result is not None
         assert result.size == sample_screenshot.size
     
-    def test_blur_strength_variation(self, sample_screenshot):
+    @pytest.mark.parametrize('strength', [10.0, 30.0, 50.0])
+    def test_blur_strength_variation(self, sample_screenshot, strength):
         """Test different blur strengths."""
-        for strength in [10.0, 30.0, 50.0]:
-            face_blur = FaceBlurFeature(blur_strength=strength)
-            result = face_blur.blur_faces(sample_screenshot)
-            assert result is not None
+        face_blur = FaceBlurFeature(blur_strength=strength)
+        result = face_blur.blur_faces(sample_screenshot)
+        assert result is not None
+
+    @pytest.mark.parametrize("stack_blur", [True, False])
+    def test_gaussian_blur(self, monkeypatch, stack_blur):
+        """Regions are smoothed with or without OpenCV's stack blur."""
+        import cv2
+        
+        from pyshotter.ai_features import _gaussian_blur
+        
+        if not stack_blur:
+            monkeypatch.delattr(cv2, 'stackBlur', raising=False)
+        
+        region = np.zeros((40, 40, 3), dtype=np.uint8)
+        region[:, 20:] = 255
+        blurred = _gaussian_blur(region, 10)
+        
+        assert blurred.shape == region.shape
+        assert 0 < blurred[20, 20, 0] < 255
+        assert blurred[20, 0, 0] == 0 and blurred[20, 39, 0] == 255
+
+    def test_dnn_model_shared(self, monkeypatch, tmp_path):
+        """The DNN model is loaded once and shared by every instance."""
+        from pathlib import Path
+        
+        import cv2
+        
+        model_dir = tmp_path / '.pyshotter' / 'models'
+        model_dir.mkdir(parents=True)
+        (model_dir / 'deploy.prototxt').touch()
+        (model_dir / 'res10_300x300_ssd_iter_140000.caffemodel').touch()
+        monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+        monkeypatch.setattr(FaceBlurFeature, '_dnn_net', None)
+        
+        class FakeNet:
+            def setInput(self, blob):
+                self.blob = blob
+            
+            def forward(self):
+                detections = np.zeros((1, 1, 2, 7), dtype=np.float32)
+                detections[0, 0, 0, 2:7] = (0.9, -0.1, 0.25, 0.5, 1.2)
+                detections[0, 0, 1, 2] = 0.1
+                return detections
+        
+        loads = []
+        monkeypatch.setattr(cv2.dnn, 'readNetFromCaffe', lambda *args: loads.append(args) or FakeNet(), raising=False)
+        
+        first = FaceBlurFeature(detection_method='dnn', blur_strength=10)
+        second = FaceBlurFeature(detection_method='dnn', blur_strength=20)
+        assert len(loads) == 1
+        assert first.dnn_net is second.dnn_net
+        
+        # Red pixels reach the model's blue-first input as the last channel
+        rgb = np.zeros((100, 200, 3), dtype=np.uint8)
+        rgb[:, :, 0] = 255
+        bgra = np.dstack([rgb[:, :, ::-1], np.full((100, 200), 255, dtype=np.uint8)])
+        screenshot = ScreenShot.from_size(bytearray(bgra.tobytes()), 200, 100)
+        
+        faces = first.detect_faces(screenshot)
+        assert faces == [{'bbox': (0, 25, 100, 75), 'confidence': pytest.approx(0.9)}]
+        assert first.dnn_net.blob[0, 2, 0, 0] == pytest.approx(255 - 123)
+
+    def test_haar_cascade_shared(self, monkeypatch):
+        """The Haar cascade XML is parsed once and shared by every instance."""
+        import cv2
+
+        monkeypatch.setattr(FaceBlurFeature, '_face_cascade', None)
+        loads = []
+        monkeypatch.setattr(cv2, 'CascadeClassifier', lambda path: loads.append(path) or object(), raising=False)
+
+        instances = [FaceBlurFeature(blur_strength=strength) for strength in (10.0, 30.0, 50.0)]
+        assert len(loads) == 1
+        assert loads[0].endswith('haarcascade_frontalface_default.xml')
+        assert all(instance.face_cascade is instances[0].face_cascade for instance in instances)
 
 
 class TestPrivacyTemplates:
@@ -147,3 +296,28 @@ class TestPrivacyTemplates:
         assert 'phone' in template['patterns']
         assert 'ip' in template['patterns']
         assert 'GDPR' in template['description']
+
+    def test_templates_read_only(self):
+        """Templates can't be mutated through the shared mapping."""
+        with pytest.raises(TypeError):
+            PRIVACY_TEMPLATES['custom'] = {}
+        with pytest.raises(TypeError):
+            PRIVACY_TEMPLATES['gdpr']['patterns']['email'] = r'.*'
+
+        templates = get_privacy_templates()
+        templates.pop('gdpr')
+        assert 'gdpr' in PRIVACY_TEMPLATES
+
+    @pytest.mark.parametrize("name, pattern", [
+        (f"{template}.{name}", pattern)
+        for template, info in PRIVACY_TEMPLATES.items()
+        for name, pattern in info['patterns'].items()
+    ] + [(f"default.{name}", pattern) for name, pattern in DEFAULT_PATTERNS.items()])
+    def test_pattern_lint(self, name, pattern):
+        """Patterns compile and avoid unbounded or lazy wildcards."""
+        import re
+        
+        re.compile(pattern)
+        assert pattern.count('.*') <= 1, name
+        assert not re.search(r'(?<!\\)\.\{\d*,\d*\}\?', pattern), name
+        assert '|' not in re.sub(r'\\.', '', ''.join(re.findall(r'\[[^\]]*\]', pattern))), name
@@ -11,13 +11,12 @@ from pyshotter.exception import BeautifierError
 class TestCodeBeautifier:
     """Test code beautification feature."""
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def sample_screenshot(self):
         """Create a sample screenshot for testing."""
         # Create simple 100x100 RGB image
         img_array = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
-        img_bytes = img_array.tobytes()
-        return ScreenShot(rgb=img_bytes, size=(100, 100), pos=(0, 0))
+        return ScreenShot.from_rgb(img_array, (100, 100))
     
     def test_beautifier_init_valid_theme(self):
         """Test beautifier initialization with valid theme."""
@@ -51,15 +50,15 @@ class TestCodeBeautifier:
         assert beautified.width > sample_screenshot.width
         assert beautified.height > sample_screenshot.height
     
-    def test_beautify_with_different_themes(self, sample_screenshot):
+    @pytest.mark.parametrize('theme_name', get_available_themes())
+    def test_beautify_with_different_themes(self, sample_screenshot, theme_name):
         """Test beautification with different themes."""
-        for theme_name in get_available_themes():
-            beautifier = CodeBeautifierFeature(theme=theme_name)
-            beautified = beautifier.beautify(sample_screenshot)
-            
-            assert beautified is not None
-            assert beautified.size[0] > 0
-            assert beautified.size[1] > 0
+        beautifier = CodeBeautifierFeature(theme=theme_name)
+        beautified = beautifier.beautify(sample_screenshot)
+        
+        assert beautified is not None
+        assert beautified.size[0] > 0
+        assert beautified.size[1] > 0
     
     def test_beautify_gradient_background(self, sample_screenshot):
         """Test gradient background generation."""
@@ -79,17 +78,12 @@ class TestCodeBeautifier:
         )
         assert beautified is not None
     
-    def test_beautify_shadow_intensity(self, sample_screenshot):
+    @pytest.mark.parametrize('shadow_intensity', [0.0, 1.0])
+    def test_beautify_shadow_intensity(self, sample_screenshot, shadow_intensity):
         """Test different shadow intensities."""
         beautifier = CodeBeautifierFeature()
-        
-        # No shadow
-        no_shadow = beautifier.beautify(sample_screenshot, shadow_intensity=0.0)
-        assert no_shadow is not None
-        
-        # Full shadow
-        full_shadow = beautifier.beautify(sample_screenshot, shadow_intensity=1.0)
-        assert full_shadow is not None
+        beautified = beautifier.beautify(sample_screenshot, shadow_intensity=shadow_intensity)
+        assert beautified is not None
     
     def test_get_available_themes(self):
         """Test getting available themes."""
@@ -122,6 +116,98 @@ class TestBeautifierThemes:
                     assert 0 <= channel <= 255, f"Invalid color in {theme_name}.{key}"
 
 
+class TestGradientBackground:
+    """Test the cached gradient background."""
+    
+    def test_gradient_rows(self):
+        """Each row interpolates between the theme's start and end colors."""
+        beautifier = CodeBeautifierFeature(theme='dracula')
+        start, end = THEMES['dracula']['bg_start'], THEMES['dracula']['bg_end']
+        
+        pixels = np.asarray(beautifier._create_gradient_background(7, 50))
+        assert pixels.shape == (50, 7, 3)
+        for y in (0, 17, 49):
+            ratio = y / 50
+            expected = [int(s * (1 - ratio) + e * ratio) for s, e in zip(start, end)]
+            assert (pixels[y] == expected).all()
+    
+    def test_gradient_cached_and_copied(self):
+        """The gradient is rendered once; callers get their own copy."""
+        from pyshotter.beautifier import _make_gradient
+        
+        beautifier = CodeBeautifierFeature(theme='nord')
+        _make_gradient.cache_clear()
+        
+        first = beautifier._create_gradient_background(20, 10)
+        first.paste((255, 0, 0), (0, 0, 20, 10))
+        second = beautifier._create_gradient_background(20, 10)
+        
+        assert _make_gradient.cache_info().misses == 1
+        assert second.getpixel((0, 0)) == THEMES['nord']['bg_start']
+
+
+class TestWindowShadow:
+    """Test the window drop shadow."""
+    
+    def test_shadow_blurred_around_window(self):
+        beautifier = CodeBeautifierFeature(theme='solarized-light')
+        window = beautifier._create_window_with_shadow(200, 100, 10, 1.0)
+        
+        alpha = np.asarray(window)[:, :, 3]
+        assert window.size == (200 + 100, 100 + 100)
+        assert (alpha[30:130, 30:230] == 255).all()  # The window itself
+        assert 0 < alpha[150, 150] < int(255 * 0.3)  # Blurred shadow below it
+        assert alpha[0, 0] < 5  # Fading out at the far corner
+        assert window.getpixel((150, 150))[:3] == THEMES['solarized-light']['shadow']
+    
+    def test_no_shadow(self):
+        from pyshotter.beautifier import _make_shadow_mask
+        
+        _make_shadow_mask.cache_clear()
+        window = CodeBeautifierFeature()._create_window_with_shadow(200, 100, 10, 0.0)
+        
+        alpha = np.asarray(window)[:, :, 3]
+        assert alpha.sum() == 200 * 100 * 255
+        assert _make_shadow_mask.cache_info().misses == 0
+
+
+class TestFrameCache:
+    """Test reuse of the frame rendered around screenshots."""
+    
+    @pytest.mark.parametrize('background_type', ['gradient', 'solid', 'transparent'])
+    def test_frame_reused(self, background_type):
+        beautifier = CodeBeautifierFeature(theme='nord', window_style='macos')
+        
+        red = np.zeros((20, 30, 3), dtype=np.uint8)
+        red[:, :, 0] = 255
+        blue = red[:, :, ::-1].copy()
+        first = beautifier.beautify(ScreenShot.from_rgb(red, (30, 20)), padding=10, background_type=background_type)
+        second = beautifier.beautify(ScreenShot.from_rgb(blue, (30, 20)), padding=10, background_type=background_type)
+        
+        assert beautifier._cached_frame.cache_info().misses == 1
+        # Each result only holds its own screenshot, over the same frame
+        assert (first.rgb_array[38:58, 10:40] == (255, 0, 0)).all()
+        assert (second.rgb_array[38:58, 10:40] == (0, 0, 255)).all()
+        assert np.array_equal(first.rgb_array[:38], second.rgb_array[:38])
+        
+        beautifier.beautify(ScreenShot.from_rgb(red, (30, 20)), padding=12, background_type=background_type)
+        assert beautifier._cached_frame.cache_info().misses == 2
+    
+    def test_image_background_not_cached(self):
+        from PIL import Image
+        
+        beautifier = CodeBeautifierFeature(window_style='none')
+        screenshot = ScreenShot.from_rgb(np.zeros((20, 30, 3), dtype=np.uint8), (30, 20))
+        
+        for color in ((255, 0, 0), (0, 255, 0)):
+            result = beautifier.beautify(
+                screenshot, padding=10, background_type='image',
+                background_image=Image.new('RGB', (100, 80), color),
+            )
+            assert tuple(result.rgb_array[0, 0]) == color
+        assert beautifier._cached_frame.cache_info().currsize == 0
+
+
 @pytest.mark.benchmark
 class TestBeautifierPerformance:
     """Benchmark tests for beautifier."""
@@ -130,8 +216,7 @@ class TestBeautifierPerformance:
     def large_screenshot(self):
         """Create a large screenshot for benchmarking."""
         img_array = np.random.randint(0, 255, (1080, 1920, 3), dtype=np.uint8)
-        img_bytes = img_array.tobytes()
-        return ScreenShot(rgb=img_bytes, size=(1920, 1080), pos=(0, 0))
+        return ScreenShot.from_rgb(img_array, (1920, 1080))
     
     def test_beautify_performance(self, benchmark, large_screenshot):
         """Benchmark beautification performance."""
@@ -2,9 +2,14 @@
 Source: https://github.com/utachicodes/pyshotter.
 """
 
+from __future__ import annotations
+
+import sys
+
 import pytest
 
 from mss.base import ScreenShot
+from mss.exception import ScreenShotError
 
 
 def test_bad_length() -> None:
@@ -18,3 +23,102 @@ def test_good_types(raw: bytes) -> None:
     image = ScreenShot.from_size(bytearray(raw), 1024, 768)
     assert isinstance(image.raw, bytearray)
     assert isinstance(image.rgb, bytes)
+
+
+@pytest.mark.parametrize("converter", ["_bgra_to_rgb_opencv", "_bgra_to_rgb_pil", None])
+def test_rgb_conversion(monkeypatch: pytest.MonkeyPatch, converter: str | None) -> None:
+    from pyshotter import screenshot
+
+    if converter == "_bgra_to_rgb_opencv":
+        pytest.importorskip("cv2")
+    elif converter == "_bgra_to_rgb_pil":
+        pytest.importorskip("PIL")
+    monkeypatch.setattr(screenshot, "_CONVERTER", getattr(screenshot, converter) if converter else False)
+
+    image = screenshot.ScreenShot.from_size(bytearray(range(24)), 3, 2)
+    assert image.rgb == bytes([2, 1, 0, 6, 5, 4, 10, 9, 8, 14, 13, 12, 18, 17, 16, 22, 21, 20])
+
+
+def test_rgb_array() -> None:
+    np = pytest.importorskip("numpy")
+    from pyshotter.screenshot import ScreenShot as PyShotterScreenShot
+
+    image = PyShotterScreenShot.from_size(bytearray(range(24)), 3, 2)
+    view = image.rgb_array
+
+    assert view.shape == (2, 3, 3)
+    assert view.tobytes() == image.rgb
+    assert not view.flags.writeable
+    assert np.shares_memory(view, np.frombuffer(image.raw, dtype=np.uint8))
+
+
+def test_bgra_array_shared() -> None:
+    np = pytest.importorskip("numpy")
+    from pyshotter.screenshot import ScreenShot as PyShotterScreenShot
+
+    image = PyShotterScreenShot.from_size(bytearray(range(24)), 3, 2)
+    view = image.bgra_array
+
+    assert view.shape == (2, 3, 4)
+    assert view.tobytes() == image.bgra
+    assert not view.flags.writeable
+    assert image.bgra_array is view
+    assert np.shares_memory(image.rgb_array, view)
+
+
+@pytest.mark.parametrize(("mode", "expected"), [("RGB", [(2, 1, 0), (6, 5, 4)]), ("RGBA", [(2, 1, 0, 3), (6, 5, 4, 7)])])
+def test_as_pil(mode: str, expected: list) -> None:
+    pytest.importorskip("PIL")
+    from pyshotter.screenshot import ScreenShot as PyShotterScreenShot
+
+    image = PyShotterScreenShot.from_size(bytearray(range(24)), 3, 2)
+    img = image.as_pil(mode)
+
+    assert img.mode == mode
+    assert img.size == (3, 2)
+    assert [img.getpixel((0, 0)), img.getpixel((1, 0))] == expected
+    if mode == "RGB":
+        assert img.tobytes() == image.rgb
+
+
+def test_as_pil_unsupported_mode() -> None:
+    pytest.importorskip("PIL")
+    from pyshotter.screenshot import ScreenShot as PyShotterScreenShot
+
+    image = PyShotterScreenShot.from_size(bytearray(range(24)), 3, 2)
+    with pytest.raises(ScreenShotError):
+        image.as_pil("CMYK")
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_from_rgb(monkeypatch: pytest.MonkeyPatch, numpy: bool) -> None:
+    from pyshotter import screenshot
+    from pyshotter.screenshot import ScreenShot as PyShotterScreenShot
+
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        monkeypatch.setattr(screenshot, "_CONVERTER", False)
+
+    rgb = bytes(range(18))
+    image = PyShotterScreenShot.from_rgb(memoryview(bytearray(rgb)), (3, 2), (5, 7))
+    assert image.pos == (5, 7)
+    assert image.size == (3, 2)
+    assert image.raw == bytearray([2, 1, 0, 255, 5, 4, 3, 255, 8, 7, 6, 255, 11, 10, 9, 255, 14, 13, 12, 255, 17, 16, 15, 255])
+    assert image.rgb == rgb
+
+    assert PyShotterScreenShot.from_rgb(rgb, (3, 2)).rgb is rgb
+
+    with pytest.raises(ScreenShotError):
+        PyShotterScreenShot.from_rgb(rgb, (3, 3))
+
+
+def test_from_rgb_array() -> None:
+    np = pytest.importorskip("numpy")
+    from pyshotter.screenshot import ScreenShot as PyShotterScreenShot
+
+    # Non-contiguous arrays, such as views of an RGBA image, are read as is
+    rgba = np.arange(24, dtype=np.uint8).reshape(2, 3, 4)
+    image = PyShotterScreenShot.from_rgb(rgba[:, :, :3], (3, 2))
+    assert (image.rgb_array == rgba[:, :, :3]).all()
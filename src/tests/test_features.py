@@ -0,0 +1,372 @@
+"""Unit tests for advanced screenshot features."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pyshotter.features import (
+    ChangeDetectionFeature,
+    OCRFeature,
+    PanoramaFeature,
+    RedactionFeature,
+    ScreenshotHistory,
+    SharingFeature,
+    SmartDetectionFeature,
+    _encode_png,
+)
+from pyshotter.screenshot import ScreenShot
+
+
+def make_screenshot(fill: int = 0, width: int = 16, height: int = 16) -> ScreenShot:
+    """Create a solid-color screenshot."""
+    return ScreenShot.from_size(bytearray([fill]) * (width * height * 4), width, height)
+
+
+class TestOCRCache:
+    """Test OCR result caching."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Replace Tesseract with a call counter."""
+        pytesseract = pytest.importorskip("pytesseract")
+        pytest.importorskip("PIL")
+        calls = []
+
+        def fake_image_to_string(img, lang='eng'):
+            calls.append(img.size)
+            return f" text {len(calls)} "
+
+        monkeypatch.setattr(pytesseract, 'image_to_string', fake_image_to_string)
+        return calls
+
+    def test_same_content_hits_cache(self, calls):
+        """Identical content is only OCR'ed once."""
+        ocr = OCRFeature()
+
+        assert ocr.extract_text(make_screenshot(1)) == "text 1"
+        assert ocr.extract_text(make_screenshot(1)) == "text 1"
+        assert len(calls) == 1
+
+    def test_different_content_misses_cache(self, calls):
+        """Different content or language triggers a new OCR call."""
+        ocr = OCRFeature()
+
+        ocr.extract_text(make_screenshot(1))
+        ocr.extract_text(make_screenshot(2))
+        ocr.extract_text(make_screenshot(2), lang='fra')
+        assert len(calls) == 3
+
+    def test_cache_eviction(self, calls):
+        """Least recently used entries are evicted past cache_size."""
+        ocr = OCRFeature(cache_size=2)
+
+        for fill in (1, 2, 3):
+            ocr.extract_text(make_screenshot(fill))
+        ocr.extract_text(make_screenshot(1))
+        assert len(calls) == 4
+
+    def test_batch_single_run(self, monkeypatch, calls):
+        """A batch is OCR'ed with one Tesseract run reading an image list."""
+        runs = []
+
+        def fake_image_to_string(image, lang='eng'):
+            runs.append(image)
+            paths = Path(image).read_text().split()
+            return "".join(f"page {Path(path).stem}\f" for path in paths)
+
+        ocr = OCRFeature()
+        assert ocr.extract_text(make_screenshot(1)) == "text 1"
+        monkeypatch.setattr('pytesseract.image_to_string', fake_image_to_string)
+
+        texts = ocr.extract_text_batch([make_screenshot(1), make_screenshot(2), make_screenshot(3)])
+        assert texts == ["text 1", "page 1", "page 2"]
+        assert len(runs) == 1
+
+        # Results are cached per screenshot
+        assert ocr.extract_text(make_screenshot(3)) == "page 2"
+
+    def test_cache_disabled(self, calls):
+        """A cache_size of 0 disables caching."""
+        ocr = OCRFeature(cache_size=0)
+
+        ocr.extract_text(make_screenshot(1))
+        ocr.extract_text(make_screenshot(1))
+        assert len(calls) == 2
+
+
+class TestRedactionMatching:
+    """Test sensitive data matching over OCR tokens."""
+
+    @staticmethod
+    def boxes(*texts):
+        return [{'text': text, 'bbox': (0, 0, 1, 1)} for text in texts]
+
+    def test_finds_each_pattern(self):
+        """Every default pattern flags its own box."""
+        text_boxes = self.boxes(
+            "hello", "john@example.com", "555-123-4567", "world",
+            "4111 1111 1111 1111", "123-45-6789",
+        )
+        assert RedactionFeature._find_sensitive_boxes(text_boxes) == [1, 2, 4, 5]
+
+    def test_unicode_digits(self):
+        """Non-ASCII digits match like the separate patterns always did."""
+        text_boxes = self.boxes("\u0665\u0665\u0665-\u0661\u0662\u0663-\u0664\u0665\u0666\u0667", "ok")
+        assert RedactionFeature._find_sensitive_boxes(text_boxes) == [0]
+
+    def test_matches_do_not_span_tokens(self):
+        """Digits split across tokens are not joined into a match."""
+        text_boxes = self.boxes("555", "123", "4567")
+        assert RedactionFeature._find_sensitive_boxes(text_boxes) == []
+
+    def test_no_boxes(self):
+        assert RedactionFeature._find_sensitive_boxes([]) == []
+
+
+class TestHistorySearch:
+    """Test screenshot history search."""
+
+    @pytest.fixture
+    def history(self, tmp_path):
+        entries = [
+            {'id': 'a', 'ocr_text': 'Hello World', 'metadata': {}},
+            {'id': 'b', 'ocr_text': '', 'metadata': {'window': 'Terminal'}},
+            {'id': 'c', 'ocr_text': 'other', 'metadata': {'tags': ['Bug-Report']}},
+        ]
+        (tmp_path / "history.json").write_text(json.dumps(entries))
+        return ScreenshotHistory(str(tmp_path))
+
+    def test_search_ocr_text(self, history):
+        assert [e['id'] for e in history.search_history('hello')] == ['a']
+
+    def test_search_metadata(self, history):
+        assert [e['id'] for e in history.search_history('TERMINAL')] == ['b']
+
+    def test_search_tags(self, history):
+        assert [e['id'] for e in history.search_history('bug-rep')] == ['c']
+
+    def test_search_no_match(self, history):
+        assert history.search_history('missing') == []
+
+    def test_add_screenshots(self, history, monkeypatch):
+        monkeypatch.setattr(history, '_ocr', None)
+        monkeypatch.setattr('pyshotter.features.TESSERACT_AVAILABLE', False)
+
+        ids = history.add_screenshots(
+            [make_screenshot(1), make_screenshot(2)],
+            [{'tags': ['first']}, {'tags': ['second']}],
+        )
+        assert len(ids) == 2
+        assert all(Path(entry['path']).exists() for entry in history.history[-2:])
+        assert [e['id'] for e in history.search_history('second')] == [ids[1]]
+        assert len(history.history_file.read_text().splitlines()) == 5
+
+    def test_identical_screenshots_share_file(self, history, monkeypatch):
+        monkeypatch.setattr('pyshotter.features.TESSERACT_AVAILABLE', False)
+        ids = history.add_screenshots([make_screenshot(1), make_screenshot(1)])
+        ids.append(history.add_screenshot(make_screenshot(1)))
+
+        assert len(set(ids)) == 3
+        assert len({entry['path'] for entry in history.history[-3:]}) == 1
+        assert len(list(history.history_dir.glob("*.png"))) == 1
+
+    def test_legacy_history_migrated(self, history):
+        assert history.history_file.name == "history.jsonl"
+        lines = history.history_file.read_text().splitlines()
+        assert [json.loads(line)['id'] for line in lines] == ['a', 'b', 'c']
+
+    def test_reload_appended_history(self, history, monkeypatch):
+        monkeypatch.setattr('pyshotter.features.TESSERACT_AVAILABLE', False)
+        screenshot_id = history.add_screenshot(make_screenshot(1), {'tags': ['new']})
+
+        reloaded = ScreenshotHistory(str(history.history_dir))
+        assert [e['id'] for e in reloaded.history] == ['a', 'b', 'c', screenshot_id]
+        assert [e['id'] for e in reloaded.search_history('new')] == [screenshot_id]
+
+
+class TestChangeDetection:
+    """Test change detection helpers."""
+
+    def test_grayscale_reused(self):
+        """A screenshot seen in the previous call is not converted again."""
+        pytest.importorskip("cv2")
+        detector = ChangeDetectionFeature()
+        first, second, third = make_screenshot(1), make_screenshot(2), make_screenshot(3)
+
+        gray_first = detector._to_gray(first)
+        gray_second = detector._to_gray(second)
+        assert detector._to_gray(first) is gray_first
+        assert detector._to_gray(second) is gray_second
+
+        detector._to_gray(third)
+        assert detector._to_gray(second) is gray_second
+        assert detector._to_gray(first) is not gray_first
+
+
+    def test_detect_changes_converts_once(self, monkeypatch):
+        """Each screenshot of a sequence is converted to grayscale only once."""
+        cv2 = pytest.importorskip("cv2")
+        calls = []
+        cvt_color = cv2.cvtColor
+
+        def counting_cvt_color(src, code, *args, **kwargs):
+            calls.append(code)
+            return cvt_color(src, code, *args, **kwargs)
+
+        monkeypatch.setattr(cv2, 'cvtColor', counting_cvt_color)
+        detector = ChangeDetectionFeature()
+        screenshots = [make_screenshot(fill) for fill in (1, 2, 3, 4)]
+
+        for previous, current in zip(screenshots, screenshots[1:]):
+            detector.detect_changes(current, previous)
+        assert calls.count(cv2.COLOR_RGB2GRAY) == len(screenshots)
+
+
+class TestPanoramaPool:
+    """Test panorama canvas reuse."""
+
+    def test_canvas_reused(self):
+        pytest.importorskip("numpy")
+        panorama = PanoramaFeature()
+
+        canvas = panorama._get_canvas(30, 10)
+        assert canvas.shape == (10, 30, 3)
+        assert panorama._get_canvas(30, 10) is canvas
+
+    def test_pool_bounded(self):
+        pytest.importorskip("numpy")
+        panorama = PanoramaFeature()
+
+        canvas = panorama._get_canvas(30, 10)
+        panorama._get_canvas(20, 10)
+        panorama._get_canvas(10, 10)
+        assert len(panorama._pool) == PanoramaFeature.POOL_SIZE
+        assert panorama._get_canvas(30, 10) is not canvas
+
+    def test_shared_memory_panorama(self):
+        np = pytest.importorskip("numpy")
+        from multiprocessing.shared_memory import SharedMemory
+
+        panorama = PanoramaFeature()
+        screenshots = [make_screenshot(1, width=4, height=3), make_screenshot(2, width=2, height=2)]
+
+        name, shape, dtype = panorama.create_panorama_shm(screenshots)
+        assert shape == (3, 6, 3)
+
+        shm = SharedMemory(name)
+        try:
+            result = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            assert (result[:, :4] == 1).all()
+            assert (result[:2, 4:] == 2).all()
+            assert (result[2:, 4:] == 0).all()
+            del result
+        finally:
+            shm.close()
+
+        panorama.close()
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name)
+
+
+class TestSharing:
+    """Test sharing helpers."""
+
+    def test_shareable_link_async(self):
+        sharing = SharingFeature()
+        screenshot = make_screenshot(7)
+
+        future = sharing.generate_shareable_link(screenshot, async_=True)
+        assert future.result(timeout=10) == sharing.generate_shareable_link(screenshot)
+        assert future.result().startswith("data:image/png;base64,")
+
+    def test_local_link(self, tmp_path):
+        sharing = SharingFeature(cache_dir=str(tmp_path))
+
+        link = sharing.generate_shareable_link(make_screenshot(7), service='local')
+        assert link.startswith("file://")
+        assert sharing.generate_shareable_link(make_screenshot(7), service='file') == link
+        assert len(list(tmp_path.glob("*.png"))) == 1
+
+    def test_encode_png_roundtrip(self):
+        Image = pytest.importorskip("PIL.Image")
+        import io
+
+        screenshot = make_screenshot(7)
+        with Image.open(io.BytesIO(_encode_png(screenshot, level=1))) as img:
+            assert img.size == screenshot.size
+            assert img.tobytes() == screenshot.rgb
+
+    def test_encode_png_filtered(self):
+        """Share links use filtered rows, smaller than the fast clipboard encoding."""
+        np = pytest.importorskip("numpy")
+        Image = pytest.importorskip("PIL.Image")
+        import io
+
+        bgra = np.zeros((64, 256, 4), dtype=np.uint8)
+        bgra[..., :3] = np.arange(256, dtype=np.uint8)[None, :, None]
+        screenshot = ScreenShot.from_size(bytearray(bgra.tobytes()), 256, 64)
+
+        data = _encode_png(screenshot)
+        assert len(data) < len(_encode_png(screenshot, level=1))
+        with Image.open(io.BytesIO(data)) as img:
+            assert img.tobytes() == screenshot.rgb
+
+    def test_save_with_metadata_async(self, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+        sharing = SharingFeature()
+        output = tmp_path / "meta.png"
+
+        future = sharing.save_with_metadata(make_screenshot(7), str(output), {'title': 'demo'}, async_=True)
+        assert future.result(timeout=10) is True
+        with Image.open(output) as img:
+            assert img.text['title'] == 'demo'
+
+
+class TestSmartDetection:
+    """Test smart detection."""
+
+    def test_detect_on_blank_screenshot(self):
+        pytest.importorskip("cv2")
+        detector = SmartDetectionFeature()
+        screenshot = make_screenshot(0, width=200, height=100)
+
+        assert isinstance(detector.detect_code_regions(screenshot), list)
+        assert detector.detect_windows(screenshot) == []
+
+    def test_detect_code_regions_bbox(self):
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("cv2")
+        bgra = np.full((200, 300, 4), 255, dtype=np.uint8)
+        bgra[20:60, 30:130] = 0
+        bgra[100:110, 30:40] = 0  # Too small
+        screenshot = ScreenShot.from_size(bytearray(bgra.tobytes()), 300, 200)
+
+        regions = SmartDetectionFeature().detect_code_regions(screenshot)
+        assert regions == [{'bbox': (30, 20, 100, 40), 'area': 4000, 'confidence': 0.8}]
+
+    def test_detect_code_regions_outer_only(self):
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("cv2")
+        bgra = np.full((200, 300, 4), 255, dtype=np.uint8)
+        bgra[20:160, 30:230] = 0  # Hollow frame
+        bgra[25:155, 35:225] = 255
+        bgra[60:100, 60:180] = 0  # Block inside the frame
+        screenshot = ScreenShot.from_size(bytearray(bgra.tobytes()), 300, 200)
+
+        regions = SmartDetectionFeature().detect_code_regions(screenshot)
+        assert [region['bbox'] for region in regions] == [(30, 20, 200, 140)]
+
+    @pytest.mark.parametrize("pyramid_levels", [0, 2])
+    def test_detect_windows_bbox(self, pyramid_levels):
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("cv2")
+        bgra = np.zeros((300, 400, 4), dtype=np.uint8)
+        bgra[40:240, 60:340] = 255
+        screenshot = ScreenShot.from_size(bytearray(bgra.tobytes()), 400, 300)
+
+        windows = SmartDetectionFeature().detect_windows(screenshot, pyramid_levels=pyramid_levels)
+        assert len(windows) == 1
+        x, y, w, h = windows[0]['bbox']
+        assert abs(x - 60) <= 4 and abs(y - 40) <= 4
+        assert abs(w - 280) <= 8 and abs(h - 200) <= 8
@@ -2,8 +2,12 @@
 Source: https://github.com/utachicodes/pyshotter.
 """
 
+from __future__ import annotations
+
 import itertools
 import os
+import random
+from collections.abc import Iterable
 
 import pytest
 
@@ -21,9 +25,9 @@ def test_grab_monitor() -> None:
             assert isinstance(image.rgb, bytes)
 
 
-def test_grab_part_of_screen() -> None:
+def grab_part_of_screen(sizes: Iterable[tuple[int, int]]) -> None:
     with mss(display=os.getenv("DISPLAY")) as sct:
-        for width, height in itertools.product(range(1, 42), range(1, 42)):
+        for width, height in sizes:
             monitor = {"top": 160, "left": 160, "width": width, "height": height}
             image = sct.grab(monitor)
 
@@ -33,6 +37,20 @@ def test_grab_part_of_screen() -> None:
             assert image.height == height
 
 
+#: Every size up to 41x41, and a fixed sample of them: the corners plus 40 sizes
+ALL_SIZES = list(itertools.product(range(1, 42), range(1, 42)))
+SAMPLED_SIZES = [(1, 1), (1, 41), (41, 1), (41, 41), *random.Random(42).sample(ALL_SIZES, 40)]
+
+
+def test_grab_part_of_screen() -> None:
+    grab_part_of_screen(SAMPLED_SIZES)
+
+
+@pytest.mark.slow
+def test_grab_part_of_screen_all_sizes() -> None:
+    grab_part_of_screen(ALL_SIZES)
+
+
 def test_get_pixel(raw: bytes) -> None:
     image = ScreenShot.from_size(bytearray(raw), 1024, 768)
     assert image.width == 1024
@@ -46,3 +64,15 @@ def test_get_pixel(raw: bytes) -> None:
 
     with pytest.raises(ScreenShotError):
         image.pixel(image.width + 1, 12)
+
+
+def test_pixel_matches_pixels() -> None:
+    from pyshotter.screenshot import ScreenShot as PyShotterScreenShot
+
+    image = PyShotterScreenShot.from_size(bytearray(range(4 * 3 * 2)), 3, 2)
+    for coord_y, coord_x in itertools.product(range(-2, 2), range(-3, 3)):
+        assert image.pixel(coord_x, coord_y) == image.pixels[coord_y][coord_x]
+
+    for coord_x, coord_y in ((3, 0), (0, 2), (-4, 0), (0, -3)):
+        with pytest.raises(ScreenShotError):
+            image.pixel(coord_x, coord_y)
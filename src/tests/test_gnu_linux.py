@@ -22,8 +22,9 @@ HEIGHT = 200
 DEPTH = 24
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def display() -> Generator:
+    # One Xvfb server for the whole module: its startup dominates each test
     with pyvirtualdisplay.Display(size=(WIDTH, HEIGHT), color_depth=DEPTH) as vdisplay:
         yield vdisplay.new_display_var
 
@@ -0,0 +1,95 @@
+"""Unit tests for GUI component helpers."""
+
+import os
+
+import pytest
+
+from pyshotter.gui_components import _ensure_thumb, _load_history_tail, _tail_lines
+
+
+class TestTailLines:
+    """Test reading the end of the history file."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = tmp_path / "history.jsonl"
+        path.write_bytes(b"".join(b'{"id": %d}\n' % i for i in range(100)))
+        return path
+
+    @pytest.mark.parametrize('block_size', [1, 7, 8192])
+    def test_last_lines(self, path, block_size):
+        lines = _tail_lines(path, 20, block_size=block_size)
+        assert lines == [b'{"id": %d}' % i for i in range(80, 100)]
+
+    def test_short_file(self, tmp_path):
+        path = tmp_path / "history.jsonl"
+        path.write_bytes(b'{"id": 0}\n{"id": 1}')
+        assert _tail_lines(path, 20) == [b'{"id": 0}', b'{"id": 1}']
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "history.jsonl"
+        path.write_bytes(b"")
+        assert _tail_lines(path, 20) == []
+
+
+    def test_partial_lines_skipped(self, tmp_path):
+        path = tmp_path / "history.jsonl"
+        path.write_bytes(b'{"id": 0}\n\n{"id": 1}\n{"id": 2, "pa')
+        assert _load_history_tail(path, 20) == [{'id': 0}, {'id': 1}]
+
+
+class TestThumbnails:
+    """Test the history thumbnail cache."""
+
+    @pytest.fixture
+    def png_path(self, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+        path = tmp_path / "abc.png"
+        Image.new('RGB', (512, 256), (255, 0, 0)).save(path)
+        return path
+
+    def test_thumbnail_created(self, png_path, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+        thumb = _ensure_thumb(png_path, tmp_path / "thumbs")
+
+        assert thumb == tmp_path / "thumbs" / "abc.png"
+        with Image.open(thumb) as img:
+            assert img.size == (128, 64)
+
+    def test_thumbnail_reused(self, png_path, tmp_path):
+        thumb = _ensure_thumb(png_path, tmp_path / "thumbs")
+        thumb.write_bytes(b"cached")
+        mtime = png_path.stat().st_mtime_ns
+        os.utime(thumb, ns=(mtime, mtime))
+
+        assert _ensure_thumb(png_path, tmp_path / "thumbs").read_bytes() == b"cached"
+
+    def test_thumbnail_refreshed_when_source_changes(self, png_path, tmp_path):
+        thumb = _ensure_thumb(png_path, tmp_path / "thumbs")
+        thumb.write_bytes(b"stale")
+        stat = png_path.stat()
+        os.utime(png_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert _ensure_thumb(png_path, tmp_path / "thumbs").read_bytes() != b"stale"
+
+
+class TestOverlay:
+    """Test reuse of the region selection overlay."""
+
+    def test_kept_by_creating_thread(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from pyshotter import gui_components
+
+        monkeypatch.setattr(gui_components, '_OVERLAY', None)
+        monkeypatch.setattr(gui_components, '_OVERLAY_THREAD', None)
+        monkeypatch.setattr(gui_components, '_create_overlay', lambda: (object(), object()))
+
+        root, canvas, kept = gui_components._get_overlay()
+        assert kept
+        assert gui_components._get_overlay() == (root, canvas, True)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other_root, _, other_kept = pool.submit(gui_components._get_overlay).result()
+        assert not other_kept
+        assert other_root is not root
@@ -0,0 +1,161 @@
+"""Unit tests for logging configuration."""
+
+import json
+import logging
+
+import pytest
+
+from pyshotter.logging_config import (
+    BufferedRotatingFileHandler,
+    ColoredConsoleFormatter,
+    FlushingMemoryHandler,
+    JSONFormatter,
+    LoggingConfig,
+    PrivacyFilter,
+    get_logger,
+)
+
+
+def make_record(msg, args=None):
+    """Create a log record."""
+    return logging.LogRecord('pyshotter.test', logging.INFO, __file__, 1, msg, args, None)
+
+
+class TestPrivacyFilter:
+    """Test sensitive data redaction in log records."""
+
+    @pytest.mark.parametrize('msg', [
+        "mail john@example.com now",
+        "call 555-123-4567",
+        "card 4111 1111 1111 1111",
+        "ssn 123-45-6789",
+        "key sk-" + "a" * 48,
+    ])
+    def test_redacts_sensitive_data(self, msg):
+        record = make_record(msg)
+        assert PrivacyFilter().filter(record) is True
+        assert "[REDACTED]" in record.msg
+
+    def test_redacts_arguments(self):
+        record = make_record("Saved: %s", ("john@example.com",))
+        PrivacyFilter().filter(record)
+        assert record.getMessage() == "Saved: [REDACTED]"
+
+    def test_redacts_once(self):
+        record = make_record("mail %s", ("john@example.com",))
+        PrivacyFilter().filter(record)
+        record.msg = "mail john@example.com"
+        assert PrivacyFilter().filter(record) is True
+        assert record.msg == "mail john@example.com"
+
+    def test_email_tld_letters_only(self):
+        record = make_record("mail john@example.c|m")
+        PrivacyFilter().filter(record)
+        assert record.msg == "mail john@example.c|m"
+
+    def test_keeps_plain_messages(self):
+        record = make_record("Capture completed")
+        assert PrivacyFilter().filter(record) is True
+        assert record.msg == "Capture completed"
+
+    def test_non_string_message(self):
+        record = make_record(42)
+        PrivacyFilter().filter(record)
+        assert record.getMessage() == "42"
+
+
+class TestLoggingConfig:
+    """Test handler configuration."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        config = LoggingConfig(log_dir=tmp_path, console_output=False)
+        yield config
+        config.shutdown()
+        logging.getLogger('pyshotter').handlers.clear()
+
+    def test_records_written_by_listener(self, config, tmp_path):
+        logging.getLogger('pyshotter.test').info("queued message")
+        config.shutdown()
+
+        assert "queued message" in (tmp_path / "pyshotter.log").read_text()
+
+    def test_reconfigure_stops_previous_listener(self, config, tmp_path):
+        listener = config.listener
+        other = LoggingConfig(log_dir=tmp_path, console_output=False)
+
+        assert listener._thread is None
+        assert len(logging.getLogger('pyshotter').handlers) == 1
+        other.shutdown()
+
+    def test_warning_flushes_buffered_records(self, config, tmp_path):
+        logger = logging.getLogger('pyshotter.test')
+        logger.info("buffered message")
+        config.listener.stop()
+        assert "buffered message" not in (tmp_path / "pyshotter.log").read_text()
+
+        config.listener.start()
+        logger.warning("flushing message")
+        config.listener.stop()
+        text = (tmp_path / "pyshotter.log").read_text()
+        assert text.index("buffered message") < text.index("flushing message")
+
+    def test_memory_handler_closes_target(self, tmp_path):
+        target = BufferedRotatingFileHandler(tmp_path / "test.log")
+        handler = FlushingMemoryHandler(capacity=10, target=target)
+        handler.handle(make_record("buffered message"))
+        handler.close()
+
+        assert target.stream is None
+        assert (tmp_path / "test.log").read_text() == "buffered message\n"
+
+    def test_rollover(self, tmp_path):
+        handler = BufferedRotatingFileHandler(tmp_path / "test.log", maxBytes=100, backupCount=1)
+        try:
+            for i in range(10):
+                handler.emit(make_record(f"message {i:02d}" + "x" * 20))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "test.log.1").exists()
+        assert (tmp_path / "test.log").read_text().endswith("message 09" + "x" * 20 + "\n")
+
+
+class TestJSONFormatter:
+    """Test structured log formatting."""
+
+    @pytest.mark.parametrize('orjson_available', [True, False])
+    def test_format(self, monkeypatch, orjson_available):
+        if orjson_available:
+            pytest.importorskip('orjson')
+        monkeypatch.setattr('pyshotter.logging_config.ORJSON_AVAILABLE', orjson_available)
+        record = make_record("took %d ms", (12,))
+        record.created = 0.5
+        record.performance_ms = 12.5
+
+        data = json.loads(JSONFormatter().format(record))
+        assert data['timestamp'] == "1970-01-01T00:00:00.500000+00:00"
+        assert data['message'] == "took 12 ms"
+        assert data['logger'] == 'pyshotter.test'
+        assert data['performance_ms'] == 12.5
+
+
+def test_get_logger_cached():
+    assert get_logger('cached') is get_logger('cached')
+    assert get_logger('cached').name == 'pyshotter.cached'
+
+
+class TestColoredConsoleFormatter:
+    """Test console coloring."""
+
+    def test_record_not_modified(self):
+        record = make_record("hello")
+        formatted = ColoredConsoleFormatter('%(levelname)s - %(message)s').format(record)
+
+        assert formatted == "\033[32mINFO - hello\033[0m"
+        assert record.levelname == 'INFO'
+
+    def test_unknown_level_uncolored(self):
+        record = make_record("hello")
+        record.levelno = 25
+        assert ColoredConsoleFormatter('%(message)s').format(record) == "hello"
@@ -1,6 +1,8 @@
 """Unit tests for screen recording."""
 
 import pytest
+import queue
+import subprocess
 import time
 import tempfile
 from pathlib import Path
@@ -27,6 +29,12 @@ class TestScreenRecording:
         with pytest.raises(RecordingError):
             ScreenRecordingFeature(fps=100)  # Too high
     
+    def test_recording_init_invalid_scale(self):
+        """Test recorder initialization with an invalid scale."""
+        for scale in (0, -0.5, 1.5):
+            with pytest.raises(RecordingError):
+                ScreenRecordingFeature(scale=scale)
+    
     def test_recording_start_stop(self):
         """Test starting and stopping recording."""
         recorder = ScreenRecordingFeature()
@@ -36,8 +44,8 @@ class TestScreenRecording:
         assert recording_id is not None
         assert recording_id in recorder._recordings
         
-        # Let it record for a bit
-        time.sleep(0.5)
+        # Wait for a frame rather than a fixed delay
+        assert recorder._recordings[recording_id]['frame_captured'].wait(5)
         
         # Stop recording
         with tempfile.NamedTemporaryFile(suffix='.gif', delete=False) as f:
@@ -114,7 +122,7 @@ class TestScreenRecording:
         recording_id = recorder.start_recording(max_duration=1)
         assert recording_id in recorder._recordings
         
-        time.sleep(0.2)
+        assert recorder._recordings[recording_id]['frame_captured'].wait(5)
         
         with tempfile.NamedTemporaryFile(suffix='.gif') as f:
             recorder.stop_recording(recording_id, f.name)
@@ -127,14 +135,432 @@ class TestScreenRecording:
 class TestRecordingPerformance:
     """Performance tests for recording."""
     
-    def test_frame_capture_performance(self, benchmark):
-        """Benchmark frame capture performance."""
-        recorder = ScreenRecordingFeature(fps=30)
+    @pytest.mark.parametrize("format", ["gif", "mp4"])
+    def test_frame_encode_performance(self, benchmark, tmp_path, format):
+        """Benchmark encoding pre-captured frames, independent of capture latency."""
+        import numpy as np
+        
+        from pyshotter.recording import _BgraVideoWriter
+        
+        recorder = ScreenRecordingFeature(fps=30, format=format)
+        path = str(tmp_path / f"bench.{format}")
+        # Same frame layout as the capture loop hands to this writer
+        channels = 4 if isinstance(recorder._open_writer(path), _BgraVideoWriter) else 3
+        rng = np.random.default_rng(0)
+        base = rng.integers(0, 256, (270, 480, channels), dtype=np.uint8)
+        frames = []
+        for i in range(30):
+            frame = base.copy()
+            frame[i * 8:i * 8 + 32, i * 14:i * 14 + 64] = rng.integers(0, 256, channels, dtype=np.uint8)
+            frames.append(frame)
+        overlay = recorder._render_overlay("PyShotter")
+        
+        def encode_all():
+            writer = recorder._open_writer(path)
+            try:
+                for frame in frames:
+                    recorder._encode_frame(writer, frame.copy(), overlay)
+            finally:
+                writer.close()
+        
+        benchmark(encode_all)
+
+
+class TestRecordingWriter:
+    """Test streaming frames to the encoder."""
+    
+    @pytest.fixture
+    def recording(self, tmp_path):
+        recorder = ScreenRecordingFeature(fps=10, format='gif')
+        tmp_file = tmp_path / "stream.gif"
+        return recorder, {
+            'writer': recorder._open_writer(str(tmp_file)),
+            'tmp_path': str(tmp_file),
+            'frame_count': 0,
+        }
+    
+    def test_frames_streamed_to_output(self, recording, tmp_path):
+        """Frames appended while recording end up in the saved file."""
+        import numpy as np
+        from PIL import Image
+        
+        from pyshotter.recording import _BgraVideoWriter
+        
+        recorder, state = recording
+        channels = 4 if isinstance(state['writer'], _BgraVideoWriter) else 3
+        for value in (0, 128, 255):
+            state['writer'].append_data(np.full((16, 16, channels), value, dtype=np.uint8))
+            state['frame_count'] += 1
+        
+        output = tmp_path / "out.gif"
+        assert recorder._save_recording(state, str(output)) == str(output.absolute())
+        assert not Path(state['tmp_path']).exists()
+        with Image.open(output) as img:
+            assert img.n_frames == 3
+    
+    @pytest.mark.parametrize("interval", [0, 1.0])
+    def test_gif_streams_bgra(self, monkeypatch, recording, tmp_path, interval):
+        """GIF frames are written as raw BGRA, ignoring alpha, and encoded by ffmpeg."""
+        import numpy as np
+        from PIL import Image
+        pytest.importorskip("imageio_ffmpeg")
+        from pyshotter.recording import _BgraGifWriter
+        
+        monkeypatch.setattr(_BgraGifWriter, 'PALETTE_INTERVAL', interval)
+        recorder, state = recording
+        # Without a new palette for each frame, later frames reuse the colors of the first
+        colors = [(0, 0, 255), (0, 255, 0), (255, 0, 0)] if interval == 0 else [(0, 0, 255)] * 3
+        for red, green, blue in colors:
+            frame = np.zeros((24, 40, 4), dtype=np.uint8)
+            frame[:, :] = (blue, green, red, 0)
+            frame[:8, :8] = (255, 255, 255, 0)
+            state['writer'].append_data(frame)
+            state['frame_count'] += 1
+        
+        output = tmp_path / "out.gif"
+        recorder._save_recording(state, str(output))
+        with Image.open(output) as img:
+            assert img.n_frames == 3
+            assert img.size == (40, 24)
+            for index, color in enumerate(colors):
+                img.seek(index)
+                rgb = img.convert('RGB')
+                assert rgb.getpixel((20, 12)) == color
+                assert rgb.getpixel((2, 2)) == (255, 255, 255)
+    
+    def test_gif_delta_frames(self, recording, tmp_path):
+        """GIF frames only store the changed rectangle, over one shared palette."""
+        import numpy as np
+        from PIL import Image
+        
+        from pyshotter.recording import _PaletteGifWriter
+        
+        recorder, state = recording
+        # Pillow encoder, used when imageio-ffmpeg is missing
+        state['writer'] = _PaletteGifWriter(state['tmp_path'], recorder.fps)
+        frames = [np.zeros((32, 32, 3), dtype=np.uint8) for _ in range(3)]
+        frames[1][4:8, 10:20] = (255, 0, 0)
+        frames[2][:] = frames[1]
+        for frame in frames:
+            state['writer'].append_data(frame)
+            state['frame_count'] += 1
+        
+        output = tmp_path / "out.gif"
+        recorder._save_recording(state, str(output))
+        with Image.open(output) as img:
+            assert img.n_frames == 3
+            assert img.info['duration'] == 100
+            for index, frame in enumerate(frames):
+                img.seek(index)
+                assert np.array_equal(np.asarray(img.convert('RGB')), frame)
+                if index == 1:
+                    assert img.dispose_extent == (10, 4, 20, 8)
+    
+    def test_no_frames(self, recording, tmp_path):
+        """Saving without frames fails."""
+        recorder, state = recording
+        
+        with pytest.raises(RecordingError):
+            recorder._save_recording(state, str(tmp_path / "out.gif"))
+    
+    def test_encode_loop_drains_queue(self, recording):
+        """The encoder writes queued frames until the end sentinel."""
+        import numpy as np
+        
+        recorder, state = recording
+        frames = []
+        state['writer'] = type('Writer', (), {'append_data': lambda self, frame: frames.append(frame.copy())})()
+        state.update(
+            frame_queue=queue.SimpleQueue(),
+            frame_pool=[np.full((4, 4, 3), value, dtype=np.uint8) for value in (1, 2)],
+            free_slots=queue.SimpleQueue(),
+            encode_error=None,
+            overlay=None,
+        )
+        for slot in (0, 1):
+            state['frame_queue'].put(slot)
+        state['frame_queue'].put(None)
+        
+        recorder._encode_loop(state)
+        assert state['frame_count'] == 2
+        assert [int(frame[0, 0, 0]) for frame in frames] == [1, 2]
+        
+        # Buffers are handed back for reuse
+        assert sorted(state['free_slots'].get_nowait() for _ in range(2)) == [0, 1]
+    
+    def test_encode_error_reported(self, recording, tmp_path):
+        """An encoder failure surfaces when saving, after the queue is drained."""
+        import numpy as np
+        
+        recorder, state = recording
+        state['writer'] = type('Writer', (), {'append_data': lambda self, frame: 1 / 0})()
+        state.update(
+            frame_queue=queue.SimpleQueue(),
+            frame_pool=[np.zeros((4, 4, 3), dtype=np.uint8)],
+            free_slots=queue.SimpleQueue(),
+            encode_error=None,
+            overlay=None,
+        )
+        for _ in range(3):
+            state['frame_queue'].put(0)
+        state['frame_queue'].put(None)
+        
+        recorder._encode_loop(state)
+        assert state['frame_queue'].empty()
+        assert state['free_slots'].qsize() == 3
+        with pytest.raises(RecordingError):
+            recorder._save_recording(state, str(tmp_path / "out.gif"))
+
+    def test_stuck_capture_reported(self, recording):
+        """A capture thread that won't stop fails the recording without hanging."""
+        import threading
+        
+        recorder, state = recording
+        stuck = type('StuckThread', (), {'join': lambda self, timeout: None, 'is_alive': lambda self: True})()
+        state.update(
+            stop_event=threading.Event(),
+            frame_queue=queue.SimpleQueue(),
+            frame_pool=[],
+            free_slots=queue.SimpleQueue(),
+            encode_error=None,
+            overlay=None,
+            capture_thread=stuck,
+        )
+        state['encode_thread'] = threading.Thread(target=recorder._encode_loop, args=(state,))
+        state['encode_thread'].start()
+        recorder._recordings['rec'] = state
         
-        # This will test the recording initialization
-        def record_short():
-            with tempfile.NamedTemporaryFile(suffix='.gif', delete=False) as f:
-                output = recorder.record(duration=0.5, output=f.name)
-                Path(output).unlink()
+        with pytest.raises(RecordingError, match="capture_thread"):
+            recorder.stop_recording('rec')
+        assert not state['encode_thread'].is_alive()
+        assert 'rec' not in recorder._recordings
+
+    def test_mp4_streams_bgra(self, tmp_path):
+        """MP4 frames are written as raw BGRA and converted by ffmpeg."""
+        import numpy as np
+        imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+        
+        recorder = ScreenRecordingFeature(fps=10, format='mp4')
+        tmp_file = tmp_path / "stream.mp4"
+        writer = recorder._open_writer(str(tmp_file))
+        state = {'writer': writer, 'tmp_path': str(tmp_file), 'frame_count': 0}
+        
+        frame = np.zeros((32, 32, 4), dtype=np.uint8)
+        frame[:, :, 2] = 255  # Red in BGRA
+        for _ in range(3):
+            writer.append_data(frame)
+            state['frame_count'] += 1
+        
+        output = tmp_path / "out.mp4"
+        recorder._save_recording(state, str(output))
+        decoded = subprocess.run(
+            [imageio_ffmpeg.get_ffmpeg_exe(), '-i', str(output), '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'],
+            capture_output=True, check=True,
+        ).stdout
+        assert len(decoded) == 3 * 32 * 32 * 3
+        first = np.frombuffer(decoded, dtype=np.uint8)[:32 * 32 * 3].reshape(32, 32, 3)
+        assert first[16, 16, 0] > 200 and first[16, 16, 2] < 60
+    
+    def test_encode_loop_blends_overlay_into_bgra(self, recording):
+        """The RGB watermark lands in the right channels of BGRA frames."""
+        import numpy as np
+        
+        recorder, state = recording
+        frames = []
+        state['writer'] = type('Writer', (), {'append_data': lambda self, frame: frames.append(frame.copy())})()
+        state.update(
+            frame_queue=queue.SimpleQueue(),
+            frame_pool=[np.zeros((40, 200, 4), dtype=np.uint8)],
+            free_slots=queue.SimpleQueue(),
+            encode_error=None,
+            overlay=(150, 30, np.zeros((10, 10, 1), np.float32), np.full((10, 10, 3), (255, 0, 0), np.float32)),
+        )
+        state['frame_queue'].put(0)
+        state['frame_queue'].put(None)
+        
+        recorder._encode_loop(state)
+        assert frames[0][15, 55].tolist() == [0, 0, 255, 0]
+
+    def test_progress_loop_reports_seconds(self):
+        """Progress tuples are reported in seconds until the end sentinel."""
+        calls = []
+        progress_queue = queue.SimpleQueue()
+        progress_queue.put((10, 1_500_000_000))
+        progress_queue.put((20, 3_000_000_000))
+        progress_queue.put(None)
+        
+        ScreenRecordingFeature._progress_loop(progress_queue, lambda *args: calls.append(args), 5)
+        assert calls == [(10, 1.5, 3.5), (20, 3.0, 2.0)]
+    
+    def test_progress_loop_survives_callback_error(self):
+        """A failing callback doesn't stop progress reporting."""
+        calls = []
         
-        benchmark(record_short)
+        def callback(frame_count, elapsed, eta):
+            calls.append(frame_count)
+            raise ValueError("boom")
+        
+        progress_queue = queue.SimpleQueue()
+        progress_queue.put((10, 0))
+        progress_queue.put((20, 0))
+        progress_queue.put(None)
+        
+        ScreenRecordingFeature._progress_loop(progress_queue, callback, float('inf'))
+        assert calls == [10, 20]
+
+
+class TestHardwareEncoder:
+    """Test hardware H.264 encoder selection."""
+    
+    @pytest.fixture
+    def probe(self, monkeypatch):
+        """Fake ffmpeg test encodes, succeeding for the given encoders."""
+        pytest.importorskip("imageio_ffmpeg")
+        from pyshotter import recording
+        
+        working = set()
+        probed = []
+        
+        def fake_run(cmd, **kwargs):
+            codec = cmd[cmd.index('-c:v') + 1]
+            probed.append(codec)
+            return subprocess.CompletedProcess(cmd, 0 if codec in working else 1)
+        
+        monkeypatch.setattr(recording.subprocess, 'run', fake_run)
+        recording._hardware_h264_encoder.cache_clear()
+        yield working, probed
+        recording._hardware_h264_encoder.cache_clear()
+    
+    def test_first_working_encoder(self, probe):
+        from pyshotter.recording import _hardware_h264_encoder
+        
+        working, probed = probe
+        working.add('h264_videotoolbox')
+        assert _hardware_h264_encoder() == 'h264_videotoolbox'
+        assert _hardware_h264_encoder() == 'h264_videotoolbox'
+        assert probed == ['h264_nvenc', 'h264_videotoolbox']
+    
+    def test_software_fallback(self, probe, tmp_path):
+        recorder = ScreenRecordingFeature(format='mp4')
+        assert recorder._open_writer(str(tmp_path / "out.mp4")).codec == 'libx264'
+    
+    def test_gif_not_probed(self, probe, tmp_path):
+        _, probed = probe
+        recorder = ScreenRecordingFeature(format='gif')
+        assert recorder._open_writer(str(tmp_path / "out.gif")).codec == 'gif'
+        assert probed == []
+
+
+class TestDownscale:
+    """Test downscaling captures into recording frames."""
+    
+    @pytest.mark.parametrize("opencv", [True, False])
+    @pytest.mark.parametrize("channels", [3, 4])
+    def test_downscale_into(self, monkeypatch, opencv, channels):
+        import numpy as np
+        
+        from pyshotter import recording
+        from pyshotter.screenshot import ScreenShot
+        
+        if opencv:
+            pytest.importorskip("cv2")
+        monkeypatch.setattr(recording, 'OPENCV_AVAILABLE', opencv)
+        
+        # Left half blue, right half red, in BGRA
+        bgra = np.zeros((4, 8, 4), dtype=np.uint8)
+        bgra[:, :4, 0] = 255
+        bgra[:, 4:, 2] = 255
+        screenshot = ScreenShot.from_size(bytearray(bgra.tobytes()), 8, 4)
+        
+        out = np.empty((2, 4, channels), dtype=np.uint8)
+        ScreenRecordingFeature._downscale_into(screenshot, out)
+        expected = bgra[::2, ::2, :3] if channels == 4 else bgra[::2, ::2, 2::-1]
+        assert np.array_equal(out[:, :, :3], expected)
+
+
+class TestCaptureLoop:
+    """Test the capture loop against a fake grabber."""
+    
+    @pytest.fixture
+    def fake_grabber(self, monkeypatch):
+        from pyshotter import factory
+        from pyshotter.screenshot import ScreenShot
+        
+        class FakeGrabber:
+            def __init__(self):
+                self.monitors = [{}, {'left': 0, 'top': 0, 'width': 8, 'height': 4}]
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *args):
+                pass
+            
+            def grab(self, monitor):
+                return ScreenShot.from_size(bytearray(8 * 4 * 4), 8, 4)
+        
+        monkeypatch.setattr(factory, 'pyshotter', FakeGrabber)
+    
+    def test_paused_recording_keeps_running(self, fake_grabber):
+        """Pausing holds capture without ending the loop; resuming continues."""
+        import threading
+        
+        recorder = ScreenRecordingFeature(fps=60, format='gif')
+        recording = {
+            'region': None,
+            'start_ns': time.monotonic_ns(),
+            'max_duration': 10,
+            'progress_callback': None,
+            'stop_event': threading.Event(),
+            'pause_event': threading.Event(),
+            'frame_captured': threading.Event(),
+            'frame_queue': queue.SimpleQueue(),
+            'frame_pool': None,
+            'free_slots': queue.SimpleQueue(),
+            'dropped_frames': 0,
+            'bgra_frames': False,
+        }
+        recorder._recordings['rec'] = recording
+        recording['pause_event'].set()
+        
+        thread = threading.Thread(target=recorder._capture_loop, args=('rec',))
+        thread.start()
+        assert not recording['frame_captured'].wait(0.2)
+        assert thread.is_alive()
+        assert recording['frame_queue'].empty()
+        
+        recording['pause_event'].clear()
+        assert recording['frame_captured'].wait(5)
+        recording['stop_event'].set()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        
+        slots = []
+        while (slot := recording['frame_queue'].get_nowait()) is not None:
+            slots.append(slot)
+        assert slots
+        assert recording['frame_pool'][0].shape == (4, 8, 3)
+
+
+class TestRecordingOverlay:
+    """Test the pre-rendered watermark."""
+    
+    def test_overlay_blended_bottom_right(self):
+        import numpy as np
+        
+        recorder = ScreenRecordingFeature()
+        overlay = recorder._render_overlay("PyShotter")
+        assert overlay is not None
+        
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+        recorder._blend_overlay(frame, overlay)
+        ys, xs = np.nonzero(frame.any(axis=2))
+        assert xs.min() >= 200 - 150 and ys.min() >= 100 - 30
+    
+    def test_overlay_clipped_to_small_frames(self):
+        import numpy as np
+        
+        recorder = ScreenRecordingFeature()
+        frame = np.zeros((20, 20, 3), dtype=np.uint8)
+        recorder._blend_overlay(frame, recorder._render_overlay("PyShotter"))
+        assert frame.shape == (20, 20, 3)
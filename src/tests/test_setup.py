@@ -4,7 +4,8 @@ Source: https://github.com/utachicodes/pyshotter.
 
 import platform
 import tarfile
-from subprocess import STDOUT, check_call, check_output
+from pathlib import Path
+from subprocess import PIPE, STDOUT, Popen, check_call
 from zipfile import ZipFile
 
 import pytest
@@ -17,114 +18,148 @@ if platform.system().lower() != "linux":
 pytest.importorskip("build")
 pytest.importorskip("twine")
 
-SDIST = "python -m build --sdist".split()
-WHEEL = "python -m build --wheel".split()
+BUILD = "python -m build --sdist --wheel --outdir".split()
 CHECK = "twine check --strict".split()
-
-
-def test_sdist() -> None:
-    output = check_output(SDIST, stderr=STDOUT, text=True)
-    file = f"pyshotter-{__version__}.tar.gz"
-    assert f"Successfully built {file}" in output
-    assert "warning" not in output.lower()
-
-    check_call([*CHECK, f"dist/{file}"])
-
-    with tarfile.open(f"dist/{file}", mode="r:gz") as fh:
-        files = sorted(fh.getnames())
-
-    assert files == [
-        f"pyshotter-{__version__}/.gitignore",
-        f"pyshotter-{__version__}/CHANGELOG.md",
-        f"pyshotter-{__version__}/CHANGES.md",
-        f"pyshotter-{__version__}/CONTRIBUTORS.md",
-        f"pyshotter-{__version__}/LICENSE.txt",
-        f"pyshotter-{__version__}/PKG-INFO",
-        f"pyshotter-{__version__}/README.md",
-        f"pyshotter-{__version__}/docs/source/api.rst",
-        f"pyshotter-{__version__}/docs/source/conf.py",
-        f"pyshotter-{__version__}/docs/source/developers.rst",
-        f"pyshotter-{__version__}/docs/source/examples.rst",
-        f"pyshotter-{__version__}/docs/source/examples/callback.py",
-        f"pyshotter-{__version__}/docs/source/examples/custom_cls_image.py",
-        f"pyshotter-{__version__}/docs/source/examples/fps.py",
-        f"pyshotter-{__version__}/docs/source/examples/fps_multiprocessing.py",
-        f"pyshotter-{__version__}/docs/source/examples/from_pil_tuple.py",
-        f"pyshotter-{__version__}/docs/source/examples/linux_display_keyword.py",
-        f"pyshotter-{__version__}/docs/source/examples/opencv_numpy.py",
-        f"pyshotter-{__version__}/docs/source/examples/part_of_screen.py",
-        f"pyshotter-{__version__}/docs/source/examples/part_of_screen_monitor_2.py",
-        f"pyshotter-{__version__}/docs/source/examples/pil.py",
-        f"pyshotter-{__version__}/docs/source/examples/pil_pixels.py",
-        f"pyshotter-{__version__}/docs/source/index.rst",
-        f"pyshotter-{__version__}/docs/source/installation.rst",
-        f"pyshotter-{__version__}/docs/source/support.rst",
-        f"pyshotter-{__version__}/docs/source/usage.rst",
-        f"pyshotter-{__version__}/docs/source/where.rst",
-        f"pyshotter-{__version__}/pyproject.toml",
-        f"pyshotter-{__version__}/src/pyshotter/__init__.py",
-        f"pyshotter-{__version__}/src/pyshotter/__main__.py",
-        f"pyshotter-{__version__}/src/pyshotter/base.py",
-        f"pyshotter-{__version__}/src/pyshotter/darwin.py",
-        f"pyshotter-{__version__}/src/pyshotter/exception.py",
-        f"pyshotter-{__version__}/src/pyshotter/factory.py",
-        f"pyshotter-{__version__}/src/pyshotter/linux.py",
-        f"pyshotter-{__version__}/src/pyshotter/models.py",
-        f"pyshotter-{__version__}/src/pyshotter/py.typed",
-        f"pyshotter-{__version__}/src/pyshotter/screenshot.py",
-        f"pyshotter-{__version__}/src/pyshotter/tools.py",
-        f"pyshotter-{__version__}/src/pyshotter/windows.py",
-        f"pyshotter-{__version__}/src/tests/__init__.py",
-        f"pyshotter-{__version__}/src/tests/bench_bgra2rgb.py",
-        f"pyshotter-{__version__}/src/tests/bench_general.py",
-        f"pyshotter-{__version__}/src/tests/conftest.py",
-        f"pyshotter-{__version__}/src/tests/res/monitor-1024x768.raw.zip",
-        f"pyshotter-{__version__}/src/tests/test_bgra_to_rgb.py",
-        f"pyshotter-{__version__}/src/tests/test_cls_image.py",
-        f"pyshotter-{__version__}/src/tests/test_find_monitors.py",
-        f"pyshotter-{__version__}/src/tests/test_get_pixels.py",
-        f"pyshotter-{__version__}/src/tests/test_gnu_linux.py",
-        f"pyshotter-{__version__}/src/tests/test_implementation.py",
-        f"pyshotter-{__version__}/src/tests/test_issue_220.py",
-        f"pyshotter-{__version__}/src/tests/test_leaks.py",
-        f"pyshotter-{__version__}/src/tests/test_macos.py",
-        f"pyshotter-{__version__}/src/tests/test_save.py",
-        f"pyshotter-{__version__}/src/tests/test_setup.py",
-        f"pyshotter-{__version__}/src/tests/test_tools.py",
-        f"pyshotter-{__version__}/src/tests/test_windows.py",
-        f"pyshotter-{__version__}/src/tests/third_party/__init__.py",
-        f"pyshotter-{__version__}/src/tests/third_party/test_numpy.py",
-        f"pyshotter-{__version__}/src/tests/third_party/test_pil.py",
-    ]
-
-
-def test_wheel() -> None:
-    output = check_output(WHEEL, stderr=STDOUT, text=True)
-    file = f"pyshotter-{__version__}-py3-none-any.whl"
-    assert f"Successfully built {file}" in output
-    assert "warning" not in output.lower()
-
-    check_call([*CHECK, f"dist/{file}"])
-
-    with ZipFile(f"dist/{file}") as fh:
-        files = sorted(fh.namelist())
-
-    assert files == [
-        f"pyshotter-{__version__}.dist-info/METADATA",
-        f"pyshotter-{__version__}.dist-info/RECORD",
-        f"pyshotter-{__version__}.dist-info/WHEEL",
-        f"pyshotter-{__version__}.dist-info/entry_points.txt",
-        f"pyshotter-{__version__}.dist-info/licenses/LICENSE.txt",
-        "pyshotter/__init__.py",
-        "pyshotter/__main__.py",
-        "pyshotter/base.py",
-        "pyshotter/darwin.py",
-        "pyshotter/exception.py",
-        "pyshotter/factory.py",
-        "pyshotter/linux.py",
-        "pyshotter/models.py",
-        "pyshotter/py.typed",
-        "pyshotter/screenshot.py",
-        "pyshotter/tools.py",
-        "pyshotter/windows.py",
-    ]
+SDIST = f"pyshotter-{__version__}.tar.gz"
+WHEEL = f"pyshotter-{__version__}-py3-none-any.whl"
+
+# Expected archive members, each checked on its own
+SDIST_FILES = frozenset(
+    f"pyshotter-{__version__}/{name}"
+    for name in (
+        ".gitignore",
+        "CHANGELOG.md",
+        "CHANGES.md",
+        "CONTRIBUTORS.md",
+        "LICENSE.txt",
+        "PKG-INFO",
+        "README.md",
+        "docs/source/api.rst",
+        "docs/source/conf.py",
+        "docs/source/developers.rst",
+        "docs/source/examples.rst",
+        "docs/source/examples/callback.py",
+        "docs/source/examples/custom_cls_image.py",
+        "docs/source/examples/fps.py",
+        "docs/source/examples/fps_multiprocessing.py",
+        "docs/source/examples/from_pil_tuple.py",
+        "docs/source/examples/linux_display_keyword.py",
+        "docs/source/examples/opencv_numpy.py",
+        "docs/source/examples/part_of_screen.py",
+        "docs/source/examples/part_of_screen_monitor_2.py",
+        "docs/source/examples/pil.py",
+        "docs/source/examples/pil_pixels.py",
+        "docs/source/index.rst",
+        "docs/source/installation.rst",
+        "docs/source/support.rst",
+        "docs/source/usage.rst",
+        "docs/source/where.rst",
+        "pyproject.toml",
+        "src/pyshotter/__init__.py",
+        "src/pyshotter/__main__.py",
+        "src/pyshotter/base.py",
+        "src/pyshotter/darwin.py",
+        "src/pyshotter/exception.py",
+        "src/pyshotter/factory.py",
+        "src/pyshotter/linux.py",
+        "src/pyshotter/models.py",
+        "src/pyshotter/py.typed",
+        "src/pyshotter/screenshot.py",
+        "src/pyshotter/tools.py",
+        "src/pyshotter/windows.py",
+        "src/tests/__init__.py",
+        "src/tests/bench_bgra2rgb.py",
+        "src/tests/bench_general.py",
+        "src/tests/conftest.py",
+        "src/tests/res/monitor-1024x768.raw.zip",
+        "src/tests/test_bgra_to_rgb.py",
+        "src/tests/test_cls_image.py",
+        "src/tests/test_find_monitors.py",
+        "src/tests/test_get_pixels.py",
+        "src/tests/test_gnu_linux.py",
+        "src/tests/test_implementation.py",
+        "src/tests/test_issue_220.py",
+        "src/tests/test_leaks.py",
+        "src/tests/test_macos.py",
+        "src/tests/test_save.py",
+        "src/tests/test_setup.py",
+        "src/tests/test_tools.py",
+        "src/tests/test_windows.py",
+        "src/tests/third_party/__init__.py",
+        "src/tests/third_party/test_numpy.py",
+        "src/tests/third_party/test_pil.py",
+    )
+)
+WHEEL_FILES = frozenset({
+    f"pyshotter-{__version__}.dist-info/METADATA",
+    f"pyshotter-{__version__}.dist-info/RECORD",
+    f"pyshotter-{__version__}.dist-info/WHEEL",
+    f"pyshotter-{__version__}.dist-info/entry_points.txt",
+    f"pyshotter-{__version__}.dist-info/licenses/LICENSE.txt",
+    "pyshotter/__init__.py",
+    "pyshotter/__main__.py",
+    "pyshotter/base.py",
+    "pyshotter/darwin.py",
+    "pyshotter/exception.py",
+    "pyshotter/factory.py",
+    "pyshotter/linux.py",
+    "pyshotter/models.py",
+    "pyshotter/py.typed",
+    "pyshotter/screenshot.py",
+    "pyshotter/tools.py",
+    "pyshotter/windows.py",
+})
+
+
+@pytest.fixture(scope="session")
+def dist(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the sdist and the wheel in a single run, and check both at once."""
+    outdir = tmp_path_factory.mktemp("dist")
+    # Scan the build log line by line as it comes, instead of buffering it whole
+    built = ""
+    warnings = []
+    with Popen([*BUILD, str(outdir)], stdout=PIPE, stderr=STDOUT, text=True) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            if line.startswith("Successfully built "):
+                built = line
+            elif "warning" in line.lower():
+                warnings.append(line)
+    assert proc.returncode == 0
+    assert SDIST in built
+    assert WHEEL in built
+    assert not warnings, warnings
+
+    check_call([*CHECK, str(outdir / SDIST), str(outdir / WHEEL)])
+    return outdir
+
+
+@pytest.fixture(scope="session")
+def sdist_members(dist: Path) -> frozenset[str]:
+    # Stream the headers once, without random access to the archive
+    with tarfile.open(dist / SDIST, mode="r|gz") as fh:
+        return frozenset(member.name for member in fh)
+
+
+@pytest.fixture(scope="session")
+def wheel_members(dist: Path) -> frozenset[str]:
+    with ZipFile(dist / WHEEL) as fh:
+        return frozenset(fh.namelist())
+
+
+@pytest.mark.parametrize("member", sorted(SDIST_FILES))
+def test_sdist_contains(member: str, sdist_members: frozenset[str]) -> None:
+    assert member in sdist_members
+
+
+def test_sdist_no_extras(sdist_members: frozenset[str]) -> None:
+    assert sdist_members <= SDIST_FILES, sdist_members - SDIST_FILES
+
+
+@pytest.mark.parametrize("member", sorted(WHEEL_FILES))
+def test_wheel_contains(member: str, wheel_members: frozenset[str]) -> None:
+    assert member in wheel_members
+
+
+def test_wheel_no_extras(wheel_members: frozenset[str]) -> None:
+    assert wheel_members <= WHEEL_FILES, wheel_members - WHEEL_FILES
@@ -9,8 +9,8 @@ from pathlib import Path
 
 import pytest
 
-from pyshotter import mss
-from pyshotter.tools import to_png
+from pyshotter import pyshotter
+from pyshotter.tools import bgra_to_png, to_png
 
 WIDTH = 10
 HEIGHT = 10
@@ -18,7 +18,7 @@ MD5SUM = "ee1b645cc989cbfc48e613b395a929d3d79a922b77b9b38e46647ff6f74acef5"
 
 
 def test_bad_compression_level() -> None:
-    with mss(compression_level=42, display=os.getenv("DISPLAY")) as sct, pytest.raises(zlib.error):
+    with pyshotter(compression_level=42, display=os.getenv("DISPLAY")) as sct, pytest.raises(zlib.error):
         sct.shot()
 
 
@@ -26,7 +26,7 @@ def test_compression_level() -> None:
     data = b"rgb" * WIDTH * HEIGHT
     output = Path(f"{WIDTH}x{HEIGHT}.png")
 
-    with mss(display=os.getenv("DISPLAY")) as sct:
+    with pyshotter(display=os.getenv("DISPLAY")) as sct:
         to_png(data, (WIDTH, HEIGHT), level=sct.compression_level, output=output)
 
     assert hashlib.sha256(output.read_bytes()).hexdigest() == MD5SUM
@@ -69,3 +69,14 @@ def test_output_raw_bytes() -> None:
     raw = to_png(data, (WIDTH, HEIGHT))
     assert isinstance(raw, bytes)
     assert hashlib.sha256(raw).hexdigest() == MD5SUM
+
+
+@pytest.mark.parametrize("level", [0, 1, 6, 9])
+def test_bgra_to_png(level: int) -> None:
+    raw = bytes(i % 256 for i in range(WIDTH * HEIGHT * 4))
+    rgb = bytearray(WIDTH * HEIGHT * 3)
+    rgb[::3] = raw[2::4]
+    rgb[1::3] = raw[1::4]
+    rgb[2::3] = raw[::4]
+
+    assert bgra_to_png(raw, (WIDTH, HEIGHT), level=level) == to_png(bytes(rgb), (WIDTH, HEIGHT), level=level)
@@ -4,7 +4,9 @@ Source: https://github.com/utachicodes/pyshotter.
 
 from __future__ import annotations
 
-import threading
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 import pytest
 
@@ -16,6 +18,9 @@ try:
 except ImportError:
     pytestmark = pytest.mark.skip
 
+#: Scale of the thread-safety tests: lower it in CI, raise it for stress runs
+LOOPS = int(os.getenv("PYSHOTTER_THREAD_LOOPS", "10"))
+
 
 def test_implementation(monkeypatch: pytest.MonkeyPatch) -> None:
     # Test bad data retrieval
@@ -77,18 +82,37 @@ def run_child_thread(loops: int) -> None:
             sct.grab(sct.monitors[1])
 
 
+def run_child_thread_shared(loops: int) -> None:
+    with pyshotter.pyshotter() as sct:  # One sct for all loops
+        monitor = sct.monitors[1]
+        for _ in range(loops):
+            sct.grab(monitor)
+
+
+def run_threads(*calls: tuple[Callable[..., Any], tuple]) -> None:
+    """Run each call in its own thread, re-raising the first failure."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(func, *args) for func, args in calls]
+    for future in futures:
+        future.result()
+
+
 def test_thread_safety() -> None:
     """Thread safety test for issue #150.
 
     The following code will throw a ScreenShotError exception if thread-safety is not guaranteed.
     """
-    # Let thread 1 finished ahead of thread 2
-    thread1 = threading.Thread(target=run_child_thread, args=(30,))
-    thread2 = threading.Thread(target=run_child_thread, args=(50,))
-    thread1.start()
-    thread2.start()
-    thread1.join()
-    thread2.join()
+    # Let thread 1 finished ahead of thread 2: a few instances are enough to
+    # close one while the other thread still grabs
+    run_threads((run_child_thread, (max(1, LOOPS // 2),)), (run_child_thread, (LOOPS,)))
+
+
+def test_thread_safety_shared() -> None:
+    """Thread safety test for concurrent grabs, one sct per thread.
+
+    The following code will throw a ScreenShotError exception if thread-safety is not guaranteed.
+    """
+    run_threads((run_child_thread_shared, (3 * LOOPS,)), (run_child_thread_shared, (5 * LOOPS,)))
 
 
 def run_child_thread_bbox(loops: int, bbox: tuple[int, int, int, int]) -> None:
@@ -102,9 +126,7 @@ def test_thread_safety_regions() -> None:
 
     The following code will throw a ScreenShotError exception if thread-safety is not guaranteed.
     """
-    thread1 = threading.Thread(target=run_child_thread_bbox, args=(100, (0, 0, 100, 100)))
-    thread2 = threading.Thread(target=run_child_thread_bbox, args=(100, (0, 0, 50, 1)))
-    thread1.start()
-    thread2.start()
-    thread1.join()
-    thread2.join()
+    run_threads(
+        (run_child_thread_bbox, (10 * LOOPS, (0, 0, 100, 100))),
+        (run_child_thread_bbox, (10 * LOOPS, (0, 0, 50, 1))),
+    )
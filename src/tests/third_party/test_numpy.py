@@ -13,5 +13,12 @@ def test_numpy():
     """Test that numpy can handle our images."""
     with pyshotter(display=os.getenv("DISPLAY")) as sct:
         sct_img = sct.grab(sct.monitors[0])
-        arr = numpy.array(sct_img)
-        assert arr.shape == (sct_img.height, sct_img.width, 3)
+
+    # Views over the raw BGRA buffer, through the array interface
+    arr = numpy.asarray(sct_img)
+    assert arr.shape == (sct_img.height, sct_img.width, 4)
+    assert numpy.shares_memory(arr, sct_img.bgra_array)
+
+    rgb = sct_img.rgb_array
+    assert rgb.shape == (sct_img.height, sct_img.width, 3)
+    assert numpy.shares_memory(rgb, arr)